@@ -222,6 +222,53 @@ REST_FRAMEWORK = {
 }
 
 
+# Resume Analysis
+# Size of the process pool used to extract resume text (0 = in the request/worker process)
+RESUME_ANALYSIS_POOL_SIZE = int(os.environ.get('RESUME_ANALYSIS_POOL_SIZE', '0'))
+# Scoring tasks still 'running' after this many seconds are reclaimed by the next worker
+SCORING_TASK_LEASE_SECONDS = int(os.environ.get('SCORING_TASK_LEASE_SECONDS', '600'))
+# Per-file budgets applied inside the pool
+RESUME_ANALYSIS_FILE_TIMEOUT = float(os.environ.get('RESUME_ANALYSIS_FILE_TIMEOUT', '10'))
+RESUME_ANALYSIS_FILE_MEMORY_MB = int(os.environ.get('RESUME_ANALYSIS_FILE_MEMORY_MB', '256'))
+# Text extraction stops after this many pages/characters (0 = no cap)
+RESUME_ANALYSIS_MAX_PAGES = int(os.environ.get('RESUME_ANALYSIS_MAX_PAGES', '20'))
+RESUME_ANALYSIS_MAX_CHARS = int(os.environ.get('RESUME_ANALYSIS_MAX_CHARS', '100000'))
+
+
+# Cache
+# Redis is shared by every worker process, so invalidation reaches all of them;
+# the in-process fallback is only invalidated in the process that saw the change
+if os.environ.get('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.environ.get('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'hirely',
+        }
+    }
+# Upper bound on how long job facet metadata can be served stale
+JOB_FACET_CACHE_TIMEOUT = int(os.environ.get('JOB_FACET_CACHE_TIMEOUT', '300'))
+# Upper bound on how stale the time-based 'recent' application stats can get
+APPLICATION_STATS_CACHE_TIMEOUT = int(os.environ.get('APPLICATION_STATS_CACHE_TIMEOUT', '300'))
+# Whole-response cache for anonymous job listings, per endpoint (TIMEOUT 0 disables it)
+JOB_RESPONSE_CACHE = {
+    'public': {
+        'TIMEOUT': int(os.environ.get('JOB_PUBLIC_CACHE_TIMEOUT', '60')),
+        'MAX_ENTRIES': int(os.environ.get('JOB_PUBLIC_CACHE_MAX_ENTRIES', '500')),
+    },
+    'search': {
+        'TIMEOUT': int(os.environ.get('JOB_SEARCH_CACHE_TIMEOUT', '30')),
+        'MAX_ENTRIES': int(os.environ.get('JOB_SEARCH_CACHE_MAX_ENTRIES', '200')),
+    },
+}
+
+
 # CORS Configuration
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",
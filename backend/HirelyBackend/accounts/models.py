@@ -28,4 +28,8 @@ class User(AbstractUser):
         return f"{self.username} ({self.get_user_type_display()})"
 
     class Meta:
-        db_table = 'users'
\ No newline at end of file
+        db_table = 'users'
+        indexes = [
+            # Login and application linkage look users up by email
+            models.Index(fields=['email'], name='users_email_idx'),
+        ]
\ No newline at end of file
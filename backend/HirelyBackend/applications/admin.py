@@ -1,7 +1,19 @@
 # applications/admin.py
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import Application, ApplicationStatusHistory
+from .models import Application, ApplicationStatusHistory, ResumeText, ApplicationScore, ScoringTask, JobPipelineCounters
+from .services import UPDATED, transition_status
+
+
+def status_action(new_status, label):
+    """Admin action moving the selected applications to `new_status`"""
+    def action(modeladmin, request, queryset):
+        outcomes = transition_status(queryset, new_status, changed_by=request.user)
+        updated = sum(1 for outcome in outcomes.values() if outcome == UPDATED)
+        modeladmin.message_user(request, f"{updated} application(s) marked as {label.lower()}.")
+    action.__name__ = f'mark_{new_status}'
+    action.short_description = f'Mark selected applications as {label.lower()}'
+    return action
 
 
 @admin.register(Application)
@@ -31,9 +43,11 @@ class ApplicationAdmin(admin.ModelAdmin):
     readonly_fields = [
         'applied_at',
         'updated_at',
-        'is_recent'
+        'is_recent',
+        'resume_hash'
     ]
     ordering = ['-applied_at']
+    actions = [status_action(value, label) for value, label in Application.STATUS_CHOICES]
     
     fieldsets = (
         ('Job Information', {
@@ -43,7 +57,7 @@ class ApplicationAdmin(admin.ModelAdmin):
             'fields': ('full_name', 'email', 'phone', 'applicant')
         }),
         ('Documents', {
-            'fields': ('resume', 'cover_letter')
+            'fields': ('resume', 'resume_hash', 'cover_letter')
         }),
         ('Professional Links', {
             'fields': ('portfolio_url', 'linkedin_url')
@@ -107,3 +121,108 @@ class ApplicationStatusHistoryAdmin(admin.ModelAdmin):
             'application__job', 
             'changed_by'
         )
+
+
+@admin.register(ResumeText)
+class ResumeTextAdmin(admin.ModelAdmin):
+    list_display = [
+        'content_hash',
+        'text_length',
+        'truncated',
+        'extracted_at'
+    ]
+    list_filter = ['truncated']
+    search_fields = ['content_hash']
+    readonly_fields = [
+        'content_hash',
+        'text',
+        'truncated',
+        'extracted_at'
+    ]
+    ordering = ['-extracted_at']
+    
+    def text_length(self, obj):
+        return len(obj.text)
+    text_length.short_description = 'Characters'
+
+
+@admin.register(ApplicationScore)
+class ApplicationScoreAdmin(admin.ModelAdmin):
+    list_display = [
+        'application',
+        'score',
+        'scorer_version',
+        'scored_at'
+    ]
+    list_filter = ['scorer_version']
+    search_fields = [
+        'application__full_name',
+        'application__email',
+        'application__job__title'
+    ]
+    readonly_fields = [
+        'application',
+        'score',
+        'parsed',
+        'scorer_version',
+        'job_hash',
+        'scored_at'
+    ]
+    ordering = ['-scored_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('application__job')
+
+
+@admin.register(ScoringTask)
+class ScoringTaskAdmin(admin.ModelAdmin):
+    list_display = [
+        'application',
+        'status',
+        'attempts',
+        'created_at',
+        'updated_at'
+    ]
+    list_filter = ['status']
+    readonly_fields = [
+        'application',
+        'attempts',
+        'error',
+        'created_at',
+        'updated_at'
+    ]
+    ordering = ['-created_at']
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('application__job')
+
+
+
+@admin.register(JobPipelineCounters)
+class JobPipelineCountersAdmin(admin.ModelAdmin):
+    list_display = [
+        'job',
+        'pending',
+        'reviewing',
+        'shortlisted',
+        'interviewed',
+        'accepted',
+        'rejected',
+        'withdrawn',
+        'updated_at'
+    ]
+    search_fields = ['job__title', 'job__company']
+    readonly_fields = [
+        'job',
+        'pending',
+        'reviewing',
+        'shortlisted',
+        'interviewed',
+        'accepted',
+        'rejected',
+        'withdrawn',
+        'updated_at'
+    ]
+    
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('job')
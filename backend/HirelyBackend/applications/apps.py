@@ -7,5 +7,4 @@ class ApplicationsConfig(AppConfig):
     verbose_name = 'Job Applications'
     
     def ready(self):
-        # Import signal handlers if needed
-        pass
+        from . import signals  # noqa: F401
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+from applications.scoring import process_scoring_queue
+
+
+class Command(BaseCommand):
+    help = 'Score queued applications (runs as a local worker, no external broker needed)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='Tasks claimed per batch')
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds to sleep when the queue is empty')
+        parser.add_argument('--once', action='store_true', help='Drain the queue once and exit')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        
+        while True:
+            processed = process_scoring_queue(batch_size=batch_size)
+            if processed:
+                self.stdout.write(f"✅ Scored {processed} queued applications")
+                continue
+            
+            if options['once']:
+                self.stdout.write("📭 Scoring queue is empty")
+                return
+            time.sleep(options['interval'])
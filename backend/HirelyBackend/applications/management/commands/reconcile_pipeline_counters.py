@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+from applications.pipeline import reconcile
+
+
+class Command(BaseCommand):
+    help = 'Recount applications per job and status, repairing drifted pipeline counters'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--job', type=int, action='append', dest='job_ids',
+                            help='Only reconcile this job (repeatable)')
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it')
+
+    def handle(self, *args, **options):
+        repaired = reconcile(job_ids=options['job_ids'], dry_run=options['dry_run'])
+        
+        if not repaired:
+            self.stdout.write("✅ Pipeline counters are in sync")
+            return
+        
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(f"🔧 {verb} pipeline counters for {len(repaired)} jobs: {', '.join(map(str, repaired))}")
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-16 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ResumeText',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64, unique=True)),
+                ('text', models.TextField(blank=True)),
+                ('extracted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Extracted resume text',
+                'verbose_name_plural': 'Extracted resume texts',
+            },
+        ),
+        migrations.AddField(
+            model_name='application',
+            name='resume_hash',
+            field=models.CharField(blank=True, db_index=True, max_length=64),
+        ),
+    ]
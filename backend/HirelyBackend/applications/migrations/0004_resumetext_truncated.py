@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-16 22:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_applicationscore_scoringtask'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='resumetext',
+            name='truncated',
+            field=models.BooleanField(default=False),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:20
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_resumetext_truncated'),
+        ('jobs', '0007_job_related_refreshed_at_relatedjob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['email'], name='application_email_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+STATUSES = ('pending', 'reviewing', 'shortlisted', 'interviewed', 'accepted', 'rejected', 'withdrawn')
+
+
+def seed_counters(apps, schema_editor):
+    Application = apps.get_model('applications', 'Application')
+    JobPipelineCounters = apps.get_model('applications', 'JobPipelineCounters')
+    counts = {}
+    rows = Application.objects.order_by().values_list('job_id', 'status').annotate(count=Count('id'))
+    for job_id, status, count in rows:
+        if status in STATUSES:
+            counts.setdefault(job_id, {})[status] = count
+    JobPipelineCounters.objects.bulk_create(
+        [JobPipelineCounters(job_id=job_id, **by_status) for job_id, by_status in counts.items()],
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_application_email_idx'),
+        ('jobs', '0007_job_related_refreshed_at_relatedjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobPipelineCounters',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='pipeline_counters', serialize=False, to='jobs.job')),
+                ('pending', models.IntegerField(default=0)),
+                ('reviewing', models.IntegerField(default=0)),
+                ('shortlisted', models.IntegerField(default=0)),
+                ('interviewed', models.IntegerField(default=0)),
+                ('accepted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('withdrawn', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Job pipeline counters',
+                'verbose_name_plural': 'Job pipeline counters',
+            },
+        ),
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:25
+
+from django.conf import settings
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+
+
+def link_applicants(apps, schema_editor):
+    """Link unclaimed applications to the single user registered with their email"""
+    Application = apps.get_model('applications', 'Application')
+    User = apps.get_model(settings.AUTH_USER_MODEL)
+    unique_emails = (
+        User.objects.exclude(email='').order_by().values('email')
+        .annotate(users=Count('id')).filter(users=1).values('email')
+    )
+    Application.objects.filter(applicant__isnull=True, email__in=unique_emails).update(
+        applicant=Subquery(User.objects.filter(email=OuterRef('email')).values('id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_jobpipelinecounters'),
+        ('accounts', '0002_users_email_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(link_applicants, migrations.RunPython.noop),
+    ]
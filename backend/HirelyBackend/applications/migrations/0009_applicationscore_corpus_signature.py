@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0008_application_hot_path_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationscore',
+            name='corpus_signature',
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
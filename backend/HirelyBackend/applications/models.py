@@ -28,9 +28,9 @@ class Application(models.Model):
         ('withdrawn', 'Withdrawn'),
     ]
 
-    # Relations
-    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications')
-    applicant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='applications', null=True, blank=True)
+    # Relations (indexed by the composite indexes in Meta, which lead with them)
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='applications', db_index=False)
+    applicant = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='applications', null=True, blank=True, db_index=False)
     
     # Personal Information
     full_name = models.CharField(max_length=255)
@@ -39,6 +39,7 @@ class Application(models.Model):
     
     # Documents
     resume = models.FileField(upload_to='applications/resumes/', null=True, blank=True)
+    resume_hash = models.CharField(max_length=64, blank=True, db_index=True)  # SHA-256 of the resume bytes
     cover_letter = models.TextField(blank=True, null=True)
     
     # Professional Links
@@ -74,10 +75,31 @@ class Application(models.Model):
     class Meta:
         ordering = ['-applied_at']
         unique_together = ['job', 'email']  # Prevent duplicate applications from same email
+        indexes = [
+            # Linking applications made with an email to the account that owns it
+            models.Index(fields=['email'], name='application_email_idx'),
+            # Per-job status filters and the pipeline recount
+            models.Index(fields=['job', 'status'], name='application_job_status_idx'),
+            # Per-job and per-employer lists, newest first, without a sort step
+            models.Index(fields=['job', '-applied_at'], name='application_job_applied_idx'),
+            # "My applications", newest first
+            models.Index(fields=['applicant', '-applied_at'], name='application_applicant_idx'),
+            # Recent applications (applied_at >= now - 7 days)
+            models.Index(fields=['-applied_at'], name='application_applied_idx'),
+        ]
         
     def __str__(self):
         return f"{self.full_name} - {self.job.title} ({self.status})"
     
+    def save(self, *args, **kwargs):
+        # Re-hash the resume whenever a new file is attached so cached text is never reused for it
+        if self.resume and not self.resume._committed:
+            from .resume_cache import hash_file
+            self.resume_hash = hash_file(self.resume)
+        elif not self.resume:
+            self.resume_hash = ''
+        super().save(*args, **kwargs)
+    
     @property
     def is_recent(self):
         """Check if application was submitted in the last 7 days"""
@@ -116,3 +138,106 @@ class ApplicationStatusHistory(models.Model):
         
     def __str__(self):
         return f"{self.application.full_name}: {self.old_status} → {self.new_status}"
+
+
+class ResumeText(models.Model):
+    """Text extracted from a resume file, keyed by the SHA-256 of the file bytes"""
+    content_hash = models.CharField(max_length=64, unique=True)
+    text = models.TextField(blank=True)
+    truncated = models.BooleanField(default=False)  # Cut at the page/character cap
+    extracted_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        verbose_name = "Extracted resume text"
+        verbose_name_plural = "Extracted resume texts"
+        
+    def __str__(self):
+        return f"{self.content_hash[:12]} ({len(self.text)} chars)"
+
+
+class ApplicationScore(models.Model):
+    """Precomputed resume score for an application"""
+    application = models.OneToOneField(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='resume_score'
+    )
+    score = models.FloatField(default=0.0)
+    parsed = models.JSONField(default=dict, blank=True)  # Parsed entities, method and status
+    scorer_version = models.CharField(max_length=20)
+    job_hash = models.CharField(max_length=64)  # SHA-256 of the job text the score was computed against
+    corpus_signature = models.CharField(max_length=64, blank=True)  # Resume set the TF-IDF model was fitted on
+    scored_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['-score']
+        
+    def __str__(self):
+        return f"{self.application.full_name}: {self.score}"
+
+
+class ScoringTask(models.Model):
+    """Queued request to score an application, processed by `manage.py process_scoring_queue`"""
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+    
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.CASCADE,
+        related_name='scoring_tasks'
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+        
+    def __str__(self):
+        return f"Score application {self.application_id} ({self.status})"
+
+
+class JobPipelineCounters(models.Model):
+    """
+    Per-job application counts by status, kept up to date incrementally
+    (see applications/pipeline.py) so dashboards never group the Application
+    table. `manage.py reconcile_pipeline_counters` repairs any drift.
+    """
+    job = models.OneToOneField(
+        Job,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='pipeline_counters'
+    )
+    pending = models.IntegerField(default=0)
+    reviewing = models.IntegerField(default=0)
+    shortlisted = models.IntegerField(default=0)
+    interviewed = models.IntegerField(default=0)
+    accepted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    withdrawn = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        verbose_name = "Job pipeline counters"
+        verbose_name_plural = "Job pipeline counters"
+        
+    def __str__(self):
+        return f"Pipeline for job {self.job_id}"
+    
+    @property
+    def counts(self):
+        return {value: getattr(self, value) for value, _ in Application.STATUS_CHOICES}
+    
+    @property
+    def total(self):
+        return sum(self.counts.values())
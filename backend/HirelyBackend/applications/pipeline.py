@@ -0,0 +1,131 @@
+# applications/pipeline.py
+"""
+Incremental maintenance of JobPipelineCounters.
+
+Every change is applied as a single UPDATE of F() expressions, so concurrent
+writers never lose increments. Each write also moves updated_at, which job
+list validators (jobs/conditional.py) read as the job's last application
+change. A job's row is created (from a fresh count)
+the first time one of its applications is saved. Deletes only ever decrement
+an existing row: when a job is deleted, its counters row may already be
+gone by the time its applications' delete signals run.
+"""
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from jobs.models import Job
+from .models import Application, JobPipelineCounters
+
+STATUS_VALUES = [value for value, _ in Application.STATUS_CHOICES]
+
+
+def count_by_status(job_ids=None):
+    """{job_id: {status: count}} straight from the Application table"""
+    queryset = Application.objects.order_by()
+    if job_ids is not None:
+        queryset = queryset.filter(job_id__in=job_ids)
+    counts = defaultdict(dict)
+    for job_id, status, count in queryset.values_list('job_id', 'status').annotate(count=Count('id')):
+        counts[job_id][status] = count
+    return counts
+
+
+def _create_counters(job_id):
+    counts = count_by_status([job_id]).get(job_id, {})
+    try:
+        with transaction.atomic():
+            JobPipelineCounters.objects.create(
+                job_id=job_id, **{status: counts.get(status, 0) for status in STATUS_VALUES}
+            )
+    except IntegrityError:
+        # Created concurrently, from a count that already includes our change
+        pass
+
+
+def apply_deltas(deltas, create_missing=True):
+    """
+    Apply {job_id: {status: delta}} to the counters.
+
+    Jobs without a counters row get one, counted from the table (which
+    already holds the change), unless `create_missing` is False.
+    """
+    for job_id, changes in deltas.items():
+        changes = {status: delta for status, delta in changes.items() if delta and status in STATUS_VALUES}
+        if not changes:
+            continue
+        updated = JobPipelineCounters.objects.filter(job_id=job_id).update(
+            updated_at=timezone.now(),
+            **{status: F(status) + delta for status, delta in changes.items()}
+        )
+        if not updated and create_missing:
+            _create_counters(job_id)
+
+
+def record_created(job_id, status):
+    apply_deltas({job_id: {status: 1}})
+
+
+def record_deleted(job_id, status):
+    apply_deltas({job_id: {status: -1}}, create_missing=False)
+
+
+def record_transitions(transitions):
+    """Apply a batch of (job_id, old_status, new_status) changes"""
+    deltas = defaultdict(Counter)
+    for job_id, old_status, new_status in transitions:
+        if old_status != new_status:
+            deltas[job_id][old_status] -= 1
+            deltas[job_id][new_status] += 1
+    apply_deltas(deltas)
+
+
+def pipeline_counts(job):
+    """{status: count} for `job`; one primary-key read"""
+    counters = JobPipelineCounters.objects.filter(job=job).first()
+    if counters is None:
+        return {status: 0 for status in STATUS_VALUES}
+    return counters.counts
+
+
+def reconcile(job_ids=None, dry_run=False):
+    """
+    Recount the Application table and repair counters that drifted.
+
+    Returns the ids of the jobs whose counters were wrong or missing. The
+    recount overwrites the rows it repairs, so an increment landing between
+    the count and the write is lost until the next run.
+    """
+    actual = count_by_status(job_ids)
+    jobs = Job.objects.order_by('id')
+    if job_ids is not None:
+        jobs = jobs.filter(id__in=job_ids)
+    stored = {
+        counters.job_id: counters
+        for counters in JobPipelineCounters.objects.filter(job_id__in=jobs.values('id'))
+    }
+
+    repaired = []
+    to_create, to_update = [], []
+    for job_id in jobs.values_list('id', flat=True):
+        counts = {status: actual.get(job_id, {}).get(status, 0) for status in STATUS_VALUES}
+        counters = stored.get(job_id)
+        if counters is None:
+            # Jobs without applications need no row
+            if any(counts.values()):
+                repaired.append(job_id)
+                to_create.append(JobPipelineCounters(job_id=job_id, **counts))
+        elif counters.counts != counts:
+            repaired.append(job_id)
+            for status, count in counts.items():
+                setattr(counters, status, count)
+            counters.updated_at = timezone.now()
+            to_update.append(counters)
+
+    if not dry_run:
+        with transaction.atomic():
+            JobPipelineCounters.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+            JobPipelineCounters.objects.bulk_update(to_update, [*STATUS_VALUES, 'updated_at'], batch_size=500)
+    return repaired
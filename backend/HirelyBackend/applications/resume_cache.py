@@ -0,0 +1,106 @@
+# applications/resume_cache.py
+"""
+Persistent cache of extracted resume text.
+
+Text is stored once per unique file, keyed by the SHA-256 of the file bytes,
+so PDF parsing only runs the first time a given file is seen. Uploading a
+different file changes the hash, which naturally invalidates the old entry.
+"""
+import hashlib
+import os
+
+from django.conf import settings
+
+from jobs.utils.resume_pool import extract_texts
+from .models import Application, ResumeText
+
+
+def hash_file(file):
+    """Return the SHA-256 hex digest of a Django File/FieldFile"""
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_resume_extractions(applications):
+    """
+    Return {application_id: (text, status)} for the given applications.
+
+    Applications without a resume are left out. text is set when status is
+    'success' or 'truncated' (cut at the page/character cap), and None
+    otherwise. Failure statuses include 'file_not_found', and 'timeout' or
+    'memory_limit' when a file overran its budget in the extraction pool.
+    Cached text is fetched in a single query and only files that were never
+    seen before are parsed, in the process pool when
+    RESUME_ANALYSIS_POOL_SIZE is set. Failures are not cached, so a file is
+    retried the next time it is scored.
+    """
+    hashes = {}
+    results = {}
+    for app in applications:
+        if not app.resume:
+            continue
+        if not app.resume_hash:
+            # Rows created before hashing existed: hash once and remember it
+            try:
+                app.resume_hash = hash_file(app.resume)
+            except (OSError, ValueError):
+                results[app.id] = (None, 'file_not_found')
+                continue
+            Application.objects.filter(pk=app.pk).update(resume_hash=app.resume_hash)
+        hashes[app.id] = (app.resume_hash, app)
+
+    wanted = {content_hash for content_hash, _ in hashes.values()}
+    texts = {
+        content_hash: (text, 'truncated' if truncated else 'success')
+        for content_hash, text, truncated in ResumeText.objects.filter(
+            content_hash__in=wanted
+        ).values_list('content_hash', 'text', 'truncated')
+    }
+
+    missing = {}
+    for content_hash, app in hashes.values():
+        if content_hash in texts or content_hash in missing:
+            continue
+        try:
+            path = app.resume.path
+        except (NotImplementedError, ValueError):
+            continue
+        if os.path.exists(path):
+            missing[content_hash] = path
+
+    extracted = extract_texts(
+        missing.values(),
+        pool_size=settings.RESUME_ANALYSIS_POOL_SIZE,
+        timeout=settings.RESUME_ANALYSIS_FILE_TIMEOUT,
+        memory_mb=settings.RESUME_ANALYSIS_FILE_MEMORY_MB,
+        max_pages=settings.RESUME_ANALYSIS_MAX_PAGES,
+        max_chars=settings.RESUME_ANALYSIS_MAX_CHARS,
+    )
+    failures = {}
+    for content_hash, path in missing.items():
+        text, status = extracted[path]
+        if text is None:
+            failures[content_hash] = status
+            continue
+        ResumeText.objects.get_or_create(
+            content_hash=content_hash,
+            defaults={'text': text, 'truncated': status == 'truncated'},
+        )
+        texts[content_hash] = (text, status)
+
+    for app_id, (content_hash, _) in hashes.items():
+        if content_hash in texts:
+            results[app_id] = texts[content_hash]
+        else:
+            results[app_id] = (None, failures.get(content_hash, 'file_not_found'))
+    return results
+
+
+def get_resume_texts(applications):
+    """Return {application_id: text}, with None for files that could not be read"""
+    return {
+        app_id: text
+        for app_id, (text, _) in get_resume_extractions(applications).items()
+    }
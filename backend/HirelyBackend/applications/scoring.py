@@ -0,0 +1,407 @@
+# applications/scoring.py
+"""
+Precomputed application scoring.
+
+Applications are queued for scoring when they are submitted and scored by
+`manage.py process_scoring_queue`, so the resume dashboard only reads
+ApplicationScore rows. A score is fresh while it was produced by the current
+SCORER_VERSION against the current job text, with a model fitted on the
+job's current resume set (its corpus signature), so every fresh score of a
+job comes from the same model and they rank against each other. Error rows
+for files that could not be read for a passing reason (TRANSIENT_STATUSES)
+stay stale until the file has been tried MAX_ATTEMPTS times.
+
+When only the job text or the resume set changed, stale scores are
+recomputed from the resume vectors of a cached per-job model and the
+entities already stored on the score, so no resume is parsed again.
+"""
+import hashlib
+from datetime import timedelta
+from itertools import islice
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from jobs.utils.resume_scorer import JobScoringModel, analyze_resume_texts, calculate_enhanced_score
+from .models import Application, ApplicationScore, ScoringTask
+from .resume_cache import get_resume_extractions
+
+# Bump whenever parsing or scoring changes so stored scores are recomputed
+SCORER_VERSION = '3'
+
+MAX_ATTEMPTS = 3
+
+# Extraction failures worth retrying: the file may be readable on a later attempt
+TRANSIENT_STATUSES = ('timeout', 'memory_limit', 'file_not_found')
+
+# Job fields that make up the text applicants are scored against
+JOB_TEXT_FIELDS = ('description', 'requirements', 'skills')
+
+MODEL_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Applications rescored per query when a job's resume set changed
+RESCORE_CHUNK_SIZE = 500
+
+
+def job_text(job):
+    """Text a job's applicants are scored against"""
+    return "\n\n".join(getattr(job, field) or "" for field in JOB_TEXT_FIELDS)
+
+
+def job_text_hash(job):
+    return hashlib.sha256(job_text(job).encode('utf-8')).hexdigest()
+
+
+def _retryable(score):
+    parsed = score.parsed
+    return (
+        parsed.get('method') == 'error'
+        and parsed.get('status') in TRANSIENT_STATUSES
+        and parsed.get('attempts', 1) < MAX_ATTEMPTS
+    )
+
+
+def is_fresh(score, job_hash, signature=None):
+    """Whether a stored score can be served; pass the job's corpus_signature() to compare models too"""
+    return (
+        score is not None
+        and score.scorer_version == SCORER_VERSION
+        and score.job_hash == job_hash
+        and (signature is None or score.corpus_signature == signature)
+        and not _retryable(score)
+    )
+
+
+def get_score(application):
+    """Return the application's ApplicationScore, or None if it was never scored"""
+    try:
+        return application.resume_score
+    except ApplicationScore.DoesNotExist:
+        return None
+
+
+def enqueue_scoring(applications):
+    """Queue applications that have a resume for background scoring"""
+    tasks = [
+        ScoringTask(application=application)
+        for application in applications
+        if application.resume
+    ]
+    return ScoringTask.objects.bulk_create(tasks)
+
+
+def enqueue_stale_scores(job):
+    """
+    Queue rescoring of the job's scores that were made against other job text.
+
+    Applications that already have a pending task are skipped. Returns the
+    number of tasks created.
+    """
+    stale_ids = set(
+        ApplicationScore.objects
+        .filter(application__job=job)
+        .exclude(job_hash=job_text_hash(job))
+        .values_list('application_id', flat=True)
+    )
+    if not stale_ids:
+        return 0
+    stale_ids -= set(
+        ScoringTask.objects
+        .filter(application_id__in=stale_ids, status='pending')
+        .values_list('application_id', flat=True)
+    )
+    ScoringTask.objects.bulk_create(
+        [ScoringTask(application_id=application_id) for application_id in sorted(stale_ids)]
+    )
+    return len(stale_ids)
+
+
+def _resume_applications(job):
+    return Application.objects.filter(job=job).exclude(resume='').exclude(resume__isnull=True)
+
+
+def corpus_signature(job):
+    """
+    Hash of the job's resume set; changes whenever a resume is added, replaced or removed.
+
+    None while some resume has not been hashed yet.
+    """
+    rows = list(_resume_applications(job).order_by('id').values_list('id', 'resume_hash'))
+    if any(not resume_hash for _, resume_hash in rows):
+        # Legacy rows are hashed while extracting, so the signature is not known yet
+        return None
+    digest = hashlib.sha256(SCORER_VERSION.encode('utf-8'))
+    for application_id, resume_hash in rows:
+        digest.update(f'{application_id}:{resume_hash};'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _model_cache_key(job):
+    return f'applications:job-scoring-model:{job.pk}'
+
+
+def fit_job_model(job):
+    """
+    Fit the scoring model over every applicant resume of the job.
+
+    Returns (model, extractions, signature) where extractions is the
+    {application_id: (text, status)} map read from the text cache and
+    signature the corpus_signature() the model was fitted on. The fitted
+    model is cached against the job's resume set; on a cache hit extractions
+    is empty and texts are only read for applications that need parsing.
+    """
+    signature = corpus_signature(job)
+    cached = cache.get(_model_cache_key(job))
+    if signature and cached and cached[0] == signature:
+        return cached[1], {}, signature
+
+    extractions = get_resume_extractions(_resume_applications(job))
+    readable = {
+        application_id: text
+        for application_id, (text, _) in extractions.items()
+        if text
+    }
+    model = JobScoringModel().fit(list(readable.values()), keys=readable.keys())
+    signature = signature or corpus_signature(job)
+    if signature:
+        cache.set(_model_cache_key(job), (signature, model), MODEL_CACHE_TIMEOUT)
+    return model, extractions, signature
+
+
+def _reusable_parse(score):
+    """True when a stored score's entities can be kept and only the job side recomputed"""
+    return (
+        score is not None
+        and score.scorer_version == SCORER_VERSION
+        and score.parsed.get('method') != 'error'
+    )
+
+
+def _error_attempts(score):
+    """How many times in a row the stored score failed to read the resume"""
+    if score is None or score.scorer_version != SCORER_VERSION or score.parsed.get('method') != 'error':
+        return 0
+    return score.parsed.get('attempts', 1)
+
+
+def score_applications(job, applications, fitted=None):
+    """
+    Score the given applications of one job and persist the results.
+
+    The TF-IDF model is fitted over every applicant resume of the job and
+    its corpus signature is stored on each score, so scores made before the
+    resume set changed go stale and is_fresh() only passes scores from one
+    model; pass the result of fit_job_model() to reuse one fit across
+    several calls. Returns {application_id: ApplicationScore}.
+
+    Applications whose stored score only went stale because the job text or
+    the resume set changed keep their parsed entities and are rescored from
+    the model's resume vectors without reading their files.
+    """
+    applications = [application for application in applications if application.resume]
+    if not applications:
+        return {}
+
+    model, extractions, signature = fitted or fit_job_model(job)
+    description = job_text(job)
+
+    analyses = {}
+    to_parse = [application for application in applications if not _reusable_parse(get_score(application))]
+    if len(to_parse) < len(applications):
+        # One product against the cached resume vectors covers every reusable row
+        base_scores = model.scores_by_key(description)
+        for application in applications:
+            previous = get_score(application)
+            if not _reusable_parse(previous):
+                continue
+            if application.id not in base_scores:
+                to_parse.append(application)
+                continue
+            analyses[application.id] = {
+                "parsed": previous.parsed,
+                "score": calculate_enhanced_score(
+                    "", previous.parsed, description, base_score=base_scores[application.id]
+                ),
+            }
+
+    unseen = [application for application in to_parse if application.id not in extractions]
+    if unseen:
+        extractions = {**extractions, **get_resume_extractions(unseen)}
+
+    readable = {
+        application.id: extractions[application.id][0]
+        for application in to_parse
+        if extractions[application.id][0] is not None
+    }
+    for application_id, analysis in analyze_resume_texts(readable, description, model=model).items():
+        if extractions[application_id][1] == 'truncated':
+            analysis["parsed"]["truncated"] = True
+        analyses[application_id] = analysis
+
+    job_hash = job_text_hash(job)
+    scores = []
+    for application in applications:
+        # Unreadable files (missing, or over their extraction budget) are stored as error rows
+        analysis = analyses.get(application.id) or {
+            "parsed": {
+                "entities": {},
+                "method": "error",
+                "status": extractions[application.id][1],
+                "attempts": _error_attempts(get_score(application)) + 1,
+            },
+            "score": 0.0
+        }
+        scores.append(ApplicationScore(
+            application=application,
+            score=analysis["score"],
+            parsed=analysis["parsed"],
+            scorer_version=SCORER_VERSION,
+            job_hash=job_hash,
+            corpus_signature=signature or '',
+            scored_at=timezone.now(),
+        ))
+
+    ApplicationScore.objects.bulk_create(
+        scores,
+        update_conflicts=True,
+        unique_fields=['application'],
+        update_fields=['score', 'parsed', 'scorer_version', 'job_hash', 'corpus_signature', 'scored_at'],
+    )
+    for application, score in zip(applications, scores):
+        application.resume_score = score
+    return {score.application_id: score for score in scores}
+
+
+def claim_tasks(batch_size):
+    """
+    Mark up to batch_size tasks as running and return them.
+
+    Claims pending tasks and tasks whose lease ran out: a task still
+    'running' SCORING_TASK_LEASE_SECONDS after it was claimed belonged to a
+    worker that crashed or was killed, and is handed out again.
+    """
+    lease_expired = timezone.now() - timedelta(seconds=settings.SCORING_TASK_LEASE_SECONDS)
+    with transaction.atomic():
+        pending = ScoringTask.objects.filter(
+            Q(status='pending') | Q(status='running', updated_at__lt=lease_expired)
+        ).order_by('created_at')
+        if transaction.get_connection().features.has_select_for_update_skip_locked:
+            pending = pending.select_for_update(skip_locked=True)
+        ids = list(pending.values_list('id', flat=True)[:batch_size])
+        ScoringTask.objects.filter(id__in=ids).update(status='running', updated_at=timezone.now())
+    return list(
+        ScoringTask.objects.filter(id__in=ids).select_related('application__job', 'application__resume_score')
+    )
+
+
+def _score_isolated(job, applications, fitted):
+    """
+    score_applications() that keeps one bad application from failing the rest.
+
+    The batch is scored in one go; if that raises, each application is
+    scored on its own. Returns ({application_id: ApplicationScore},
+    {application_id: exception}).
+    """
+    try:
+        return score_applications(job, applications, fitted=fitted), {}
+    except Exception:
+        pass
+    scores, errors = {}, {}
+    for application in applications:
+        try:
+            scores.update(score_applications(job, [application], fitted=fitted))
+        except Exception as e:
+            errors[application.id] = e
+    return scores, errors
+
+
+def rescore_other_models(job, fitted, exclude=()):
+    """
+    Rescore the job's stored scores made with a model other than `fitted`.
+
+    A new or replaced resume changes the job's corpus signature, which makes
+    every other score of the job stale. They keep their parsed entities and
+    are rescored from the fitted model's resume vectors, a chunk at a time,
+    so the dashboard finds them fresh. Returns the number rescored.
+    """
+    signature = fitted[2]
+    if not signature:
+        return 0
+    stale = (
+        _resume_applications(job)
+        .filter(resume_score__isnull=False)
+        .exclude(resume_score__corpus_signature=signature)
+        .exclude(id__in=list(exclude))
+        .select_related('resume_score')
+        .iterator(chunk_size=RESCORE_CHUNK_SIZE)
+    )
+    rescored = 0
+    while True:
+        chunk = list(islice(stale, RESCORE_CHUNK_SIZE))
+        if not chunk:
+            return rescored
+        scores, _ = _score_isolated(job, chunk, fitted)
+        rescored += len(scores)
+
+
+def _record_failures(tasks, errors, now):
+    for task in tasks:
+        task.updated_at = now
+        task.attempts += 1
+        task.status = 'failed' if task.attempts >= MAX_ATTEMPTS else 'pending'
+        task.error = str(errors[task.application_id])
+    ScoringTask.objects.bulk_update(tasks, ['attempts', 'status', 'error', 'updated_at'])
+
+
+def process_scoring_queue(batch_size=50):
+    """
+    Score one batch of queued applications; returns the number of tasks handled.
+
+    Failures are isolated per application: a task whose application raises is
+    retried up to MAX_ATTEMPTS times without failing the rest of its job's
+    batch. When the batch changed a job's resume set, the job's other scores
+    are rescored against the new model in the same run.
+    """
+    tasks = claim_tasks(batch_size)
+
+    by_job = {}
+    for task in tasks:
+        by_job.setdefault(task.application.job_id, []).append(task)
+
+    for job_tasks in by_job.values():
+        job = job_tasks[0].application.job
+        now = timezone.now()
+        try:
+            fitted = fit_job_model(job)
+        except Exception as e:
+            _record_failures(job_tasks, {task.application_id: e for task in job_tasks}, now)
+            continue
+
+        scores, errors = _score_isolated(job, [task.application for task in job_tasks], fitted)
+        _record_failures([task for task in job_tasks if task.application_id in errors], errors, now)
+
+        # Files that failed to read for a passing reason go back in the queue
+        job_hash = job_text_hash(job)
+        retry = [
+            task for task in job_tasks
+            if task.application_id in scores and not is_fresh(scores[task.application_id], job_hash)
+        ]
+        for task in retry:
+            task.updated_at = now
+            task.attempts += 1
+            task.status = 'pending'
+            task.error = scores[task.application_id].parsed['status']
+        ScoringTask.objects.bulk_update(retry, ['attempts', 'status', 'error', 'updated_at'])
+
+        retry_ids = {task.id for task in retry}
+        ScoringTask.objects.filter(id__in=[
+            task.id for task in job_tasks
+            if task.id not in retry_ids and task.application_id not in errors
+        ]).update(status='done', error='', updated_at=now)
+
+        rescore_other_models(job, fitted, exclude=[task.application_id for task in job_tasks])
+
+    return len(tasks)
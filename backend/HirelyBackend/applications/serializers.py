@@ -1,7 +1,9 @@
 # applications/serializers.py
 from rest_framework import serializers
+from django.db import transaction
 from django.contrib.auth import get_user_model
-from .models import Application, ApplicationStatusHistory
+from .models import Application
+from .services import transition_status
 from jobs.models import Job
 from jobs.serializers import JobSerializer
 
@@ -164,22 +166,22 @@ class ApplicationStatusUpdateSerializer(serializers.ModelSerializer):
         
     def update(self, instance, validated_data):
         notes = validated_data.pop('notes', '')
-        old_status = instance.status
-        new_status = validated_data.get('status', old_status)
+        new_status = validated_data.pop('status', instance.status)
+        request = self.context.get('request')
         
-        # Update the application
-        instance = super().update(instance, validated_data)
-        
-        # Create status history record if status changed
-        if old_status != new_status:
-            ApplicationStatusHistory.objects.create(
-                application=instance,
-                old_status=old_status,
-                new_status=new_status,
-                changed_by=self.context.get('request').user if self.context.get('request') else None,
+        with transaction.atomic():
+            # Other fields (employer_notes) are saved normally
+            if validated_data:
+                instance = super().update(instance, validated_data)
+            
+            # Status change and its history record go through the shared transition
+            transition_status(
+                Application.objects.filter(pk=instance.pk),
+                new_status,
+                changed_by=request.user if request else None,
                 notes=notes
             )
-            
+        instance.status = new_status
         return instance
 
 
@@ -187,7 +189,10 @@ class ApplicationStatsSerializer(serializers.Serializer):
     """Serializer for application statistics"""
     total_applications = serializers.IntegerField()
     pending_applications = serializers.IntegerField()
+    reviewing_applications = serializers.IntegerField()
     shortlisted_applications = serializers.IntegerField()
+    interviewed_applications = serializers.IntegerField()
     accepted_applications = serializers.IntegerField()
     rejected_applications = serializers.IntegerField()
+    withdrawn_applications = serializers.IntegerField()
     recent_applications = serializers.IntegerField()  # Last 7 days
\ No newline at end of file
@@ -0,0 +1,107 @@
+# applications/services.py
+"""
+Application status transitions and applicant linkage.
+
+transition_status() moves any number of applications to a new status with
+one UPDATE ... WHERE id IN (...) and one bulk insert of history rows, inside
+a single transaction that also adjusts the per-job pipeline counters. The
+bulk-update endpoint, the status update serializer and the admin actions
+all go through it.
+
+link_applications() attaches applications submitted under a user's email
+(signed out, or before registering) to that user with one UPDATE on the
+indexed email column, so "my applications" is a plain applicant_id lookup.
+"""
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.utils import timezone
+
+from .models import Application, ApplicationStatusHistory
+from .pipeline import record_transitions
+from .stats import invalidate_stats, invalidate_user_stats
+
+STATUS_VALUES = [value for value, _ in Application.STATUS_CHOICES]
+
+# Per-id outcomes
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+NOT_FOUND = 'not_found'
+
+
+def transition_status(applications, new_status, ids=None, changed_by=None, notes=''):
+    """
+    Move `applications` (a queryset, already limited to what the caller may
+    modify) to `new_status`.
+
+    Pass the requested `ids` to restrict the update to them and to get a
+    NOT_FOUND outcome for those outside the queryset. Returns {id: outcome};
+    applications already in `new_status` are left untouched (UNCHANGED) and
+    get no history row. Raises ValueError for an unknown status.
+    """
+    if new_status not in STATUS_VALUES:
+        raise ValueError(f"Unknown status '{new_status}'. Choose from: {', '.join(STATUS_VALUES)}")
+    if ids is not None:
+        applications = applications.filter(id__in=ids)
+
+    with transaction.atomic():
+        # Lock the rows so concurrent transitions record the right old status
+        rows = list(applications.select_for_update(of=('self',)).order_by('id').values_list(
+            'id', 'status', 'job__employer_id', 'applicant_id', 'job_id'
+        ))
+        current = {row[0]: row[1] for row in rows}
+        changed = [row for row in rows if row[1] != new_status]
+        if changed:
+            Application.objects.filter(id__in=[row[0] for row in changed]).update(
+                status=new_status, updated_at=timezone.now()
+            )
+            ApplicationStatusHistory.objects.bulk_create([
+                ApplicationStatusHistory(
+                    application_id=row[0],
+                    old_status=row[1],
+                    new_status=new_status,
+                    changed_by=changed_by,
+                    notes=notes
+                )
+                for row in changed
+            ])
+            # .update() sends no signals: keep the per-job counters in step here
+            record_transitions((row[4], row[1], new_status) for row in changed)
+
+    # ...and drop the affected cached stats
+    invalidate_stats(row[2:4] for row in changed)
+
+    outcomes = {pk: NOT_FOUND for pk in ids or []}
+    outcomes.update({pk: UNCHANGED for pk in current})
+    outcomes.update({row[0]: UPDATED for row in changed})
+    return outcomes
+
+
+def applicant_for_email(email):
+    """The one user registered with `email`, or None (no user, or the email is ambiguous)"""
+    if not email:
+        return None
+    users = list(get_user_model().objects.filter(email=email)[:2])
+    return users[0] if len(users) == 1 else None
+
+
+def link_applications(user):
+    """Link unclaimed applications made with `user`'s email to `user`; returns how many"""
+    if applicant_for_email(user.email) != user:
+        return 0
+    linked = Application.objects.filter(applicant__isnull=True, email=user.email).update(applicant=user)
+    if linked:
+        invalidate_user_stats(user)
+    return linked
+
+
+def link_orphaned_applications():
+    """Backfill applicant on every unclaimed application whose email belongs to exactly one user"""
+    User = get_user_model()
+    unique_emails = (
+        User.objects.exclude(email='').order_by().values('email')
+        .annotate(users=Count('id')).filter(users=1).values('email')
+    )
+    return Application.objects.filter(applicant__isnull=True, email__in=unique_emails).update(
+        applicant=Subquery(User.objects.filter(email=OuterRef('email')).values('id')[:1])
+    )
@@ -0,0 +1,94 @@
+# applications/signals.py
+from django.conf import settings
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from jobs.cache import bump_applications_version
+from jobs.models import Job
+from .models import Application
+from .pipeline import record_created, record_deleted, record_transitions
+from .scoring import JOB_TEXT_FIELDS, enqueue_stale_scores
+from .services import link_applications
+from .stats import invalidate_stats
+
+
+@receiver(post_save, sender=Job)
+def rescore_on_job_text_change(sender, instance, created, update_fields=None, **kwargs):
+    """Queue rescoring when a saved job's scoring text no longer matches its stored scores"""
+    if created:
+        return
+    if update_fields is not None and not set(update_fields) & set(JOB_TEXT_FIELDS):
+        return
+    enqueue_stale_scores(instance)
+
+
+def _deleted_with_job(origin):
+    """True when a delete cascades from a job, which deleted_job_applications() handles in bulk"""
+    return isinstance(origin, Job) or getattr(origin, 'model', None) is Job
+
+
+def _employer_id(application):
+    if Application.job.is_cached(application):
+        return application.job.employer_id
+    return Job.objects.filter(pk=application.job_id).values_list('employer_id', flat=True).first()
+
+
+@receiver(pre_delete, sender=Job)
+def deleted_job_applications(sender, instance, **kwargs):
+    """Invalidate once for all of a deleted job's applications instead of once per cascaded row"""
+    applicant_ids = list(
+        Application.objects.filter(job=instance).order_by().values_list('applicant_id', flat=True).distinct()
+    )
+    if applicant_ids:
+        invalidate_stats((instance.employer_id, applicant_id) for applicant_id in applicant_ids)
+        bump_applications_version()
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_applicant_counts(sender, created=True, origin=None, **kwargs):
+    """Job listings show applicant counts; a new or removed application changes them"""
+    if created and not _deleted_with_job(origin):
+        bump_applications_version()
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def invalidate_application_stats(sender, instance, origin=None, **kwargs):
+    if not _deleted_with_job(origin):
+        invalidate_stats([(_employer_id(instance), instance.applicant_id)])
+
+
+@receiver(post_init, sender=Application)
+def remember_loaded_status(sender, instance, **kwargs):
+    # Read from __dict__ so a deferred status is not fetched
+    instance._loaded_status = instance.__dict__.get('status')
+
+
+@receiver(post_save, sender=Application)
+def update_pipeline_counters(sender, instance, created, **kwargs):
+    if created:
+        record_created(instance.job_id, instance.status)
+    elif instance._loaded_status is not None and instance._loaded_status != instance.status:
+        record_transitions([(instance.job_id, instance._loaded_status, instance.status)])
+    instance._loaded_status = instance.status
+
+
+@receiver(post_delete, sender=Application)
+def decrement_pipeline_counters(sender, instance, origin=None, **kwargs):
+    # A deleted job's counters row goes with it
+    if not _deleted_with_job(origin):
+        record_deleted(instance.job_id, instance.status)
+
+
+@receiver(post_init, sender=settings.AUTH_USER_MODEL)
+def remember_loaded_email(sender, instance, **kwargs):
+    instance._loaded_email = instance.__dict__.get('email')
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def link_applications_by_email(sender, instance, created, **kwargs):
+    """Claim applications made with this email on registration or when the email changes"""
+    if created or instance.email != instance._loaded_email:
+        link_applications(instance)
+    instance._loaded_email = instance.email
@@ -0,0 +1,108 @@
+# applications/stats.py
+"""
+Per-user application statistics.
+
+All counts come from one conditional aggregation over the user's visible
+applications (one Count(filter=...) per status), and the result is cached
+per user. Each cached entry is stamped with the versions of the scopes it
+depends on: the employer's jobs, the candidate's account, or everything for
+superusers. Changing an application resets the stamps of the
+scopes it belongs to, so only the stats that could have changed are
+recomputed.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+from django.utils import timezone
+
+from .models import Application
+
+STATUS_VALUES = [value for value, _ in Application.STATUS_CHOICES]
+
+
+def user_scopes(user):
+    if user.is_superuser:
+        return ['all']
+    if user.user_type == 'employer':
+        return [f'employer:{user.pk}']
+    if user.user_type == 'candidate':
+        return [f'applicant:{user.pk}']
+    return []
+
+
+def application_scopes(employer_id, applicant_id):
+    scopes = ['all', f'employer:{employer_id}']
+    if applicant_id:
+        scopes.append(f'applicant:{applicant_id}')
+    return scopes
+
+
+def _stamp_key(scope):
+    return f'applications:stats:stamp:{scope}'
+
+
+def _stamps(scopes):
+    keys = [_stamp_key(scope) for scope in scopes]
+    stamps = cache.get_many(keys)
+    for key in keys:
+        if key not in stamps:
+            cache.add(key, time.time_ns(), None)
+            stamps[key] = cache.get(key)
+    return [stamps[key] for key in keys]
+
+
+def invalidate_stats(rows):
+    """Drop cached stats for every scope touched by (employer_id, applicant_id) rows"""
+    scopes = set()
+    for employer_id, applicant_id in rows:
+        scopes.update(application_scopes(employer_id, applicant_id))
+    cache.delete_many([_stamp_key(scope) for scope in scopes])
+
+
+def invalidate_user_stats(user):
+    """Drop cached stats for `user`'s own scopes"""
+    cache.delete_many([_stamp_key(scope) for scope in user_scopes(user)])
+
+
+def visible_applications(user):
+    """Applications whose stats `user` may see"""
+    if user.is_superuser:
+        # Admin sees all stats
+        return Application.objects.all()
+    if user.user_type == 'employer':
+        # Employers see stats for their jobs only
+        return Application.objects.filter(job__employer=user)
+    if user.user_type == 'candidate':
+        # Candidates see stats for their own applications; ones made with their
+        # email are linked to the account up front (see services.link_applications)
+        return Application.objects.filter(applicant=user)
+    # Default: no applications
+    return Application.objects.none()
+
+
+def compute_stats(queryset):
+    aggregates = {
+        'total_applications': Count('id'),
+        'recent_applications': Count('id', filter=Q(applied_at__gte=timezone.now() - timedelta(days=7))),
+    }
+    for value in STATUS_VALUES:
+        aggregates[f'{value}_applications'] = Count('id', filter=Q(status=value))
+    return queryset.aggregate(**aggregates)
+
+
+def application_stats_for(user):
+    """Cached stats payload for `user`"""
+    scopes = user_scopes(user)
+    if not scopes:
+        return compute_stats(Application.objects.none())
+
+    stamps = _stamps(scopes)
+    key = f'applications:stats:user:{user.pk}:' + '-'.join(map(str, stamps))
+    stats = cache.get(key)
+    if stats is None:
+        stats = compute_stats(visible_applications(user))
+        cache.set(key, stats, settings.APPLICATION_STATS_CACHE_TIMEOUT)
+    return stats
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for application tests
+"""
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from applications.models import Application
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    """Store uploaded resumes in a per-test directory"""
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.fixture
+def make_application(media_root):
+    """Return a factory creating an application with an uploaded resume"""
+    def make(job, email, content, name='resume.txt'):
+        return Application.objects.create(
+            job=job,
+            full_name=email.split('@')[0],
+            email=email,
+            resume=SimpleUploadedFile(name, content),
+        )
+    return make
@@ -0,0 +1,60 @@
+"""
+Tests for the resume analysis benchmark harness
+Priority: LOW - Tooling
+"""
+import pytest
+from benchmarks import runner
+from benchmarks.corpus import build_corpus
+from jobs.utils.resume_scorer import extract_resume_text
+
+
+class TestCorpus:
+    """Test the synthetic resume corpus"""
+
+    def test_corpus_covers_every_kind(self, tmp_path):
+        """Test that txt, PDF and multi-page PDF resumes are generated and readable"""
+        files = build_corpus(str(tmp_path), 6, pages=3)
+
+        assert [resume.kind for resume in files[:3]] == ['txt', 'pdf', 'pdf_multi']
+        for resume in files:
+            text, truncated = extract_resume_text(resume.path)
+            assert 'years of experience' in text
+            assert not truncated
+
+    def test_corpus_is_deterministic(self, tmp_path):
+        """Test that the same seed produces the same resumes"""
+        first = build_corpus(str(tmp_path / 'a'), 3, seed=7)
+        second = build_corpus(str(tmp_path / 'b'), 3, seed=7)
+
+        for a, b in zip(first, second):
+            assert extract_resume_text(a.path) == extract_resume_text(b.path)
+
+
+@pytest.mark.django_db
+class TestRunner:
+    """Test stage timing and baseline comparison"""
+
+    def test_run_scale_reports_every_stage(self):
+        """Test that each stage reports percentiles and throughput"""
+        results = runner.run_scale(3, repeat=1, isolated=False)
+
+        assert set(results) == set(runner.STAGES)
+        assert results['extract']['samples'] == 3
+        assert results['parse']['resumes_per_sec'] > 0
+        assert set(results['dashboard']) == {'cold', 'warm'}
+
+    def test_compare_flags_slower_stage(self):
+        """Test that a stage beyond the tolerance is reported as a regression"""
+        baseline = {'results': {'10': {'parse': runner.summarize([0.001] * 10, 10)}}}
+        current = {'results': {'10': {'parse': runner.summarize([0.002] * 10, 10)}}}
+
+        assert runner.compare(current, baseline, tolerance=0.2)
+        assert not runner.compare(baseline, baseline, tolerance=0.2)
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles"""
+        samples = [float(i) for i in range(1, 101)]
+
+        assert runner.percentile(samples, 50) == 50.0
+        assert runner.percentile(samples, 99) == 99.0
+        assert runner.percentile([], 50) == 0.0
@@ -3,10 +3,13 @@ Tests for Job and Application Management
 Priority: HIGH - Core Business Features
 """
 import pytest
+from unittest import mock
 from django.contrib.auth import get_user_model
 from rest_framework import status
-from jobs.models import Job
-from applications.models import Application
+from jobs.facets import facet_counts
+from jobs.models import Job, Location, RelatedJob
+from jobs.recommender import refresh_related_jobs
+from applications.models import Application, ApplicationStatusHistory, JobPipelineCounters
 
 User = get_user_model()
 
@@ -181,6 +184,82 @@ class TestApplicationFlow:
         assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.django_db
+class TestApplicantLinkage:
+    """Test linking applications to accounts by email"""
+    
+    def test_registration_claims_earlier_applications(self, api_client, sample_job):
+        """Test that applications made before signing up show up in my applications"""
+        application = Application.objects.create(job=sample_job, full_name='Early Bird', email='early@test.com')
+        user = User.objects.create_user(username='early', email='early@test.com', password='testpass123')
+        api_client.force_authenticate(user=user)
+        
+        response = api_client.get('/applications/my-applications/')
+        
+        application.refresh_from_db()
+        assert application.applicant == user
+        assert [app['id'] for app in response.data['results']] == [application.id]
+    
+    def test_anonymous_apply_links_existing_account(self, api_client, candidate_user, sample_job):
+        """Test that signed-out applications are linked to the account owning the email"""
+        response = api_client.post('/applications/apply/', {
+            'job': sample_job.id,
+            'full_name': 'Test Candidate',
+            'email': candidate_user.email,
+            'phone': '+1234567890',
+        })
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Application.objects.get(job=sample_job).applicant == candidate_user
+    
+    def test_email_change_claims_applications(self, candidate_user, sample_job):
+        """Test that changing to an email with unclaimed applications links them"""
+        application = Application.objects.create(job=sample_job, full_name='Renamed', email='renamed@test.com')
+        
+        candidate_user.email = 'renamed@test.com'
+        candidate_user.save()
+        
+        application.refresh_from_db()
+        assert application.applicant == candidate_user
+    
+    def test_ambiguous_email_not_linked(self, sample_job):
+        """Test that an email shared by two accounts links to neither"""
+        User.objects.create_user(username='twin1', email='twin@test.com', password='testpass123')
+        application = Application.objects.create(job=sample_job, full_name='Twin', email='twin@test.com')
+        User.objects.create_user(username='twin2', email='twin@test.com', password='testpass123')
+        
+        application.refresh_from_db()
+        assert application.applicant is None
+    
+    def test_my_applications_is_single_applicant_lookup(self, api_client, candidate_user, sample_application, capsys):
+        """Test that my applications filters on applicant only and logs nothing"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        api_client.force_authenticate(user=candidate_user)
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/applications/my-applications/')
+        
+        assert response.data['count'] == 1
+        listing = [q['sql'] for q in queries.captured_queries if 'FROM "applications_application"' in q['sql']]
+        assert listing and all('"email" =' not in sql and ' OR ' not in sql for sql in listing)
+        assert capsys.readouterr().out == ''
+    
+    def test_fix_orphaned_applications_backfills(self, candidate_user, sample_job):
+        """Test that the backfill command links by email in bulk"""
+        from io import StringIO
+        from django.core.management import call_command
+        
+        Application.objects.create(job=sample_job, full_name='Orphan', email=candidate_user.email)
+        Application.objects.update(applicant=None)
+        out = StringIO()
+        
+        call_command('fix_orphaned_applications', stdout=out)
+        
+        assert Application.objects.get().applicant == candidate_user
+        assert 'Fixed 1 out of 1' in out.getvalue()
+
+
 @pytest.mark.django_db
 class TestApplicationStatus:
     """Test application status management"""
@@ -213,6 +292,244 @@ class TestApplicationStatus:
         assert response.status_code in [status.HTTP_403_FORBIDDEN, status.HTTP_404_NOT_FOUND, status.HTTP_405_METHOD_NOT_ALLOWED]
 
 
+@pytest.mark.django_db
+class TestBulkStatusUpdate:
+    """Test set-based application status transitions"""
+    
+    @pytest.fixture
+    def applications(self, sample_job):
+        return [
+            Application.objects.create(job=sample_job, full_name=f'Applicant {i}', email=f'applicant{i}@test.com')
+            for i in range(5)
+        ]
+    
+    def test_bulk_update_uses_constant_queries(self, authenticated_client, applications, django_assert_max_num_queries):
+        """Test that the number of queries does not grow with the selection"""
+        ids = [app.id for app in applications]
+        
+        with django_assert_max_num_queries(10):
+            response = authenticated_client.post(
+                '/applications/bulk-update/', {'application_ids': ids, 'status': 'reviewing'}, format='json'
+            )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['updated_count'] == 5
+        assert set(Application.objects.values_list('status', flat=True)) == {'reviewing'}
+        assert ApplicationStatusHistory.objects.filter(new_status='reviewing', old_status='pending').count() == 5
+    
+    def test_bulk_update_reports_outcomes(self, authenticated_client, applications, employer_user):
+        """Test that each requested id gets an outcome"""
+        other_job = Job.objects.create(employer=User.objects.create_user(
+            username='other', email='other@test.com', password='pass12345', user_type='employer'
+        ), title='Other', description='Other', company='Other', location='Remote')
+        foreign = Application.objects.create(job=other_job, full_name='Foreign', email='foreign@test.com')
+        applications[0].status = 'reviewing'
+        applications[0].save()
+        
+        response = authenticated_client.post('/applications/bulk-update/', {
+            'application_ids': [applications[0].id, applications[1].id, foreign.id, 999999],
+            'status': 'reviewing',
+            'notes': 'Batch review',
+        }, format='json')
+        
+        assert response.data['results'] == {
+            str(applications[0].id): 'unchanged',
+            str(applications[1].id): 'updated',
+            str(foreign.id): 'not_found',
+            '999999': 'not_found',
+        }
+        foreign.refresh_from_db()
+        assert foreign.status == 'pending'
+        history = ApplicationStatusHistory.objects.get()
+        assert history.application_id == applications[1].id
+        assert history.changed_by == employer_user and history.notes == 'Batch review'
+    
+    def test_unknown_status_rejected(self, authenticated_client, applications):
+        """Test that invalid statuses are refused without writing anything"""
+        response = authenticated_client.post(
+            '/applications/bulk-update/', {'application_ids': [applications[0].id], 'status': 'hired'}, format='json'
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not ApplicationStatusHistory.objects.exists()
+    
+    def test_serializer_update_records_history(self, authenticated_client, sample_application):
+        """Test that single updates share the transition and keep other fields"""
+        response = authenticated_client.patch(
+            f'/applications/{sample_application.id}/',
+            {'status': 'shortlisted', 'employer_notes': 'Strong profile', 'notes': 'Phone screen next'},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        sample_application.refresh_from_db()
+        assert sample_application.status == 'shortlisted'
+        assert sample_application.employer_notes == 'Strong profile'
+        history = sample_application.status_history.get()
+        assert (history.old_status, history.notes) == ('pending', 'Phone screen next')
+
+
+@pytest.mark.django_db
+class TestApplicationStats:
+    """Test the aggregated, cached application stats endpoint"""
+    
+    def test_employer_stats_cover_every_status(self, authenticated_client, sample_job, django_assert_num_queries):
+        """Test that every status is counted in a single query"""
+        for i, value in enumerate(['pending', 'reviewing', 'interviewed', 'interviewed', 'withdrawn']):
+            Application.objects.create(job=sample_job, full_name=f'A{i}', email=f'a{i}@test.com', status=value)
+        
+        with django_assert_num_queries(1):
+            response = authenticated_client.get('/applications/stats/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['total_applications'] == 5
+        assert response.data['recent_applications'] == 5
+        assert response.data['interviewed_applications'] == 2
+        assert response.data['withdrawn_applications'] == 1
+        assert response.data['accepted_applications'] == 0
+    
+    def test_stats_are_cached(self, authenticated_client, sample_application, django_assert_num_queries):
+        """Test that repeated requests are served from the cache"""
+        authenticated_client.get('/applications/stats/')
+        
+        with django_assert_num_queries(0):
+            response = authenticated_client.get('/applications/stats/')
+        
+        assert response.data['pending_applications'] == 1
+    
+    def test_new_application_invalidates(self, authenticated_client, sample_job, sample_application):
+        """Test that creating an application refreshes the employer's stats"""
+        authenticated_client.get('/applications/stats/')
+        Application.objects.create(job=sample_job, full_name='New', email='new@test.com')
+        
+        response = authenticated_client.get('/applications/stats/')
+        
+        assert response.data['total_applications'] == 2
+    
+    def test_job_delete_invalidates_in_bulk(self, authenticated_client, sample_job):
+        """Test that deleting a job refreshes stats without per-application job lookups or counter updates"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        for i in range(5):
+            Application.objects.create(job=sample_job, full_name=f'A{i}', email=f'a{i}@test.com')
+        authenticated_client.get('/applications/stats/')
+        
+        with CaptureQueriesContext(connection) as queries:
+            sample_job.delete()
+        
+        sql = [q['sql'] for q in queries.captured_queries]
+        assert not [q for q in sql if q.startswith('UPDATE "applications_jobpipelinecounters"')]
+        assert len([q for q in sql if q.startswith('SELECT') and 'FROM "jobs_job"' in q]) <= 1
+        assert authenticated_client.get('/applications/stats/').data['total_applications'] == 0
+    
+    def test_status_change_invalidates_both_sides(self, api_client, employer_user, candidate_user, sample_application):
+        """Test that bulk transitions refresh employer and candidate stats"""
+        for user in (candidate_user, employer_user):
+            api_client.force_authenticate(user=user)
+            api_client.get('/applications/stats/')
+        
+        api_client.post(
+            '/applications/bulk-update/', {'application_ids': [sample_application.id], 'status': 'accepted'}, format='json'
+        )
+        
+        for user in (employer_user, candidate_user):
+            api_client.force_authenticate(user=user)
+            response = api_client.get('/applications/stats/')
+            assert response.data['accepted_applications'] == 1
+            assert response.data['pending_applications'] == 0
+    
+    def test_candidate_stats_match_email(self, api_client, candidate_user, sample_job):
+        """Test that candidates also see applications made with their email while signed out"""
+        api_client.post('/applications/apply/', {
+            'job': sample_job.id,
+            'full_name': 'Guest',
+            'email': candidate_user.email,
+            'phone': '+1234567890',
+        })
+        api_client.force_authenticate(user=candidate_user)
+        
+        response = api_client.get('/applications/stats/')
+        
+        assert response.data['total_applications'] == 1
+
+
+@pytest.mark.django_db
+class TestJobPipelineCounters:
+    """Test incrementally maintained per-job status counters"""
+    
+    def counts(self, job):
+        return JobPipelineCounters.objects.get(job=job).counts
+    
+    def test_create_and_delete_adjust_counts(self, sample_job, sample_application):
+        """Test that counters follow application creation and deletion"""
+        extra = Application.objects.create(job=sample_job, full_name='Extra', email='extra@test.com')
+        assert self.counts(sample_job)['pending'] == 2
+        
+        extra.delete()
+        
+        assert self.counts(sample_job)['pending'] == 1
+    
+    def test_status_changes_move_counts(self, authenticated_client, sample_job, sample_application):
+        """Test that saves, serializer updates and bulk transitions all move counts"""
+        sample_application.status = 'reviewing'
+        sample_application.save()
+        authenticated_client.patch(f'/applications/{sample_application.id}/', {'status': 'shortlisted'}, format='json')
+        authenticated_client.post(
+            '/applications/bulk-update/', {'application_ids': [sample_application.id], 'status': 'accepted'}, format='json'
+        )
+        
+        counts = self.counts(sample_job)
+        assert counts['accepted'] == 1
+        assert sum(counts.values()) == 1
+    
+    def test_pipeline_endpoint_reads_one_row(self, authenticated_client, sample_job, sample_application):
+        """Test that the dashboard read does not group the Application table"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.get(f'/applications/job/{sample_job.id}/pipeline/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['counts']['pending'] == 1
+        assert response.data['total'] == 1
+        assert not any('"applications_application"' in q['sql'] for q in queries.captured_queries)
+    
+    def test_pipeline_endpoint_requires_owner(self, api_client, candidate_user, sample_job):
+        """Test that other users cannot read a job's pipeline"""
+        api_client.force_authenticate(user=candidate_user)
+        
+        response = api_client.get(f'/applications/job/{sample_job.id}/pipeline/')
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_job_delete_cascades(self, sample_job, sample_application):
+        """Test that deleting a job with applications removes its counters"""
+        sample_job.delete()
+        
+        assert not JobPipelineCounters.objects.exists()
+    
+    def test_reconcile_repairs_drift(self, sample_job, sample_application):
+        """Test that the reconcile command recounts drifted and missing rows"""
+        from io import StringIO
+        from django.core.management import call_command
+        
+        JobPipelineCounters.objects.filter(job=sample_job).update(pending=7, rejected=3)
+        out = StringIO()
+        call_command('reconcile_pipeline_counters', '--dry-run', stdout=out)
+        assert str(sample_job.id) in out.getvalue()
+        assert self.counts(sample_job)['pending'] == 7
+        
+        call_command('reconcile_pipeline_counters', stdout=out)
+        
+        counts = self.counts(sample_job)
+        assert counts['pending'] == 1 and counts['rejected'] == 0
+        JobPipelineCounters.objects.all().delete()
+        call_command('reconcile_pipeline_counters', stdout=out)
+        assert self.counts(sample_job)['pending'] == 1
+
+
 @pytest.mark.django_db
 class TestJobFiltering:
     """Test job filtering and search"""
@@ -236,6 +553,685 @@ class TestJobFiltering:
         assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.django_db
+class TestJobFullTextSearch:
+    """Test the indexed job search backend"""
+    
+    def titles(self, response):
+        return [job['title'] for job in response.data['results']]
+    
+    def test_sqlite_uses_fts_backend(self, db):
+        """Test that SQLite test databases get the FTS5 backend"""
+        from jobs.search import SQLiteFTSBackend, get_backend
+        
+        assert isinstance(get_backend(), SQLiteFTSBackend)
+    
+    def test_prefix_search(self, api_client, sample_job, multiple_jobs):
+        """Test that a partially typed word matches"""
+        response = api_client.get('/jobs/search/?q=pyth')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert self.titles(response) == ['Senior Python Developer']
+    
+    def test_title_match_ranks_first(self, api_client, sample_job, employer_user):
+        """Test that jobs matching in the title outrank description-only matches"""
+        Job.objects.create(
+            employer=employer_user, title='Backend Engineer', company='Other Company',
+            description='Mostly Go, some Django on the side.', location='Remote',
+            category='programming', level='mid',
+        )
+        Job.objects.create(
+            employer=employer_user, title='Django Developer', company='Third Company',
+            description='Django Django Django', location='Remote', category='programming', level='mid',
+            skills='Django',
+        )
+        
+        response = api_client.get('/jobs/public/?search=django')
+        
+        assert self.titles(response)[0] == 'Django Developer'
+        assert len(self.titles(response)) == 3
+    
+    def test_index_follows_updates_and_deletes(self, api_client, sample_job):
+        """Test that edits and deletes are reflected in search results"""
+        sample_job.title = 'Senior Rust Developer'
+        sample_job.save()
+        
+        assert self.titles(api_client.get('/jobs/search/?q=rust')) == ['Senior Rust Developer']
+        
+        Job.objects.filter(pk=sample_job.pk).delete()
+        
+        assert self.titles(api_client.get('/jobs/search/?q=rust')) == []
+    
+    def test_search_combines_with_filters(self, api_client, sample_job):
+        """Test that search respects the other filters"""
+        response = api_client.get('/jobs/public/?search=python&level=junior')
+        
+        assert self.titles(response) == []
+    
+    def test_punctuation_is_ignored(self, api_client, sample_job):
+        """Test that FTS syntax characters in the query cannot break the search"""
+        response = api_client.get('/jobs/search/?q="python" (django*')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert self.titles(response) == ['Senior Python Developer']
+
+
+@pytest.mark.django_db
+class TestJobFacets:
+    """Test filter option counts on the public job list"""
+    
+    def test_facets_count_filtered_jobs(self, api_client, sample_job, multiple_jobs):
+        """Test that counts follow the active filters"""
+        response = api_client.get('/jobs/public/?level=mid')
+        options = response.data['filter_options']
+        
+        assert {'value': 'mid', 'label': 'Mid Level', 'count': 3} in options['levels']
+        assert {'value': 'senior', 'label': 'Senior', 'count': 0} in options['levels']
+        assert options['locations'] == [{'value': 'Remote', 'count': 3}]
+        assert len(options['categories']) == len(Job.JOB_CATEGORIES)
+    
+    def test_facets_follow_search(self, api_client, sample_job, multiple_jobs):
+        """Test that counts only include jobs matching the search"""
+        response = api_client.get('/jobs/public/?search=python')
+        levels = {option['value']: option['count'] for option in response.data['filter_options']['levels']}
+        
+        assert levels['senior'] == 1
+        assert levels['mid'] == 0
+    
+    def test_facets_single_query(self, employer_user, django_assert_num_queries):
+        """Test that facet counting is one query however many locations exist"""
+        from jobs.facets import facet_counts
+        for i in range(15):
+            Job.objects.create(
+                employer=employer_user, title=f'Job {i}', description='Work', company='Co',
+                location=f'City {i}', category='design', level='junior',
+            )
+        
+        with django_assert_num_queries(1):
+            options = facet_counts(Job.objects.filter(is_active=True))
+        
+        assert len(options['locations']) == 15
+        assert sum(option['count'] for option in options['categories']) == 15
+
+
+@pytest.mark.django_db
+class TestJobFacetCache:
+    """Test that facet metadata is cached until jobs change"""
+    
+    def test_public_facets_served_from_cache(self, api_client, sample_job):
+        """Test that a repeated listing does not recount facets"""
+        with mock.patch('jobs.views.facet_counts', wraps=facet_counts) as counted:
+            api_client.get('/jobs/public/')
+            api_client.get('/jobs/public/')
+            api_client.get('/jobs/public/?level=mid')
+        
+        assert counted.call_count == 2
+    
+    def test_new_job_invalidates_facets(self, api_client, sample_job, employer_user):
+        """Test that creating a job is reflected in the next listing"""
+        api_client.get('/jobs/public/')
+        Job.objects.create(
+            employer=employer_user, title='Designer', description='Design', company='Co',
+            location='Kathmandu', category='design', level='junior',
+        )
+        
+        response = api_client.get('/jobs/addjobs/')
+        
+        assert 'Kathmandu, Nepal' in response.data['filters']['locations']
+        locations = api_client.get('/jobs/public/').data['filter_options']['locations']
+        assert {'value': 'Kathmandu, Nepal', 'count': 1} in locations
+    
+    def test_toggle_invalidates_facets(self, authenticated_client, api_client, sample_job):
+        """Test that deactivating a job removes it from cached filters"""
+        assert 'Remote' in api_client.get('/jobs/addjobs/').data['filters']['locations']
+        
+        authenticated_client.patch(f'/jobs/{sample_job.id}/toggle-status/')
+        
+        assert api_client.get('/jobs/addjobs/').data['filters']['locations'] == []
+
+    def test_new_application_keeps_facets(self, api_client, sample_job):
+        """Test that an application refreshes applicant counts without recounting facets"""
+        with mock.patch('jobs.views.facet_counts', wraps=facet_counts) as counted:
+            api_client.get('/jobs/public/')
+            Application.objects.create(job=sample_job, full_name='New Applicant', email='new@test.com')
+            response = api_client.get('/jobs/public/')
+
+        assert response.data['results'][0]['applicants_count'] == 1
+        assert counted.call_count == 1
+
+
+@pytest.mark.django_db
+class TestJobListingQueries:
+    """Test that listings do not run a query per job"""
+    
+    def make_jobs(self, employer, count):
+        for i in range(count):
+            job = Job.objects.create(
+                employer=employer, title=f'Job {i}', description='Work', company='Co',
+                location='Remote', category='programming', level='mid',
+            )
+            Application.objects.create(job=job, full_name='A', email=f'a{i}@test.com')
+    
+    def count_queries(self, client, url):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        return len(queries), response
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/', '/jobs/search/?q=job', '/jobs/addjobs/'])
+    def test_listing_query_count_is_constant(self, api_client, employer_user, url):
+        """Test that adding jobs does not add queries"""
+        self.make_jobs(employer_user, 2)
+        few, _ = self.count_queries(api_client, url)
+        self.make_jobs(employer_user, 8)
+        many, response = self.count_queries(api_client, url)
+        
+        assert many == few
+        assert all(job['applicants_count'] == 1 for job in response.data['results'])
+    
+    def test_detail_counts_applicants(self, api_client, sample_job, sample_application):
+        """Test that the job detail and its related jobs carry applicant counts"""
+        response = api_client.get(f'/jobs/{sample_job.id}/')
+        
+        assert response.data['applicants_count'] == 1
+        assert response.data['related_jobs'] == []
+
+
+@pytest.mark.django_db
+class TestJobCursorPagination:
+    """Test opt-in keyset pagination of job listings"""
+    
+    @pytest.fixture
+    def many_jobs(self, employer_user):
+        return [
+            Job.objects.create(
+                employer=employer_user, title=f'Engineer {i}', description='Python work', company='Co',
+                location='Remote', category='programming', level='mid',
+            )
+            for i in range(5)
+        ]
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/', '/jobs/search/?q=python', '/jobs/addjobs/'])
+    def test_cursor_walks_every_job_once(self, api_client, many_jobs, url):
+        """Test that following next links returns each job exactly once, newest first"""
+        separator = '&' if '?' in url else '?'
+        response = api_client.get(f'{url}{separator}pagination=cursor&page_size=2')
+        seen = []
+        while True:
+            assert 'count' not in response.data
+            seen.extend(job['id'] for job in response.data['results'])
+            if not response.data['next']:
+                break
+            response = api_client.get(response.data['next'])
+        
+        assert seen == [job.id for job in reversed(many_jobs)]
+    
+    def test_approximate_count(self, api_client, many_jobs):
+        """Test that ?count=approx adds an estimated total"""
+        response = api_client.get('/jobs/public/?pagination=cursor&count=approx')
+        
+        assert response.data['count'] == 5
+        assert response.data['count_is_exact'] is True
+    
+    def test_approximate_count_is_capped(self, many_jobs):
+        """Test that large result sets are only counted up to the cap"""
+        from jobs.pagination import approximate_count
+        
+        assert approximate_count(Job.objects.all(), cap=3) == (3, False)
+    
+    def test_page_numbers_remain_default(self, api_client, many_jobs):
+        """Test that listings without the opt-in keep page-number pagination"""
+        response = api_client.get('/jobs/public/')
+        
+        assert response.data['count'] == 5
+        assert 'filter_options' in response.data
+
+
+@pytest.mark.django_db
+class TestJobLocations:
+    """Test normalized location matching"""
+    
+    def make_job(self, employer, location):
+        return Job.objects.create(
+            employer=employer, title=f'Job in {location}', description='Work', company='Co',
+            location=location, category='programming', level='mid',
+        )
+    
+    def titles(self, response):
+        return sorted(job['title'] for job in response.data['results'])
+    
+    def test_spellings_share_a_location(self, employer_user):
+        """Test that aliases link to one canonical location"""
+        jobs = [self.make_job(employer_user, text) for text in ['NYC', 'New York', 'new york, NY']]
+        
+        assert {job.location_ref.name for job in jobs} == {'New York, NY'}
+    
+    def test_unknown_location_is_created_once(self, employer_user):
+        """Test that a new spelling becomes a location and is reused"""
+        first = self.make_job(employer_user, 'Pokhara')
+        second = self.make_job(employer_user, ' pokhara ')
+        
+        assert first.location_ref_id == second.location_ref_id
+        assert Location.objects.get(pk=first.location_ref_id).name == 'Pokhara'
+    
+    def test_filter_matches_aliases(self, api_client, employer_user):
+        """Test that filtering by one spelling finds jobs posted under another"""
+        self.make_job(employer_user, 'NYC')
+        self.make_job(employer_user, 'London')
+        
+        response = api_client.get('/jobs/public/?location=New York')
+        
+        assert self.titles(response) == ['Job in NYC']
+    
+    def test_filter_by_prefix_and_typo(self, api_client, employer_user):
+        """Test prefix and typo-tolerant location filtering"""
+        self.make_job(employer_user, 'San Francisco')
+        
+        assert self.titles(api_client.get('/jobs/search/?location=san fr')) == ['Job in San Francisco']
+        assert self.titles(api_client.get('/jobs/search/?location=san fransisco')) == ['Job in San Francisco']
+    
+    def test_filter_matches_alias_substrings(self, api_client, employer_user):
+        """Test that a query matches every location with an alias containing it"""
+        self.make_job(employer_user, 'New York, NY')
+        self.make_job(employer_user, 'Yorkshire, UK')
+        
+        response = api_client.get('/jobs/public/?location=York')
+        
+        assert self.titles(response) == ['Job in New York, NY', 'Job in Yorkshire, UK']
+    
+    def test_filter_scans_text_only_without_location_ref(self, api_client, employer_user):
+        """Test that the substring match on the location text is limited to rows without a location_ref"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        self.make_job(employer_user, 'NYC')
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/jobs/public/?location=NYC')
+        
+        assert self.titles(response) == ['Job in NYC']
+        listing = [
+            q['sql'] for q in queries.captured_queries
+            if 'FROM "jobs_job"' in q['sql'] and '"jobs_job"."location" LIKE' in q['sql']
+        ]
+        assert listing and all('"jobs_job"."location_ref_id" IS NULL' in sql for sql in listing)
+    
+    def test_filter_finds_jobs_without_location_ref(self, api_client, employer_user):
+        """Test that jobs written around Job.save still match by location text"""
+        Job.objects.bulk_create([Job(
+            employer=employer_user, title='Job in New York, NY', description='Work', company='Co',
+            location='New York, NY', category='programming', level='mid',
+        )])
+        
+        assert self.titles(api_client.get('/jobs/public/?location=New York')) == ['Job in New York, NY']
+    
+    def test_facets_skip_jobs_without_location_ref(self, api_client, employer_user):
+        """Test that a job whose location normalizes to nothing does not break the listing"""
+        self.make_job(employer_user, '—')
+        self.make_job(employer_user, 'NYC')
+        
+        response = api_client.get('/jobs/public/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['filter_options']['locations'] == [{'value': 'New York, NY', 'count': 1}]
+    
+    def test_unmatched_location_finds_nothing(self, api_client, employer_user):
+        """Test that a query no alias resolves returns no jobs"""
+        self.make_job(employer_user, 'London')
+        
+        assert self.titles(api_client.get('/jobs/public/?location=Kathmandu')) == []
+    
+    def test_facets_group_aliases(self, api_client, employer_user):
+        """Test that location facets count canonical locations"""
+        self.make_job(employer_user, 'NYC')
+        self.make_job(employer_user, 'New York City')
+        
+        locations = api_client.get('/jobs/public/').data['filter_options']['locations']
+        
+        assert locations == [{'value': 'New York, NY', 'count': 2}]
+    
+    def test_location_change_relinks(self, employer_user):
+        """Test that editing the location text updates the link"""
+        job = self.make_job(employer_user, 'NYC')
+        job.location = 'Bengaluru'
+        job.save(update_fields=['location'])
+        job.refresh_from_db()
+        
+        assert job.location_ref.name == 'Bangalore, India'
+
+
+@pytest.mark.django_db
+class TestRelatedJobs:
+    """Test precomputed content-based related jobs"""
+    
+    @pytest.fixture
+    def board(self, employer_user):
+        def make(title, description, skills='', category='programming'):
+            return Job.objects.create(
+                employer=employer_user, title=title, description=description, skills=skills,
+                company='Co', location='Remote', category=category, level='mid',
+            )
+        return {
+            'django': make('Django Developer', 'Build Python web services with Django', 'Python, Django'),
+            'flask': make('Flask Engineer', 'Python APIs using Flask and PostgreSQL', 'Python, Flask'),
+            'react': make('React Developer', 'Frontend work in React and TypeScript', 'React, TypeScript'),
+            'designer': make('Product Designer', 'Figma prototypes and user research', 'Figma', 'design'),
+        }
+    
+    def related_ids(self, job):
+        return list(RelatedJob.objects.filter(job=job).values_list('related_id', flat=True))
+    
+    def test_full_refresh_ranks_by_content(self, board):
+        """Test that the most similar jobs come first and unrelated ones are left out"""
+        refresh_related_jobs(full=True)
+        
+        related = self.related_ids(board['django'])
+        assert related[0] == board['flask'].id
+        assert board['designer'].id not in related
+    
+    def test_detail_serves_precomputed_jobs(self, api_client, board):
+        """Test that the detail view returns the stored neighbours"""
+        refresh_related_jobs(full=True)
+        
+        response = api_client.get(f"/jobs/{board['django'].id}/")
+        
+        assert response.data['related_jobs'][0]['id'] == board['flask'].id
+    
+    def test_incremental_refresh_only_touches_changes(self, board):
+        """Test that an unchanged board is not recomputed and an edit is picked up"""
+        refresh_related_jobs(full=True)
+        assert refresh_related_jobs() == 0
+        
+        board['designer'].description = 'Design Python Django admin tooling'
+        board['designer'].skills = 'Python, Django'
+        board['designer'].save()
+        refresh_related_jobs()
+        
+        assert board['designer'].id in self.related_ids(board['django'])
+        assert board['django'].id in self.related_ids(board['designer'])
+    
+    def test_deactivated_job_dropped(self, board):
+        """Test that a deactivated job disappears from other lists"""
+        refresh_related_jobs(full=True)
+        board['flask'].is_active = False
+        board['flask'].save(update_fields=['is_active', 'updated_at'])
+        
+        refresh_related_jobs()
+        
+        assert not RelatedJob.objects.filter(related=board['flask']).exists()
+        assert not RelatedJob.objects.filter(job=board['flask']).exists()
+    
+    def test_deleted_job_marks_lists_stale(self, board):
+        """Test that deleting a job queues the lists that contained it"""
+        refresh_related_jobs(full=True)
+        board['flask'].delete()
+        board['django'].refresh_from_db()
+        
+        assert board['django'].related_refreshed_at is None
+        assert refresh_related_jobs() > 0
+    
+    def test_command_runs_once(self, board):
+        """Test that the management command refreshes and exits"""
+        from django.core.management import call_command
+        
+        call_command('refresh_related_jobs', '--full')
+        
+        assert RelatedJob.objects.exists()
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    """Test ETag / Last-Modified handling on public job endpoints"""
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/', '/jobs/search/?q=python', 'detail'])
+    def test_unchanged_returns_304(self, api_client, sample_job, url):
+        """Test that revalidating an unchanged response is answered with 304"""
+        url = f'/jobs/{sample_job.id}/' if url == 'detail' else url
+        first = api_client.get(url)
+        
+        second = api_client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        
+        assert first.status_code == status.HTTP_200_OK
+        assert 'Last-Modified' in first
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/', 'detail'])
+    def test_if_modified_since_alone_returns_304(self, api_client, sample_job, settings, url):
+        """Test that revalidating with only If-Modified-Since is answered with 304"""
+        settings.JOB_RESPONSE_CACHE = {}
+        url = f'/jobs/{sample_job.id}/' if url == 'detail' else url
+        first = api_client.get(url)
+        
+        second = api_client.get(url, HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        
+        assert second.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    def test_job_delete_moves_list_last_modified(self, api_client, sample_job, employer_user, settings):
+        """Test that deleting a job invalidates a list's Last-Modified"""
+        from datetime import timedelta
+        from django.core.cache import cache
+        from django.utils import timezone
+        from jobs.cache import CHANGED_KEY
+        
+        settings.JOB_RESPONSE_CACHE = {}
+        other = Job.objects.create(
+            employer=employer_user, title='Old Role', description='Work', company='Co',
+            location='Remote', category='programming', level='mid',
+        )
+        yesterday = timezone.now() - timedelta(days=1)
+        Job.objects.filter(pk__in=[sample_job.pk, other.pk]).update(updated_at=yesterday)
+        cache.set(CHANGED_KEY, yesterday, None)
+        last_modified = api_client.get('/jobs/public/')['Last-Modified']
+        
+        other.delete()
+        response = api_client.get('/jobs/public/', HTTP_IF_MODIFIED_SINCE=last_modified)
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_304_skips_page_query(self, api_client, sample_job, sample_application, settings,
+                                  django_assert_num_queries):
+        """Test that a not-modified list costs a single query, without joining applications"""
+        settings.JOB_RESPONSE_CACHE = {}
+        etag = api_client.get('/jobs/public/')['ETag']
+        
+        with django_assert_num_queries(1) as captured:
+            response = api_client.get('/jobs/public/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert 'applications_application' not in captured.captured_queries[0]['sql']
+    
+    def test_detail_304_does_not_join_applications(self, api_client, sample_job, sample_application,
+                                                   django_assert_num_queries):
+        """Test that detail validators count applications in a subquery instead of a join"""
+        etag = api_client.get(f'/jobs/{sample_job.id}/')['ETag']
+        
+        with django_assert_num_queries(1) as captured:
+            response = api_client.get(f'/jobs/{sample_job.id}/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert 'JOIN "applications_application"' not in captured.captured_queries[0]['sql']
+    
+    def test_new_application_changes_detail_etag(self, api_client, sample_job):
+        """Test that a job's applicant count cannot be served stale on its detail"""
+        etag = api_client.get(f'/jobs/{sample_job.id}/')['ETag']
+        Application.objects.create(job=sample_job, full_name='New', email='new@test.com')
+        
+        response = api_client.get(f'/jobs/{sample_job.id}/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_job_edit_changes_etag(self, api_client, sample_job):
+        """Test that editing a job invalidates list and detail validators"""
+        list_etag = api_client.get('/jobs/public/')['ETag']
+        detail_etag = api_client.get(f'/jobs/{sample_job.id}/')['ETag']
+        sample_job.title = 'Staff Python Developer'
+        sample_job.save()
+        
+        assert api_client.get('/jobs/public/', HTTP_IF_NONE_MATCH=list_etag).status_code == status.HTTP_200_OK
+        response = api_client.get(f'/jobs/{sample_job.id}/', HTTP_IF_NONE_MATCH=detail_etag)
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_new_application_changes_etag(self, api_client, sample_job):
+        """Test that applicant counts cannot be served stale"""
+        etag = api_client.get('/jobs/public/')['ETag']
+        Application.objects.create(job=sample_job, full_name='New', email='new@test.com')
+        
+        response = api_client.get('/jobs/public/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['applicants_count'] == 1
+    
+    def test_application_write_in_another_process_changes_etag(self, api_client, sample_job, settings):
+        """Test that list validators do not depend on this process seeing the write"""
+        settings.JOB_RESPONSE_CACHE = {}
+        application = Application.objects.create(job=sample_job, full_name='First', email='first@test.com')
+        etag = api_client.get('/jobs/public/')['ETag']
+        
+        # Another worker's write: nothing is bumped in this process's cache
+        with mock.patch('applications.signals.bump_applications_version'):
+            application.delete()
+        response = api_client.get('/jobs/public/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['applicants_count'] == 0
+    
+    def test_missing_job_still_404(self, api_client, db):
+        """Test that unknown jobs are not turned into 304s"""
+        response = api_client.get('/jobs/999999/', HTTP_IF_NONE_MATCH='"anything"')
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestJobFieldsets:
+    """Test compact and sparse job list representations"""
+    
+    def test_default_representation_unchanged(self, api_client, sample_job):
+        """Test that listings without parameters keep the full serializer"""
+        response = api_client.get('/jobs/public/')
+        
+        assert 'description' in response.data['results'][0]
+        assert 'requirements' in response.data['results'][0]
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/?view=compact', '/jobs/search/?q=python&view=compact'])
+    def test_compact_view_omits_long_text(self, api_client, sample_job, url):
+        """Test that the compact view returns card fields only"""
+        response = api_client.get(url)
+        
+        job = response.data['results'][0]
+        assert job['title'] == sample_job.title
+        assert job['employer_name'] == sample_job.employer.username
+        assert 'description' not in job and 'responsibilities' not in job
+    
+    def test_sparse_fields(self, api_client, sample_job):
+        """Test that ?fields= returns exactly the requested fields"""
+        response = api_client.get('/jobs/public/?fields=id,title,date')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.data['results'][0]) == {'id', 'title', 'date'}
+    
+    def test_unknown_field_rejected(self, api_client, sample_job):
+        """Test that unknown field names are a 400, not silently dropped"""
+        response = api_client.get('/jobs/public/?fields=title,password')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'password' in str(response.data['fields'])
+    
+    def test_long_text_columns_not_loaded(self, api_client, multiple_jobs):
+        """Test that narrowed listings neither select nor lazily load deferred columns"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get('/jobs/public/?view=compact&pagination=cursor')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 3
+        page_queries = [q['sql'] for q in queries.captured_queries if '"jobs_job"."title"' in q['sql']]
+        assert len(page_queries) == 1
+        assert '"jobs_job"."description"' not in page_queries[0]
+        assert '"jobs_job"."requirements"' not in page_queries[0]
+
+
+@pytest.mark.django_db
+class TestJobResponseCache:
+    """Test the versioned response cache on anonymous job listings"""
+    
+    @pytest.mark.parametrize('url', ['/jobs/public/?category=engineering', '/jobs/search/?q=python'])
+    def test_hit_runs_no_queries(self, api_client, sample_job, url, django_assert_num_queries):
+        """Test that a repeated anonymous request is served without the database"""
+        first = api_client.get(url)
+        
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+        
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+        assert second['ETag'] == first['ETag']
+    
+    def test_equivalent_params_share_entry(self, api_client, sample_job, django_assert_num_queries):
+        """Test that parameter order and blank values do not split the cache"""
+        api_client.get('/jobs/public/?level=mid&category=engineering&location=')
+        
+        with django_assert_num_queries(0):
+            response = api_client.get('/jobs/public/?category=engineering&level=mid')
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_hit_answers_revalidation(self, api_client, sample_job, django_assert_num_queries):
+        """Test that conditional requests are answered from the cached validators"""
+        etag = api_client.get('/jobs/public/')['ETag']
+        
+        with django_assert_num_queries(0):
+            response = api_client.get('/jobs/public/', HTTP_IF_NONE_MATCH=etag)
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    def test_job_write_invalidates(self, api_client, sample_job):
+        """Test that saving a job makes cached pages unreachable"""
+        api_client.get('/jobs/public/')
+        sample_job.title = 'Principal Python Developer'
+        sample_job.save()
+        
+        response = api_client.get('/jobs/public/')
+        
+        assert response.data['results'][0]['title'] == 'Principal Python Developer'
+    
+    def test_authenticated_requests_bypass_cache(self, authenticated_client, sample_job):
+        """Test that signed-in users always get a freshly computed response"""
+        authenticated_client.get('/jobs/public/')
+        Job.objects.filter(pk=sample_job.pk).update(title='Updated Quietly')
+        
+        response = authenticated_client.get('/jobs/public/')
+        
+        assert response.data['results'][0]['title'] == 'Updated Quietly'
+    
+    def test_max_entries_evicts_oldest(self, api_client, sample_job, settings, django_assert_num_queries):
+        """Test that each endpoint keeps at most MAX_ENTRIES responses"""
+        settings.JOB_RESPONSE_CACHE = {'public': {'TIMEOUT': 60, 'MAX_ENTRIES': 2}}
+        for tag in ('a', 'b', 'c'):
+            api_client.get(f'/jobs/public/?tag={tag}')
+        Job.objects.filter(pk=sample_job.pk).update(title='Updated Quietly')
+        
+        with django_assert_num_queries(0):
+            newest = api_client.get('/jobs/public/?tag=c')
+        oldest = api_client.get('/jobs/public/?tag=a')
+        
+        assert newest.data['results'][0]['title'] == sample_job.title
+        assert oldest.data['results'][0]['title'] == 'Updated Quietly'
+    
+    def test_disabled_endpoint(self, api_client, sample_job, settings):
+        """Test that a zero TIMEOUT turns the cache off for that endpoint"""
+        settings.JOB_RESPONSE_CACHE = {'public': {'TIMEOUT': 0, 'MAX_ENTRIES': 10}}
+        api_client.get('/jobs/public/')
+        Job.objects.filter(pk=sample_job.pk).update(title='Updated Quietly')
+        
+        response = api_client.get('/jobs/public/')
+        
+        assert response.data['results'][0]['title'] == 'Updated Quietly'
+
+
 @pytest.mark.django_db
 class TestJobModel:
     """Test Job model functionality"""
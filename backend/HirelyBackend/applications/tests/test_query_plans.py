@@ -0,0 +1,67 @@
+"""
+Query-plan regression checks for Application hot paths
+Priority: MEDIUM - Performance
+"""
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from applications.models import Application
+from applications.pipeline import count_by_status
+from benchmarks.query_plans import seed_applications, sequential_scans
+
+
+@pytest.fixture
+def seeded(db):
+    return seed_applications(employers=5, jobs_per_employer=4, applications_per_job=50)
+
+
+def assert_no_sequential_scans(run):
+    offending = sequential_scans(run)
+    assert not offending, '\n\n'.join(f"{sql}\n  " + '\n  '.join(plan) for sql, plan in offending)
+
+
+@pytest.mark.django_db
+class TestApplicationQueryPlans:
+    """Test that list, stats and dashboard queries are served by indexes"""
+
+    @pytest.mark.parametrize('who, path', [
+        ('employer', '/applications/'),
+        ('employer', '/applications/?status=pending'),
+        ('employer', '/applications/job/{job}/'),
+        ('employer', '/applications/job/{job}/pipeline/'),
+        ('employer', '/applications/stats/'),
+        ('employer', '/applications/resume-dashboard/{job}/'),
+        ('candidate', '/applications/my-applications/'),
+        ('candidate', '/applications/stats/'),
+    ])
+    def test_endpoint_uses_indexes(self, seeded, who, path):
+        """Test that no statement behind a hot endpoint scans the applications table"""
+        client = APIClient()
+        client.force_authenticate(user=seeded[who])
+        url = path.format(job=seeded['job'].id)
+
+        def run():
+            response = client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+
+        assert_no_sequential_scans(run)
+
+    def test_recent_and_pipeline_querysets_use_indexes(self, seeded):
+        """Test that the 7-day window and the per-job status recount are index lookups"""
+        since = timezone.now() - timedelta(days=7)
+
+        assert_no_sequential_scans(lambda: list(Application.objects.filter(applied_at__gte=since)[:20]))
+        assert_no_sequential_scans(lambda: count_by_status([seeded['job'].id]))
+
+    def test_checker_flags_sequential_scans(self, seeded):
+        """Test that an unindexed filter is reported with its plan"""
+        offending = sequential_scans(lambda: list(Application.objects.filter(full_name__icontains='applicant 1')))
+
+        assert len(offending) == 1
+        sql, plan = offending[0]
+        assert 'FROM "applications_application"' in sql
+        assert plan
@@ -0,0 +1,153 @@
+"""
+Tests for the extracted resume text cache
+Priority: HIGH - Resume dashboard performance
+"""
+import multiprocessing
+import os
+import time
+import pytest
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from applications.models import ResumeText
+from applications.resume_cache import get_resume_extractions, get_resume_texts
+from jobs.utils import resume_pool
+
+
+@pytest.mark.django_db
+class TestResumeTextCache:
+    """Test that resume files are parsed once per unique content"""
+
+    def test_resume_hash_set_on_upload(self, make_application, sample_job):
+        """Test that uploading a resume stores its content hash"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+
+        assert len(app.resume_hash) == 64
+
+    def test_text_extracted_once(self, make_application, sample_job):
+        """Test that a second lookup is served from the cache"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+
+        with mock.patch('jobs.utils.resume_pool.extract_resume_text', return_value=('Python Django developer', False)) as extract:
+            first = get_resume_texts([app])
+            second = get_resume_texts([app])
+
+        assert extract.call_count == 1
+        assert first == second == {app.id: 'Python Django developer'}
+        assert ResumeText.objects.filter(content_hash=app.resume_hash).exists()
+
+    def test_identical_files_share_entry(self, make_application, sample_job):
+        """Test that two uploads with the same bytes are parsed once"""
+        app1 = make_application(sample_job, 'a@test.com', b'Same resume body')
+        app2 = make_application(sample_job, 'b@test.com', b'Same resume body')
+
+        with mock.patch('jobs.utils.resume_pool.extract_resume_text', return_value=('Same resume body', False)) as extract:
+            texts = get_resume_texts([app1, app2])
+
+        assert extract.call_count == 1
+        assert texts[app1.id] == texts[app2.id]
+
+    def test_new_file_invalidates_cache(self, make_application, sample_job):
+        """Test that replacing the resume changes the cache key"""
+        app = make_application(sample_job, 'a@test.com', b'Old resume')
+        old_hash = app.resume_hash
+
+        app.resume = SimpleUploadedFile('resume.txt', b'New resume')
+        app.save()
+
+        assert app.resume_hash != old_hash
+        assert get_resume_texts([app]) == {app.id: 'New resume'}
+
+    def test_truncated_text_is_cached_as_truncated(self, make_application, settings, sample_job):
+        """Test that text cut at the character cap is flagged in the cache"""
+        settings.RESUME_ANALYSIS_MAX_CHARS = 6
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+
+        first = get_resume_extractions([app])
+        second = get_resume_extractions([app])
+
+        assert first == second == {app.id: ('Python', 'truncated')}
+        assert ResumeText.objects.get(content_hash=app.resume_hash).truncated
+
+    def test_missing_file_returns_none(self, make_application, sample_job):
+        """Test that a resume missing from disk is reported as unreadable"""
+        app = make_application(sample_job, 'a@test.com', b'Gone soon')
+        app.resume.storage.delete(app.resume.name)
+
+        assert get_resume_texts([app]) == {app.id: None}
+
+
+def slow_extract(path, **caps):
+    time.sleep(5)
+    return 'never returned', False
+
+
+def greedy_extract(path, **caps):
+    return 'x' * (512 * 1024 * 1024), False
+
+
+def crashing_extract(path, **caps):
+    if path.endswith('bad.txt'):
+        os._exit(1)
+    time.sleep(0.1)
+    with open(path) as f:
+        return f.read(), False
+
+
+@pytest.mark.skipif('fork' not in multiprocessing.get_all_start_methods(), reason='needs fork')
+class TestExtractionPool:
+    """Test budgeted extraction in the process pool"""
+
+    def setup_method(self):
+        resume_pool._discard_executor()
+
+    def teardown_method(self):
+        resume_pool._discard_executor()
+
+    def test_pool_extracts_files(self, tmp_path):
+        """Test that files are extracted across worker processes"""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f'resume{i}.txt'
+            path.write_text(f'Resume number {i}')
+            paths.append(str(path))
+
+        results = resume_pool.extract_texts(paths, pool_size=2, timeout=10, memory_mb=256)
+
+        assert results[paths[1]] == ('Resume number 1', 'success')
+
+    def test_overrunning_file_times_out(self, tmp_path):
+        """Test that a file over its time budget comes back as an error"""
+        path = tmp_path / 'slow.txt'
+        path.write_text('slow')
+
+        with mock.patch('jobs.utils.resume_pool.extract_resume_text', slow_extract):
+            started = time.monotonic()
+            results = resume_pool.extract_texts([str(path)], pool_size=1, timeout=0.5)
+
+        assert results[str(path)] == (None, 'timeout')
+        assert time.monotonic() - started < 4
+
+    @pytest.mark.skipif(resume_pool.resource is None, reason='needs resource limits')
+    def test_file_over_memory_budget(self, tmp_path):
+        """Test that a file over its memory budget comes back as an error"""
+        path = tmp_path / 'big.txt'
+        path.write_text('big')
+
+        with mock.patch('jobs.utils.resume_pool.extract_resume_text', greedy_extract):
+            results = resume_pool.extract_texts([str(path)], pool_size=1, timeout=10, memory_mb=64)
+
+        assert results[str(path)] == (None, 'memory_limit')
+
+    def test_dead_worker_only_fails_its_file(self, tmp_path):
+        """Test that a worker dying on one file does not fail the rest of the batch"""
+        paths = []
+        for name in ['a', 'b', 'bad', 'c', 'd', 'e']:
+            path = tmp_path / f'{name}.txt'
+            path.write_text(name)
+            paths.append(str(path))
+
+        with mock.patch('jobs.utils.resume_pool.extract_resume_text', crashing_extract):
+            results = resume_pool.extract_texts(paths, pool_size=2, timeout=10)
+
+        assert results.pop(str(tmp_path / 'bad.txt')) == (None, 'memory_limit')
+        assert results == {path: (os.path.basename(path)[0], 'success') for path in results}
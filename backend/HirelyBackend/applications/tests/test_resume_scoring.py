@@ -5,15 +5,23 @@ Priority: HIGH - Core Business Logic
 import pytest
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from PyPDF2 import PdfWriter
 from jobs.utils.resume_scorer import (
     score_resume_against_job,
+    score_resumes_against_job,
+    analyze_resume_texts,
     calculate_enhanced_score,
     analyze_resume,
+    extract_resume_text,
     extract_text_from_pdf
 )
 from jobs.utils.resume_parser import parse_resume, extract_entities_fallback
+from jobs.utils import entity_backends
+from unittest import mock
+import requests
 
 
 @pytest.mark.django_db
@@ -71,6 +79,51 @@ class TestScoreCalculation:
         assert score1 == score2
 
 
+@pytest.mark.django_db
+class TestBatchScoring:
+    """Test scoring all applicants of a job with one fitted model"""
+    
+    def test_batch_matches_ranking(self):
+        """Test that the best matching resume ranks first in a batch"""
+        resumes = [
+            "Marketing specialist with social media experience",
+            "Python Django PostgreSQL REST API developer",
+            "Java Spring developer",
+        ]
+        job_desc = "Python Django PostgreSQL developer"
+        
+        scores = score_resumes_against_job(resumes, job_desc)
+        
+        assert len(scores) == 3
+        assert scores[1] == max(scores)
+        assert all(0 <= score <= 5.0 for score in scores)
+    
+    def test_batch_consistent_with_single(self):
+        """Test that a batch of one gives the same score as the pair API"""
+        resume_text = "Python developer with Django experience"
+        job_desc = "Looking for Python Django developer"
+        
+        assert score_resumes_against_job([resume_text], job_desc) == [
+            score_resume_against_job(resume_text, job_desc)
+        ]
+    
+    def test_empty_inputs(self):
+        """Test that empty batches and job descriptions score zero"""
+        assert score_resumes_against_job([], "Python") == []
+        assert score_resumes_against_job(["Python"], "") == [0.0]
+        assert score_resumes_against_job(["the and of"], "Python") == [0.0]
+    
+    def test_analyze_texts_flags_empty(self):
+        """Test that empty texts are reported without breaking the batch"""
+        analyses = analyze_resume_texts(
+            {1: "Python Django developer", 2: "   "},
+            "Python Django developer"
+        )
+        
+        assert analyses[1]['score'] > 0
+        assert analyses[2]['parsed']['status'] == 'empty_file'
+
+
 @pytest.mark.django_db
 class TestEnhancedScoring:
     """Test enhanced scoring with bonuses"""
@@ -160,6 +213,38 @@ class TestResumeParser:
         assert len(entities['education']) > 0
         assert any('Bachelor' in edu or 'University' in edu for edu in entities['education'])
     
+    def test_skills_match_whole_words(self):
+        """Test that skills are not found inside longer words"""
+        text = "JavaScript developer who likes to maintain things"
+        
+        entities = extract_entities_fallback(text)
+        
+        assert entities['skills'] == ['JavaScript']
+    
+    def test_skill_synonyms_map_to_canonical(self):
+        """Test that taxonomy synonyms are reported under the canonical name"""
+        text = "Built services with ReactJS, Postgres and K8s"
+        
+        entities = extract_entities_fallback(text)
+        
+        assert entities['skills'] == ['React', 'PostgreSQL', 'Kubernetes']
+    
+    def test_extract_organizations(self):
+        """Test that organization suffixes are paired with the preceding word"""
+        text = "Worked at Acme Systems and Google LLC"
+        
+        entities = extract_entities_fallback(text)
+        
+        assert entities['organization'] == ['Acme Systems', 'Google LLC']
+    
+    def test_unicode_case_variants_do_not_raise(self):
+        """Test that case variants matched under (?i) but missing from the taxonomy are skipped"""
+        text = "GİT ve awſ deneyimi, Python"
+        
+        entities = extract_entities_fallback(text)
+        
+        assert entities['skills'] == ['Python']
+    
     def test_extract_experience(self):
         """Test years of experience extraction"""
         text = "5 years of experience in software development"
@@ -176,6 +261,90 @@ class TestResumeParser:
         assert parsed['status'] in ['success', 'fallback', 'empty']
 
 
+class TestEntityBackends:
+    """Test entity-extraction backends and the remote circuit breaker"""
+    
+    def test_default_backend_is_offline(self):
+        """Test that the default backend never calls the network"""
+        with mock.patch.object(requests.Session, 'post') as post:
+            parsed = parse_resume("Python developer")
+        
+        post.assert_not_called()
+        assert parsed['method'] == 'fallback_regex'
+    
+    def test_unknown_backend_rejected(self):
+        """Test that an unknown backend name raises a clear error"""
+        with pytest.raises(ValueError):
+            parse_resume("Python developer", backend='does-not-exist')
+    
+    def test_remote_backend_success(self):
+        """Test that a successful API call is reflected in the method"""
+        session = mock.Mock()
+        session.post.return_value = mock.Mock(status_code=200)
+        backend = entity_backends.RemoteBackend(session=session, breaker=entity_backends.CircuitBreaker())
+        
+        with mock.patch.object(entity_backends, 'HUGGINGFACE_API_KEY', 'key'):
+            parsed = backend.extract("Python developer")
+        
+        assert parsed['method'] == 'fallback_with_api_connection'
+        assert 'Python' in parsed['entities']['skills']
+    
+    def test_breaker_trips_after_failures(self):
+        """Test that repeated API failures stop further calls"""
+        session = mock.Mock()
+        session.post.side_effect = requests.Timeout()
+        breaker = entity_backends.CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        backend = entity_backends.RemoteBackend(session=session, breaker=breaker)
+        
+        with mock.patch.object(entity_backends, 'HUGGINGFACE_API_KEY', 'key'):
+            for _ in range(5):
+                parsed = backend.extract("Python developer")
+        
+        assert session.post.call_count == 2
+        assert breaker.is_open
+        assert parsed['method'] == 'fallback_regex'
+    
+    def test_breaker_half_opens_after_timeout(self):
+        """Test that the breaker lets a trial call through after the reset timeout"""
+        breaker = entity_backends.CircuitBreaker(failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        
+        assert breaker.allow()
+        breaker.record_success()
+        assert not breaker.is_open
+    
+    def test_async_backend_recovers_after_reset_timeout(self):
+        """Test that the async backend resumes API calls once a tripped breaker half-opens"""
+        session = mock.Mock()
+        session.post.side_effect = requests.Timeout()
+        breaker = entity_backends.CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+        backend = entity_backends.RemoteAsyncBackend(session=session, breaker=breaker)
+        # One worker, so waiting on a no-op means the previous API call has finished
+        backend.executor = ThreadPoolExecutor(max_workers=1)
+        
+        def extract_all(count):
+            for _ in range(count):
+                parsed = backend.extract("Python developer")
+                # Wait for the background call so each extract sees the breaker's latest state
+                backend.executor.submit(lambda: None).result()
+            return parsed
+        
+        with mock.patch.object(entity_backends, 'HUGGINGFACE_API_KEY', 'key'):
+            parsed = extract_all(5)
+            assert session.post.call_count == 2
+            assert breaker.is_open
+            assert parsed['method'] == 'fallback_regex'
+            
+            session.post.side_effect = None
+            session.post.return_value = mock.Mock(status_code=200)
+            time.sleep(0.15)
+            extract_all(5)
+            backend.executor.shutdown(wait=True)
+        
+        assert session.post.call_count == 7
+        assert not breaker.is_open
+
+
 @pytest.mark.django_db
 class TestFileExtraction:
     """Test text extraction from PDF and TXT files"""
@@ -215,6 +384,59 @@ class TestFileExtraction:
         text = extract_text_from_pdf("/nonexistent/file.pdf")
         
         assert text == ""
+    
+    def test_text_file_capped_at_max_chars(self, tmp_path):
+        """Test that long text files are cut at the character cap"""
+        path = tmp_path / 'resume.txt'
+        path.write_text('x' * 500)
+        
+        text, truncated = extract_resume_text(str(path), max_chars=100)
+        
+        assert len(text) == 100
+        assert truncated
+    
+    def test_pdf_capped_at_max_pages(self, tmp_path):
+        """Test that only the first max_pages pages of a PDF are read"""
+        pdf_writer = PdfWriter()
+        for _ in range(5):
+            pdf_writer.add_blank_page(width=200, height=200)
+        path = tmp_path / 'resume.pdf'
+        with open(path, 'wb') as f:
+            pdf_writer.write(f)
+        
+        with mock.patch('PyPDF2._page.PageObject.extract_text', return_value='page ') as extract:
+            text, truncated = extract_resume_text(str(path), max_pages=2)
+        
+        assert extract.call_count == 2
+        assert text == 'page page '
+        assert truncated
+    
+    def test_pdf_stops_once_char_cap_reached(self, tmp_path):
+        """Test that later pages are not parsed once enough text is collected"""
+        pdf_writer = PdfWriter()
+        for _ in range(5):
+            pdf_writer.add_blank_page(width=200, height=200)
+        path = tmp_path / 'resume.pdf'
+        with open(path, 'wb') as f:
+            pdf_writer.write(f)
+        
+        with mock.patch('PyPDF2._page.PageObject.extract_text', return_value='0123456789') as extract:
+            text, truncated = extract_resume_text(str(path), max_pages=0, max_chars=15)
+        
+        assert extract.call_count == 2
+        assert text == '012345678901234'
+        assert truncated
+    
+    def test_binary_non_pdf_not_parsed_as_pdf(self, tmp_path):
+        """Test that undecodable files without a PDF header skip PdfReader"""
+        path = tmp_path / 'resume.doc'
+        path.write_bytes(b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1' + bytes(range(256)))
+        
+        with mock.patch('jobs.utils.resume_scorer.PdfReader') as reader:
+            text, truncated = extract_resume_text(str(path))
+        
+        assert not reader.called
+        assert (text, truncated) == ("", False)
 
 
 @pytest.mark.django_db
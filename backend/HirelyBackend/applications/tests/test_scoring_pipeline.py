@@ -0,0 +1,296 @@
+"""
+Tests for the precomputed application scoring pipeline
+Priority: HIGH - Resume dashboard performance
+"""
+import json
+import pytest
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from rest_framework import status
+from applications.models import ApplicationScore, ScoringTask
+from applications.scoring import (
+    MAX_ATTEMPTS, SCORER_VERSION, corpus_signature, job_text_hash, process_scoring_queue
+)
+
+
+@pytest.mark.django_db
+class TestScoringQueue:
+    """Test queueing and processing of scoring tasks"""
+
+    def test_apply_enqueues_scoring(self, api_client, media_root, sample_job):
+        """Test that submitting an application queues a scoring task"""
+        data = {
+            'job': sample_job.id,
+            'full_name': 'Queued Candidate',
+            'email': 'queued@test.com',
+            'resume': SimpleUploadedFile('resume.txt', b'Python Django developer'),
+        }
+
+        response = api_client.post('/applications/apply/', data, format='multipart')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert ScoringTask.objects.filter(application__email='queued@test.com', status='pending').exists()
+
+    def test_worker_persists_scores(self, make_application, sample_job):
+        """Test that processing the queue stores a fresh score"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer with PostgreSQL')
+        ScoringTask.objects.create(application=app)
+
+        processed = process_scoring_queue()
+
+        score = ApplicationScore.objects.get(application=app)
+        assert processed == 1
+        assert score.score > 0
+        assert score.scorer_version == SCORER_VERSION
+        assert score.job_hash == job_text_hash(sample_job)
+        assert 'Python' in score.parsed['entities']['skills']
+        assert ScoringTask.objects.get(application=app).status == 'done'
+
+    def test_truncation_recorded_in_parsed_data(self, make_application, settings, sample_job):
+        """Test that a resume cut at the character cap is flagged on its score"""
+        settings.RESUME_ANALYSIS_MAX_CHARS = 20
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer with PostgreSQL')
+        ScoringTask.objects.create(application=app)
+
+        process_scoring_queue()
+
+        assert ApplicationScore.objects.get(application=app).parsed['truncated'] is True
+
+    def test_expired_lease_is_reclaimed(self, make_application, settings, sample_job):
+        """Test that tasks left running by a dead worker are claimed again once their lease expires"""
+        from datetime import timedelta
+        from django.utils import timezone
+
+        settings.SCORING_TASK_LEASE_SECONDS = 60
+        stale = ScoringTask.objects.create(
+            application=make_application(sample_job, 'stale@test.com', b'Python developer'), status='running'
+        )
+        live = ScoringTask.objects.create(
+            application=make_application(sample_job, 'live@test.com', b'Python developer'), status='running'
+        )
+        ScoringTask.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(seconds=120))
+
+        processed = process_scoring_queue()
+
+        assert processed == 1
+        assert ScoringTask.objects.get(pk=stale.pk).status == 'done'
+        assert ApplicationScore.objects.filter(application=stale.application).exists()
+        assert ScoringTask.objects.get(pk=live.pk).status == 'running'
+
+    def test_failing_application_does_not_fail_its_batch(self, make_application, sample_job):
+        """Test that one application raising while scoring leaves the rest of its job's batch done"""
+        from applications import scoring
+
+        good = ScoringTask.objects.create(application=make_application(sample_job, 'good@test.com', b'Python'))
+        bad = ScoringTask.objects.create(application=make_application(sample_job, 'bad@test.com', b'Django'))
+        real_score = scoring.score_applications
+
+        def score_applications(job, applications, fitted=None):
+            if any(application.id == bad.application_id for application in applications):
+                raise ValueError('unparseable')
+            return real_score(job, applications, fitted=fitted)
+
+        with mock.patch('applications.scoring.score_applications', score_applications):
+            process_scoring_queue()
+
+        assert ScoringTask.objects.get(pk=good.pk).status == 'done'
+        bad.refresh_from_db()
+        assert (bad.status, bad.attempts, bad.error) == ('pending', 1, 'unparseable')
+        assert ApplicationScore.objects.filter(application=good.application).exists()
+
+    def test_management_command_drains_queue(self, make_application, sample_job):
+        """Test that the worker command exits once the queue is empty"""
+        app = make_application(sample_job, 'a@test.com', b'Python developer')
+        ScoringTask.objects.create(application=app)
+
+        call_command('process_scoring_queue', '--once')
+
+        assert not ScoringTask.objects.filter(status='pending').exists()
+        assert ApplicationScore.objects.filter(application=app).exists()
+
+    def test_unreadable_resume_is_retried_up_to_cap(self, make_application, sample_job):
+        """Test that a resume that could not be read is requeued until MAX_ATTEMPTS"""
+        app = make_application(sample_job, 'a@test.com', b'Python developer')
+        app.resume.storage.delete(app.resume.name)
+        task = ScoringTask.objects.create(application=app)
+
+        process_scoring_queue()
+        task.refresh_from_db()
+        assert task.status == 'pending'
+        assert task.error == 'file_not_found'
+
+        for _ in range(MAX_ATTEMPTS - 1):
+            process_scoring_queue()
+
+        parsed = ApplicationScore.objects.get(application=app).parsed
+        assert parsed['method'] == 'error'
+        assert parsed['attempts'] == MAX_ATTEMPTS
+        assert ScoringTask.objects.get(pk=task.pk).status == 'done'
+
+
+@pytest.mark.django_db
+class TestDashboardUsesStoredScores:
+    """Test that the resume dashboard reads precomputed scores"""
+
+    def test_dashboard_reads_precomputed_score(self, make_application, authenticated_client, sample_job):
+        """Test that a fresh stored score is returned as-is"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+        ApplicationScore.objects.create(
+            application=app,
+            score=4.2,
+            parsed={'entities': {}, 'method': 'precomputed', 'status': 'success'},
+            scorer_version=SCORER_VERSION,
+            job_hash=job_text_hash(sample_job),
+            corpus_signature=corpus_signature(sample_job),
+        )
+
+        response = authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['score'] == 4.2
+        assert response.data['results'][0]['parsed_data']['method'] == 'precomputed'
+
+    def test_dashboard_retries_transient_error_rows(self, make_application, authenticated_client, sample_job):
+        """Test that a file that timed out before is read again instead of served as a zero score"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+        ApplicationScore.objects.create(
+            application=app,
+            score=0.0,
+            parsed={'entities': {}, 'method': 'error', 'status': 'timeout', 'attempts': 1},
+            scorer_version=SCORER_VERSION,
+            job_hash=job_text_hash(sample_job),
+        )
+
+        response = authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/')
+
+        assert response.data['results'][0]['score'] > 0
+        assert ApplicationScore.objects.get(application=app).parsed['method'] != 'error'
+
+    def test_worker_rescores_older_models(self, make_application, authenticated_client, sample_job):
+        """Test that a new resume gets the job's other scores rescored by the worker, not the dashboard"""
+        first = make_application(sample_job, 'a@test.com', b'Python Django developer')
+        ScoringTask.objects.create(application=first)
+        process_scoring_queue()
+        before = ApplicationScore.objects.get(application=first).corpus_signature
+        second = make_application(sample_job, 'b@test.com', b'Java Spring developer')
+        ScoringTask.objects.create(application=second)
+        process_scoring_queue()
+
+        signatures = set(ApplicationScore.objects.values_list('corpus_signature', flat=True))
+        assert signatures == {corpus_signature(sample_job)} != {before}
+
+        with mock.patch('applications.views.score_applications') as score:
+            authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/')
+        assert not score.called
+
+    def test_dashboard_scores_missing_rows(self, make_application, authenticated_client, sample_job):
+        """Test that unscored applications are scored inline and stored"""
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer')
+
+        response = authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert ApplicationScore.objects.filter(application=app).exists()
+        assert response.data['results'][0]['score'] > 0
+
+
+@pytest.mark.django_db
+class TestDashboardModes:
+    """Test streaming and top-k modes of the resume dashboard"""
+
+    @pytest.fixture
+    def scored_applications(self, make_application, sample_job):
+        apps = []
+        for i, score in enumerate([1.0, 4.5, 2.5, 3.0]):
+            app = make_application(sample_job, f'c{i}@test.com', b'Python developer')
+            ApplicationScore.objects.create(
+                application=app,
+                score=score,
+                parsed={'entities': {}, 'method': 'precomputed', 'status': 'success'},
+                scorer_version=SCORER_VERSION,
+                job_hash=job_text_hash(sample_job),
+            )
+            apps.append(app)
+        ApplicationScore.objects.filter(application__in=apps).update(corpus_signature=corpus_signature(sample_job))
+        return apps
+
+    def test_stream_returns_ndjson(self, authenticated_client, sample_job, scored_applications):
+        """Test that ?stream=1 returns one JSON row per application"""
+        response = authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/?stream=1')
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert response['Content-Type'] == 'application/x-ndjson'
+        assert sorted(row['score'] for row in rows) == [1.0, 2.5, 3.0, 4.5]
+
+    def test_top_k_with_min_score(self, authenticated_client, sample_job, scored_applications):
+        """Test that ?top keeps only the best candidates above min_score"""
+        response = authenticated_client.get(
+            f'/applications/resume-dashboard/{sample_job.id}/?top=3&min_score=2&page_size=2'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['score'] for row in response.data['results']] == [4.5, 3.0]
+        assert response.data['count'] == 3
+        assert response.data['num_pages'] == 2
+        assert response.data['total_applications'] == 4
+
+    def test_top_k_second_page(self, authenticated_client, sample_job, scored_applications):
+        """Test paginating through the top candidates"""
+        response = authenticated_client.get(
+            f'/applications/resume-dashboard/{sample_job.id}/?top=3&page=2&page_size=2'
+        )
+
+        assert [row['score'] for row in response.data['results']] == [2.5]
+
+    def test_invalid_top(self, authenticated_client, sample_job):
+        """Test that a malformed top parameter is rejected"""
+        response = authenticated_client.get(f'/applications/resume-dashboard/{sample_job.id}/?top=abc')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestJobTextRescoring:
+    """Test incremental rescoring when the job text changes"""
+
+    @pytest.fixture
+    def scored_application(self, make_application, sample_job):
+        app = make_application(sample_job, 'a@test.com', b'Python Django developer with PostgreSQL')
+        ScoringTask.objects.create(application=app)
+        process_scoring_queue()
+        return app
+
+    def test_unchanged_save_does_not_enqueue(self, sample_job, scored_application):
+        """Test that saving a job without touching its text queues nothing"""
+        sample_job.title = 'Renamed Developer'
+        sample_job.save()
+
+        assert not ScoringTask.objects.filter(status='pending').exists()
+
+    def test_text_change_enqueues_stale_scores(self, sample_job, scored_application):
+        """Test that editing the job text queues one task per stale score"""
+        sample_job.requirements = 'Kubernetes and AWS experience'
+        sample_job.save()
+        sample_job.skills = 'Docker'
+        sample_job.save()
+
+        assert ScoringTask.objects.filter(application=scored_application, status='pending').count() == 1
+
+    def test_rescoring_reuses_resume_vectors(self, sample_job, scored_application):
+        """Test that rescoring after a job edit neither reads nor parses resumes"""
+        before = ApplicationScore.objects.get(application=scored_application)
+        sample_job.description = 'Looking for a Python developer with Django and PostgreSQL'
+        sample_job.save()
+
+        with mock.patch('applications.scoring.get_resume_extractions') as extract, \
+                mock.patch('applications.scoring.analyze_resume_texts', return_value={}) as parse:
+            process_scoring_queue()
+
+        after = ApplicationScore.objects.get(application=scored_application)
+        assert not extract.called
+        assert not parse.call_args.args[0]
+        assert after.job_hash == job_text_hash(sample_job) != before.job_hash
+        assert after.parsed == before.parsed
+        assert after.score != before.score
@@ -13,6 +13,7 @@ urlpatterns = [
     
     # Job-specific applications
     path('job/<int:job_id>/', views.JobApplicationsView.as_view(), name='job-applications'),
+    path('job/<int:job_id>/pipeline/', views.job_pipeline, name='job-pipeline'),
     
     # User's applications
     path('my-applications/', views.ApplicationsByUserView.as_view(), name='my-applications'),
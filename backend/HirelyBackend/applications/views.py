@@ -4,19 +4,34 @@ from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count
-from django.contrib.auth import get_user_model
-from django.utils import timezone
-from datetime import timedelta
+from django.db.models import Q
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from itertools import islice
+import heapq
+import json
+import math
 
 
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from jobs.utils.resume_scorer import analyze_resume
 from .models import Application
+from .scoring import (
+    corpus_signature,
+    enqueue_scoring,
+    fit_job_model,
+    get_score,
+    is_fresh,
+    job_text_hash,
+    score_applications
+)
 
-from .models import Application, ApplicationStatusHistory
+from .models import Application
+from .pipeline import pipeline_counts
+from .services import UPDATED, applicant_for_email, transition_status
+from .stats import application_stats_for
 from .serializers import (
     ApplicationCreateSerializer,
     ApplicationListSerializer,
@@ -35,11 +50,16 @@ class ApplicationCreateView(generics.CreateAPIView):
     parser_classes = [MultiPartParser, FormParser]  # Handle file uploads
     
     def perform_create(self, serializer):
-        # Link to authenticated user if logged in
+        # Link to authenticated user if logged in, otherwise to the account owning the email
         if self.request.user.is_authenticated:
-            serializer.save(applicant=self.request.user)
+            application = serializer.save(applicant=self.request.user)
         else:
-            serializer.save()
+            application = serializer.save(
+                applicant=applicant_for_email(serializer.validated_data.get('email'))
+            )
+        
+        # Score in the background so the resume dashboard only reads stored scores
+        enqueue_scoring([application])
 
 
 class ApplicationListView(generics.ListAPIView):
@@ -131,57 +151,40 @@ class ApplicationsByUserView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        user = self.request.user
-        print(f"🔍 DEBUG: User requesting applications: {user.username} (ID: {user.id}, Email: {user.email})")
-        
-        # Debug the query
-        query1 = Application.objects.filter(applicant=user)
-        query2 = Application.objects.filter(email=user.email)
-        query_combined = Application.objects.filter(Q(applicant=user) | Q(email=user.email))
-        
-        print(f"🔍 DEBUG: Applications by applicant: {query1.count()}")
-        print(f"🔍 DEBUG: Applications by email: {query2.count()}")
-        print(f"🔍 DEBUG: Combined query result: {query_combined.count()}")
-        
-        return query_combined.select_related('job')
+        # Applications made with the user's email are linked to them on
+        # registration/email change and at apply time (services.link_applications)
+        return Application.objects.filter(applicant=self.request.user).select_related('job')
 
 
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def application_stats(request):
     """Get application statistics for the authenticated user"""
-    user = request.user
-    
-    if user.is_superuser:
-        # Admin sees all stats
-        queryset = Application.objects.all()
-    elif user.user_type == 'employer':
-        # Employers see stats for their jobs only
-        queryset = Application.objects.filter(job__employer=user)
-    elif user.user_type == 'candidate':
-        # Candidates see stats for their own applications (by user or email)
-        queryset = Application.objects.filter(
-            Q(applicant=user) | Q(email=user.email)
-        )
-    else:
-        # Default: no applications
-        queryset = Application.objects.none()
-    
-    stats = {
-        'total_applications': queryset.count(),
-        'pending_applications': queryset.filter(status='pending').count(),
-        'shortlisted_applications': queryset.filter(status='shortlisted').count(),
-        'accepted_applications': queryset.filter(status='accepted').count(),
-        'rejected_applications': queryset.filter(status='rejected').count(),
-        'recent_applications': queryset.filter(
-            applied_at__gte=timezone.now() - timedelta(days=7)
-        ).count(),
-    }
+    stats = application_stats_for(request.user)
     
     serializer = ApplicationStatsSerializer(stats)
     return Response(serializer.data)
 
 
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def job_pipeline(request, job_id):
+    """Application counts by status for one job, read from its pipeline counters"""
+    job = get_object_or_404(Job, id=job_id)
+    if not request.user.is_superuser and job.employer_id != request.user.id:
+        return Response(
+            {'error': 'You do not have permission to view this job'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    counts = pipeline_counts(job)
+    return Response({
+        'job_id': job.id,
+        'counts': counts,
+        'total': sum(counts.values())
+    })
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAuthenticated])
 def bulk_update_applications(request):
@@ -196,36 +199,34 @@ def bulk_update_applications(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
+    try:
+        application_ids = [int(pk) for pk in application_ids]
+    except (TypeError, ValueError):
+        return Response(
+            {'error': 'application_ids must be a list of integers'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
     user = request.user
     
     # Get applications that user can modify
     if user.is_superuser:
-        applications = Application.objects.filter(id__in=application_ids)
+        applications = Application.objects.all()
     else:
-        applications = Application.objects.filter(
-            id__in=application_ids,
-            job__employer=user
-        )
+        applications = Application.objects.filter(job__employer=user)
     
-    updated_count = 0
-    for app in applications:
-        old_status = app.status
-        app.status = new_status
-        app.save()
-        
-        # Create status history
-        ApplicationStatusHistory.objects.create(
-            application=app,
-            old_status=old_status,
-            new_status=new_status,
-            changed_by=user,
-            notes=notes
+    try:
+        outcomes = transition_status(
+            applications, new_status, ids=application_ids, changed_by=user, notes=notes
         )
-        updated_count += 1
+    except ValueError as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
+    updated_count = sum(1 for outcome in outcomes.values() if outcome == UPDATED)
     return Response({
         'message': f'Updated {updated_count} applications',
-        'updated_count': updated_count
+        'updated_count': updated_count,
+        'results': {str(pk): outcome for pk, outcome in outcomes.items()}
     })
 
 
@@ -251,102 +252,145 @@ def delete_application(request, pk):
         )
 
 
-# Import timezone and timedelta for stats view
-from django.utils import timezone
-from datetime import timedelta
+def _dashboard_row(app):
+    """Serialize one application for the resume dashboard"""
+    row = {
+        "application_id": app.id,
+        "candidate": app.applicant.username if app.applicant else "N/A",
+        "candidate_name": app.full_name,
+        "email": app.email,
+        "phone": app.phone or "N/A",
+        "status": app.status,
+        "applied_date": app.applied_at.strftime("%Y-%m-%d") if app.applied_at else "N/A",
+    }
+    
+    if not app.resume:
+        # Still include applications without resumes, but with zero score
+        row["score"] = 0.0
+        row["parsed_data"] = {
+            "entities": {
+                "person": [],
+                "email": [app.email],
+                "phone": [app.phone] if app.phone else [],
+                "skills": [],
+                "education": [],
+                "experience": [],
+                "organization": []
+            },
+            "method": "no_resume",
+            "status": "Resume not uploaded"
+        }
+        return row
+    
+    score = get_score(app)
+    row["score"] = score.score
+    row["parsed_data"] = score.parsed
+    return row
 
 
+def _iter_dashboard_rows(job, chunk_size=200):
+    """
+    Yield dashboard rows for every application of the job.
+    
+    Scores are precomputed by the scoring worker; anything missing or stale
+    (not yet processed, job text edited, resume set changed, scorer
+    upgraded) is scored inline a chunk at a time, fitting the job model at
+    most once.
+    """
+    job_hash = job_text_hash(job)
+    signature = corpus_signature(job)
+    fitted = None
+    applications = Application.objects.filter(
+        job_id=job.id
+    ).select_related("applicant", "resume_score").iterator(chunk_size=chunk_size)
+    
+    while True:
+        chunk = list(islice(applications, chunk_size))
+        if not chunk:
+            return
+        
+        stale = [
+            app for app in chunk
+            if app.resume and not is_fresh(get_score(app), job_hash, signature)
+        ]
+        if stale:
+            fitted = fitted or fit_job_model(job)
+            score_applications(job, stale, fitted=fitted)
+        
+        for app in chunk:
+            yield _dashboard_row(app)
 
 
+def _positive_param(request, name, default=None, cast=int):
+    value = request.query_params.get(name)
+    if value in (None, ''):
+        return default
+    value = cast(value)
+    if value < 0:
+        raise ValueError(f"{name} must not be negative")
+    return value
 
 
 @api_view(["GET"])
 @permission_classes([IsAuthenticated])
 def resume_dashboard_view(request, job_id):
-    """Return ranked list of candidates for a given job ID."""
+    """
+    Return ranked list of candidates for a given job ID.
+    
+    ?stream=1              stream rows as NDJSON, in application order, as they are scored
+    ?top=k&min_score=x     keep only the k best candidates scoring at least x, paginated
+                           with ?page=n&page_size=m
+    """
     try:
         # Verify the job exists and belongs to the employer
         job = get_object_or_404(Job, id=job_id, employer=request.user)
         
-        applications = Application.objects.filter(
-            job_id=job_id
-        ).select_related("applicant", "job")
+        if request.query_params.get("stream") in ("1", "true"):
+            rows = (json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in _iter_dashboard_rows(job))
+            return StreamingHttpResponse(rows, content_type="application/x-ndjson")
+        
+        try:
+            top = _positive_param(request, "top")
+            min_score = _positive_param(request, "min_score", default=0.0, cast=float)
+            page = max(_positive_param(request, "page", default=1), 1)
+            page_size = _positive_param(request, "page_size", default=settings.REST_FRAMEWORK['PAGE_SIZE']) or 1
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
         
-        if not applications.exists():
+        if top is not None:
+            scanned = 0
+            
+            def candidates():
+                nonlocal scanned
+                for row in _iter_dashboard_rows(job):
+                    scanned += 1
+                    if row["score"] >= min_score:
+                        yield row
+            
+            # Bounded heap: memory stays O(top) however many people applied
+            best = heapq.nlargest(top, candidates(), key=lambda row: row["score"])
+            offset = (page - 1) * page_size
+            
+            return Response({
+                "results": best[offset:offset + page_size],
+                "count": len(best),
+                "page": page,
+                "num_pages": max(math.ceil(len(best) / page_size), 1),
+                "total_applications": scanned,
+                "job_title": job.title,
+                "job_description": job.description
+            })
+        
+        results = list(_iter_dashboard_rows(job))
+        if not results:
             return Response({
                 "results": [],
                 "message": "No applications found for this job",
                 "job_title": job.title
             })
-
-        results = []
-        skipped = 0
         
-        for app in applications:
-            # Skip applications without resumes
-            if not app.resume:
-                skipped += 1
-                # Still include them but with zero score
-                results.append({
-                    "application_id": app.id,
-                    "candidate": app.applicant.username if app.applicant else "N/A",
-                    "candidate_name": app.full_name,
-                    "email": app.email,
-                    "phone": app.phone or "N/A",
-                    "status": app.status,
-                    "applied_date": app.applied_at.strftime("%Y-%m-%d") if hasattr(app, 'applied_at') else "N/A",
-                    "score": 0.0,
-                    "parsed_data": {
-                        "entities": {
-                            "person": [],
-                            "email": [app.email],
-                            "phone": [app.phone] if app.phone else [],
-                            "skills": [],
-                            "education": [],
-                            "experience": [],
-                            "organization": []
-                        },
-                        "method": "no_resume",
-                        "status": "Resume not uploaded"
-                    }
-                })
-                continue
-            
-            try:
-                resume_path = app.resume.path
-                job_desc = app.job.description or ""
-                analysis = analyze_resume(resume_path, job_desc)
-
-                results.append({
-                    "application_id": app.id,
-                    "candidate": app.applicant.username if app.applicant else "N/A",
-                    "candidate_name": app.full_name,
-                    "email": app.email,
-                    "phone": app.phone or "N/A",
-                    "status": app.status,
-                    "applied_date": app.applied_at.strftime("%Y-%m-%d") if hasattr(app, 'applied_at') else "N/A",
-                    "score": analysis["score"],
-                    "parsed_data": analysis["parsed"]
-                })
-            except Exception as e:
-                print(f"Error processing application {app.id}: {str(e)}")
-                # Include with error status
-                results.append({
-                    "application_id": app.id,
-                    "candidate": app.applicant.username if app.applicant else "N/A",
-                    "candidate_name": app.full_name,
-                    "email": app.email,
-                    "phone": app.phone or "N/A",
-                    "status": app.status,
-                    "applied_date": "N/A",
-                    "score": 0.0,
-                    "parsed_data": {
-                        "entities": {},
-                        "method": "error",
-                        "status": f"Error: {str(e)}"
-                    }
-                })
-
+        skipped = sum(1 for row in results if row["parsed_data"].get("method") == "no_resume")
+        
         # Sort by score descending
         results = sorted(results, key=lambda x: x["score"], reverse=True)
         
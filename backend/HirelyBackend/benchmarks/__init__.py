@@ -0,0 +1,25 @@
+"""
+Benchmarks for the resume analysis pipeline.
+
+Generates a deterministic synthetic corpus (plain text, single-page PDF and
+multi-page PDF resumes plus a job description) and times each stage:
+
+    extract    extract_text_from_pdf per file
+    parse      parse_resume per text
+    score      calculate_enhanced_score per resume (plus one model fit)
+    dashboard  resume_dashboard_view end to end, cold and warm, against a
+               throwaway test database
+
+Run from backend/HirelyBackend:
+
+    python -m benchmarks --scales 10 100 1000
+    python -m benchmarks --save-baseline      # store benchmarks/baselines/baseline.json
+    python -m benchmarks --compare            # exit 1 when a stage regressed
+
+Everything runs locally; no network access is needed.
+
+benchmarks.query_plans seeds a large application dataset and EXPLAINs the
+queries behind the application list, stats and dashboard endpoints; the
+test suite (applications/tests/test_query_plans.py) fails when one of them
+falls back to a sequential scan.
+"""
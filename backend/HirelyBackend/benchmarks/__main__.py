@@ -0,0 +1,77 @@
+# benchmarks/__main__.py
+import argparse
+import os
+import sys
+
+import django
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmark the resume analysis pipeline')
+    parser.add_argument('--scales', type=int, nargs='+', default=[10, 100],
+                        help='Corpus sizes to run (e.g. 10 100 1000 10000)')
+    parser.add_argument('--stages', nargs='+', default=None, help='Stages to run (default: all)')
+    parser.add_argument('--kinds', nargs='+', default=None, help='Resume kinds: txt, pdf, pdf_multi')
+    parser.add_argument('--pages', type=int, default=5, help='Pages per multi-page PDF')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3, help='Warm dashboard requests per scale')
+    parser.add_argument('--output', help='Write the report JSON here')
+    parser.add_argument('--save-baseline', nargs='?', const='', metavar='PATH',
+                        help='Store the report as the baseline')
+    parser.add_argument('--compare', nargs='?', const='', metavar='PATH',
+                        help='Compare against the baseline and exit 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed slowdown as a fraction')
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'HirelyBackend.settings')
+    django.setup()
+
+    from . import runner
+    from .corpus import KINDS
+
+    stages = tuple(args.stages or runner.STAGES)
+    unknown = set(stages) - set(runner.STAGES)
+    if unknown:
+        parser.error(f"unknown stage(s): {', '.join(sorted(unknown))}")
+
+    report = runner.run(
+        args.scales,
+        stages=stages,
+        kinds=tuple(args.kinds or KINDS),
+        pages=args.pages,
+        seed=args.seed,
+        repeat=args.repeat,
+    )
+
+    for scale, results in report['results'].items():
+        print(f"\n📊 {scale} resumes")
+        for (_, stage), summary in sorted(runner._flatten({scale: results}).items()):
+            print(
+                f"  {stage:<16} p50 {summary['p50_ms']:>9.3f}ms  p90 {summary['p90_ms']:>9.3f}ms  "
+                f"p99 {summary['p99_ms']:>9.3f}ms  {summary['resumes_per_sec'] or 0:>10.2f} resumes/sec"
+            )
+
+    if args.output:
+        runner.save(report, args.output)
+        print(f"\n✅ Report written to {args.output}")
+    if args.save_baseline is not None:
+        path = args.save_baseline or runner.BASELINE_PATH
+        runner.save(report, path)
+        print(f"✅ Baseline saved to {path}")
+    if args.compare is not None:
+        path = args.compare or runner.BASELINE_PATH
+        if not os.path.exists(path):
+            print(f"❌ No baseline at {path}; run with --save-baseline first")
+            return 2
+        regressions = runner.compare(report, runner.load(path), tolerance=args.tolerance)
+        if regressions:
+            print("\n❌ Regressions against baseline:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("\n✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# benchmarks/corpus.py
+"""Deterministic synthetic resumes and job descriptions"""
+import os
+import random
+from dataclasses import dataclass
+
+from jobs.utils.resume_parser import ENTITY_LOOKUP
+
+KINDS = ('txt', 'pdf', 'pdf_multi')
+
+FIRST_NAMES = ['Alice', 'Bikash', 'Chen', 'Diana', 'Emeka', 'Farah', 'Gopal', 'Hana', 'Ivan', 'Julia']
+LAST_NAMES = ['Sharma', 'Okafor', 'Nguyen', 'Smith', 'Garcia', 'Kowalski', 'Tanaka', 'Haddad']
+COMPANY_WORDS = ['Acme', 'Globex', 'Initech', 'Umbrella', 'Hooli', 'Vandelay', 'Stark', 'Wayne']
+COMPANY_SUFFIXES = ['Inc', 'LLC', 'Corp', 'Technologies', 'Systems', 'Solutions']
+DEGREES = ['Bachelor of Science in Computer Science', 'Master of Engineering', 'MBA', 'PhD in Physics']
+FILLER = (
+    'Designed and shipped features used by thousands of customers, mentored junior engineers, '
+    'reviewed code, improved test coverage and worked closely with product and design teams.'
+)
+
+# Canonical skill names from the parser taxonomy, so parsing finds real matches
+SKILLS = sorted({name for kind, name in ENTITY_LOOKUP.values() if kind == 'skills'})
+
+
+@dataclass
+class ResumeFile:
+    path: str
+    kind: str
+
+
+def resume_lines(rng, sections=1):
+    """Lines of one synthetic resume; `sections` repeats the experience block"""
+    name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+    lines = [
+        name,
+        f'{name.lower().replace(" ", ".")}@example.com | +1 555 {rng.randint(100, 999)} {rng.randint(1000, 9999)}',
+        f'{rng.randint(1, 15)} years of experience',
+        'Skills: ' + ', '.join(rng.sample(SKILLS, rng.randint(3, 8))),
+        f'Education: {rng.choice(DEGREES)}, State University',
+    ]
+    for _ in range(sections):
+        lines.append(f'Software Engineer at {rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_SUFFIXES)}')
+        lines.append(f'Built services with {rng.choice(SKILLS)} and {rng.choice(SKILLS)}.')
+        lines.append(FILLER)
+    return lines
+
+
+def job_description(seed=0):
+    rng = random.Random(seed)
+    skills = rng.sample(SKILLS, 6)
+    return (
+        f'We are hiring a Senior Software Engineer with experience in {", ".join(skills)}. '
+        'You will design APIs, own services in production and mentor the team. '
+        "A Bachelor's degree in Computer Science or equivalent experience is required."
+    )
+
+
+def _pdf_escape(line):
+    return line.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def write_pdf(path, pages):
+    """Write a minimal text PDF; `pages` is a list of pages, each a list of lines"""
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        None,  # page tree, filled in once the page object numbers are known
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    page_refs = []
+    for lines in pages:
+        text = ' T* '.join(f'({_pdf_escape(line)}) Tj' for line in lines)
+        stream = f'BT /F1 10 Tf 12 TL 50 760 Td {text} ET'.encode('latin-1', 'replace')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_ref = len(objects)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % content_ref
+        )
+        page_refs.append(len(objects))
+    kids = b' '.join(b'%d 0 R' % ref for ref in page_refs)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, len(page_refs))
+
+    out = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(out)
+    out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        out += b'%010d 00000 n \n' % offset
+    out += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    with open(path, 'wb') as f:
+        f.write(out)
+
+
+def build_corpus(directory, size, kinds=KINDS, pages=5, seed=0):
+    """
+    Write `size` resumes into `directory`, cycling through `kinds`.
+
+    pdf_multi resumes spread `pages` experience blocks over as many pages.
+    Returns a list of ResumeFile.
+    """
+    rng = random.Random(seed)
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    for index in range(size):
+        kind = kinds[index % len(kinds)]
+        if kind == 'txt':
+            path = os.path.join(directory, f'resume_{index}.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(resume_lines(rng)))
+        elif kind == 'pdf':
+            path = os.path.join(directory, f'resume_{index}.pdf')
+            write_pdf(path, [resume_lines(rng)])
+        elif kind == 'pdf_multi':
+            path = os.path.join(directory, f'resume_{index}.pdf')
+            lines = resume_lines(rng, sections=pages)
+            per_page = max(1, len(lines) // pages)
+            write_pdf(path, [lines[i:i + per_page] for i in range(0, len(lines), per_page)])
+        else:
+            raise ValueError(f"Unknown resume kind '{kind}'. Choose from: {', '.join(KINDS)}")
+        files.append(ResumeFile(path=path, kind=kind))
+    return files
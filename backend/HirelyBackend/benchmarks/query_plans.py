@@ -0,0 +1,118 @@
+# benchmarks/query_plans.py
+"""
+Query-plan checks for the Application hot paths.
+
+seed_applications() bulk-loads a dataset large enough for the planner to
+prefer an index wherever one fits, and refreshes planner statistics.
+sequential_scans() runs a callable, EXPLAINs every SELECT it issued and
+returns the ones that read a watched table with a full scan: PostgreSQL
+"Seq Scan on <table>", or SQLite "SCAN <table>", which reads every row even
+when it walks an index for the ordering (lookups show up as "SEARCH").
+"""
+import random
+import re
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import connection
+from django.utils import timezone
+
+HOT_TABLES = ('applications_application',)
+
+SEQUENTIAL_SCAN = {
+    'postgresql': re.compile(r'Seq Scan on (?P<table>\w+)'),
+    'sqlite': re.compile(r'^SCAN (?P<table>\w+)'),
+}
+STATUSES = ('pending', 'reviewing', 'shortlisted', 'interviewed', 'accepted', 'rejected', 'withdrawn')
+
+
+def seed_applications(employers=10, jobs_per_employer=5, applications_per_job=100, seed=0):
+    """
+    Bulk-create employers, jobs and applications spread over 90 days.
+
+    The returned candidate has applied to every job once. Returns
+    {'employer', 'candidate', 'job'} for driving the hot-path requests.
+    """
+    from django.contrib.auth import get_user_model
+    from applications.models import Application
+    from jobs.models import Job
+
+    User = get_user_model()
+    rng = random.Random(seed)
+    User.objects.bulk_create([
+        User(username=f'plan_employer_{i}', email=f'plan_employer_{i}@example.com', user_type='employer')
+        for i in range(employers)
+    ] + [User(username='plan_candidate', email='plan_candidate@example.com', user_type='candidate')])
+    candidate = User.objects.get(username='plan_candidate')
+    employer_rows = list(User.objects.filter(user_type='employer', username__startswith='plan_employer_'))
+
+    Job.objects.bulk_create([
+        Job(employer=employer, title=f'Role {i} at {employer.username}', description='Seeded role',
+            company=employer.username, location='Remote')
+        for employer in employer_rows for i in range(jobs_per_employer)
+    ])
+    jobs = list(Job.objects.filter(employer__in=employer_rows).order_by('id'))
+
+    applications = []
+    for job in jobs:
+        for i in range(applications_per_job):
+            index = len(applications)
+            applications.append(Application(
+                job=job,
+                applicant=candidate if i == 0 else None,
+                full_name=f'Applicant {index}',
+                email=candidate.email if i == 0 else f'applicant{index}@example.com',
+                status=rng.choice(STATUSES),
+            ))
+    Application.objects.bulk_create(applications, batch_size=1000)
+
+    # applied_at is auto_now_add; spread it afterwards so "last 7 days" is selective
+    ids = list(Application.objects.filter(job__in=jobs).order_by('id').values_list('id', flat=True))
+    now = timezone.now()
+    for day in range(90):
+        Application.objects.filter(id__in=ids[day::90]).update(applied_at=now - timedelta(days=day, hours=1))
+
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return {'employer': employer_rows[0], 'candidate': candidate, 'job': jobs[0]}
+
+
+@contextmanager
+def capture_selects():
+    """Collect (sql, params) for every SELECT run inside the block"""
+    statements = []
+
+    def record(execute, sql, params, many, context):
+        if sql.lstrip().upper().startswith('SELECT'):
+            statements.append((sql, params))
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(record):
+        yield statements
+
+
+def explain(sql, params=()):
+    """The database's plan for one statement, one line per plan node"""
+    with connection.cursor() as cursor:
+        cursor.execute(f'{connection.ops.explain_query_prefix()} {sql}', params)
+        return [str(row[-1]) for row in cursor.fetchall()]
+
+
+def sequential_scans(run, tables=HOT_TABLES):
+    """
+    Run `run()` and return [(sql, plan)] for each statement whose plan
+    sequentially scans one of `tables`.
+    """
+    pattern = SEQUENTIAL_SCAN[connection.vendor]
+    with capture_selects() as statements:
+        run()
+
+    offending = []
+    for sql, params in statements:
+        plan = explain(sql, params)
+        for line in plan:
+            match = pattern.search(line.strip())
+            if match and match.group('table') in tables:
+                offending.append((sql, plan))
+                break
+    return offending
@@ -0,0 +1,221 @@
+# benchmarks/runner.py
+"""Stage timings, summary statistics and baseline comparison"""
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from jobs.utils.resume_parser import parse_resume
+from jobs.utils.resume_scorer import JobScoringModel, calculate_enhanced_score, extract_text_from_pdf
+
+from .corpus import KINDS, build_corpus, job_description
+
+STAGES = ('extract', 'parse', 'score', 'dashboard')
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'baseline.json')
+
+
+def percentile(sorted_samples, q):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples, resumes):
+    """Latency percentiles in milliseconds plus resumes/sec over the whole stage"""
+    ordered = sorted(samples)
+    total = sum(ordered)
+    return {
+        'samples': len(ordered),
+        'p50_ms': round(percentile(ordered, 50) * 1000, 3),
+        'p90_ms': round(percentile(ordered, 90) * 1000, 3),
+        'p99_ms': round(percentile(ordered, 99) * 1000, 3),
+        'max_ms': round((ordered[-1] if ordered else 0.0) * 1000, 3),
+        'total_s': round(total, 4),
+        'resumes_per_sec': round(resumes / total, 2) if total else None,
+    }
+
+
+def _timed(func, *args, **kwargs):
+    started = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - started
+
+
+def bench_extract(files):
+    texts, samples = [], []
+    for resume in files:
+        text, elapsed = _timed(extract_text_from_pdf, resume.path)
+        texts.append(text)
+        samples.append(elapsed)
+    return texts, summarize(samples, len(files))
+
+
+def bench_parse(texts):
+    parsed, samples = [], []
+    for text in texts:
+        result, elapsed = _timed(parse_resume, text)
+        parsed.append(result)
+        samples.append(elapsed)
+    return parsed, summarize(samples, len(texts))
+
+
+def bench_score(texts, parsed, description):
+    """One model fit over the corpus, then calculate_enhanced_score per resume"""
+    model, fit_time = _timed(JobScoringModel().fit, texts)
+    base_scores, base_time = _timed(model.score_texts, texts, description)
+    samples = []
+    for text, parsed_data, base_score in zip(texts, parsed, base_scores):
+        _, elapsed = _timed(calculate_enhanced_score, text, parsed_data, description, base_score=base_score)
+        samples.append(elapsed)
+    summary = summarize(samples, len(texts))
+    summary['fit_s'] = round(fit_time, 4)
+    summary['base_scores_s'] = round(base_time, 4)
+    return summary
+
+
+def _dashboard_requests(files, description, repeat):
+    from django.contrib.auth import get_user_model
+    from django.core.files import File
+    from rest_framework.test import APIRequestFactory, force_authenticate
+
+    from applications.models import Application
+    from applications.views import resume_dashboard_view
+    from jobs.models import Job
+
+    employer = get_user_model().objects.create_user(
+        username='benchmark_employer', email='benchmark@example.com', password='benchmark', user_type='employer'
+    )
+    job = Job.objects.create(
+        employer=employer, title='Senior Software Engineer', description=description,
+        category='programming', level='senior', location='Remote', company='Benchmark Inc',
+    )
+    for index, resume in enumerate(files):
+        with open(resume.path, 'rb') as f:
+            Application.objects.create(
+                job=job, full_name=f'Candidate {index}', email=f'candidate{index}@example.com',
+                resume=File(f, name=os.path.basename(resume.path)),
+            )
+
+    factory = APIRequestFactory()
+
+    def call():
+        request = factory.get(f'/applications/resume-dashboard/{job.id}/')
+        force_authenticate(request, user=employer)
+        response = resume_dashboard_view(request, job_id=job.id)
+        if response.status_code != 200:
+            raise RuntimeError(f'resume dashboard returned {response.status_code}: {response.data}')
+
+    # Cold: text extraction, parsing and scoring happen inline; warm: stored scores only
+    _, cold = _timed(call)
+    warm = [_timed(call)[1] for _ in range(repeat)]
+    return {'cold': summarize([cold], len(files)), 'warm': summarize(warm, len(files) * repeat)}
+
+
+def bench_dashboard(files, description, repeat=3, isolated=True):
+    """
+    Time resume_dashboard_view end to end.
+
+    With isolated=True the data lives in a throwaway test database and a
+    temporary MEDIA_ROOT, so the configured database is never touched.
+    """
+    from django.test.utils import override_settings
+
+    with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+        if not isolated:
+            return _dashboard_requests(files, description, repeat)
+
+        from django.db import connection
+        from django.test.utils import setup_test_environment, teardown_test_environment
+
+        old_name = connection.settings_dict['NAME']
+        setup_test_environment()
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            return _dashboard_requests(files, description, repeat)
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+
+def run_scale(size, stages=STAGES, kinds=KINDS, pages=5, seed=0, repeat=3, isolated=True):
+    """Benchmark every requested stage on a fresh corpus of `size` resumes"""
+    description = job_description(seed)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        files = build_corpus(directory, size, kinds=kinds, pages=pages, seed=seed)
+        # Later stages need the earlier stages' output even when not reported
+        texts, results['extract'] = bench_extract(files)
+        parsed, results['parse'] = bench_parse(texts)
+        if 'score' in stages:
+            results['score'] = bench_score(texts, parsed, description)
+        if 'dashboard' in stages:
+            results['dashboard'] = bench_dashboard(files, description, repeat=repeat, isolated=isolated)
+    return {stage: summary for stage, summary in results.items() if stage in stages}
+
+
+def run(scales, **options):
+    return {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'options': {key: list(value) if isinstance(value, tuple) else value for key, value in options.items()},
+        },
+        'results': {str(size): run_scale(size, **options) for size in scales},
+    }
+
+
+def _flatten(results):
+    """{(scale, stage path): summary} with dashboard cold/warm as separate stages"""
+    flat = {}
+    for scale, stages in results.items():
+        for stage, summary in stages.items():
+            if stage == 'dashboard':
+                for phase, phase_summary in summary.items():
+                    flat[(scale, f'dashboard.{phase}')] = phase_summary
+            else:
+                flat[(scale, stage)] = summary
+    return flat
+
+
+def compare(current, baseline, tolerance=0.2):
+    """
+    Return human readable regressions of `current` against `baseline`.
+
+    A stage regresses when its p50 latency grew, or its throughput dropped,
+    by more than `tolerance` (a fraction). Stages missing from either run
+    are ignored.
+    """
+    regressions = []
+    previous = _flatten(baseline['results'])
+    for key, summary in _flatten(current['results']).items():
+        old = previous.get(key)
+        if not old:
+            continue
+        scale, stage = key
+        if old['p50_ms'] and summary['p50_ms'] > old['p50_ms'] * (1 + tolerance):
+            regressions.append(f"{stage} @ {scale}: p50 {old['p50_ms']}ms -> {summary['p50_ms']}ms")
+        if old['resumes_per_sec'] and summary['resumes_per_sec'] is not None \
+                and summary['resumes_per_sec'] < old['resumes_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{stage} @ {scale}: {old['resumes_per_sec']} -> {summary['resumes_per_sec']} resumes/sec"
+            )
+    return regressions
+
+
+def load(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save(report, path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write('\n')
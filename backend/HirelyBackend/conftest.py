@@ -3,6 +3,7 @@ Pytest configuration and fixtures for testing
 """
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from rest_framework.test import APIClient
 from jobs.models import Job
 from applications.models import Application
@@ -10,6 +11,14 @@ from applications.models import Application
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache"""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def api_client():
     """Return API client for testing"""
@@ -1,6 +1,18 @@
 from django.contrib import admin
-from .models import Job
+from .models import Job, Location, LocationAlias
 # Register your models here.
 @admin.register(Job)
 class JobAdmin(admin.ModelAdmin):
-    list_display = ("title", "company", "location", "employer", "is_active", "created_at")
\ No newline at end of file
+    list_display = ("title", "company", "location", "employer", "is_active", "created_at")
+
+
+class LocationAliasInline(admin.TabularInline):
+    model = LocationAlias
+    extra = 1
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name", "aliases__key")
+    inlines = [LocationAliasInline]
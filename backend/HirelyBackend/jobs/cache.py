@@ -0,0 +1,95 @@
+# jobs/cache.py
+"""
+Versioned cache for data derived from the Job table.
+
+Every cached entry's key embeds the current jobs version. Saving, deleting
+or toggling a job bumps the version (see jobs/signals.py), which makes all
+older entries unreachable at once; they then simply expire.
+
+Applicant counts change far more often than jobs do, so creating or deleting
+an application bumps a separate applications version instead (see
+applications/signals.py). Only data that shows those counts (the response
+cache) includes it, and facets, filters and location aliases stay cached.
+"""
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+VERSION_KEY = 'jobs:version'
+CHANGED_KEY = 'jobs:changed'
+APPLICATIONS_VERSION_KEY = 'jobs:applications:version'
+APPLICATIONS_CHANGED_KEY = 'jobs:applications:changed'
+
+
+def _fresh_version():
+    # Time based, so a version key that was evicted never comes back with an old value
+    return time.time_ns() // 1000
+
+
+def _version(key):
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _fresh_version(), None)
+        version = cache.get(key)
+    return version
+
+
+def _bump(key):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Key missing (first use or evicted)
+        version = _fresh_version()
+        cache.set(key, version, None)
+        return version
+
+
+def jobs_version():
+    return _version(VERSION_KEY)
+
+
+def jobs_changed_at():
+    """When a job was last saved or deleted, if still known"""
+    return cache.get(CHANGED_KEY)
+
+
+def bump_jobs_version():
+    """Invalidate every cached entry derived from jobs"""
+    cache.set(CHANGED_KEY, timezone.now(), None)
+    return _bump(VERSION_KEY)
+
+
+def applications_version():
+    return _version(APPLICATIONS_VERSION_KEY)
+
+
+def applications_changed_at():
+    """When an application was last created or deleted, if still known"""
+    return cache.get(APPLICATIONS_CHANGED_KEY)
+
+
+def bump_applications_version():
+    """Invalidate cached entries that show applicant counts"""
+    cache.set(APPLICATIONS_CHANGED_KEY, timezone.now(), None)
+    return _bump(APPLICATIONS_VERSION_KEY)
+
+
+def versioned_key(name, params=None):
+    digest = hashlib.sha256(json.dumps(params or {}, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    return f'jobs:{name}:v{jobs_version()}:{digest}'
+
+
+def get_or_compute(name, compute, params=None, timeout=None):
+    """Return the cached value for (name, params) at the current jobs version, computing it on a miss"""
+    if timeout is None:
+        timeout = settings.JOB_FACET_CACHE_TIMEOUT
+    key = versioned_key(name, params)
+    value = cache.get(key)
+    if value is None:
+        value = compute()
+        cache.set(key, value, timeout)
+    return value
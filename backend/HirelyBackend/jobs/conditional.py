@@ -0,0 +1,109 @@
+# jobs/conditional.py
+"""
+HTTP conditional GET for job endpoints.
+
+Validators come from one small query over the jobs behind the response:
+their count and latest change times. Applicant counts are dated by the
+jobs' pipeline counters rows (one per job, updated_at moves on every
+application write), which lives in the database and so is seen by every
+worker process. Lists never read the Application table; a detail counts
+its applications and dates its related jobs with correlated subqueries
+rather than joining the two against each other. A deleted job leaves no row behind to
+date it, so a list's Last-Modified also covers the last job write recorded
+by the jobs version. When the client's If-None-Match / If-Modified-Since
+still match, a 304 is returned before the page query or any serialization
+runs.
+"""
+import hashlib
+
+from django.db.models import Count, F, Max, OuterRef, Subquery
+from django.utils.cache import get_conditional_response, quote_etag
+from django.utils.http import http_date
+
+from .cache import jobs_changed_at
+from .models import Job, RelatedJob
+
+# Bump when the serialized representation changes, so cached copies are refreshed
+REPRESENTATION_VERSION = '1'
+
+
+def _latest(*values):
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def _validators(stats, request, changed_at=None):
+    last_modified = _latest(
+        stats.get('last_updated'), stats.get('last_applied'), stats.get('related_updated'), changed_at
+    )
+    parts = [REPRESENTATION_VERSION, request.get_full_path()]
+    parts.extend(f'{key}={stats[key]}' for key in sorted(stats))
+    etag = quote_etag(hashlib.sha256('|'.join(map(str, parts)).encode('utf-8')).hexdigest()[:32])
+    return etag, last_modified
+
+
+def list_validators(queryset, request):
+    """(etag, last_modified) for a filtered job queryset"""
+    stats = Job.objects.filter(pk__in=queryset.order_by().values('pk')).aggregate(
+        job_count=Count('id'),
+        last_updated=Max('updated_at'),
+        last_applied=Max('pipeline_counters__updated_at'),
+    )
+    # Kept out of the ETag: the job count already covers deletes within this queryset
+    return _validators(stats, request, changed_at=jobs_changed_at())
+
+
+def detail_validators(queryset, request, pk):
+    """(etag, last_modified) for one job, or None when it does not exist"""
+    related_updated = (
+        RelatedJob.objects.filter(job=OuterRef('pk'))
+        .order_by()
+        .values('job')
+        .annotate(latest=Max('related__updated_at'))
+        .values('latest')
+    )
+    stats = (
+        Job.objects.with_applicants_count()
+        .filter(pk=pk, pk__in=queryset.order_by().values('pk'))
+        .annotate(related_updated=Subquery(related_updated))
+        .values(
+            'applicants_count',
+            'related_updated',
+            last_updated=F('updated_at'),
+            related_refreshed=F('related_refreshed_at'),
+            last_applied=F('pipeline_counters__updated_at'),
+        )
+        .first()
+    )
+    return _validators(stats, request) if stats else None
+
+
+class ConditionalGetMixin:
+    """Answer GET with 304 Not Modified when the client's copy is current"""
+
+    def get_validators(self):
+        lookup = self.lookup_url_kwarg or self.lookup_field
+        if lookup in self.kwargs:
+            return detail_validators(self.get_queryset(), self.request, self.kwargs[lookup])
+        return list_validators(self.filter_queryset(self.get_queryset()), self.request)
+
+    def get(self, request, *args, **kwargs):
+        validators = self.get_validators()
+        if validators is None:
+            return super().get(request, *args, **kwargs)
+
+        etag, last_modified = validators
+        # HTTP dates have one-second resolution; keep microseconds and If-Modified-Since never matches
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        not_modified = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if not_modified is not None:
+            return not_modified
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            # Let clients store the copy but revalidate it on every use
+            response['Cache-Control'] = 'no-cache'
+        return response
@@ -0,0 +1,67 @@
+# jobs/facets.py
+"""
+Facet counts for job listings.
+
+All facets are counted with one grouped aggregate over the filtered
+queryset, then folded per facet in Python, so the number of queries does not
+depend on how many categories or locations exist.
+"""
+from collections import Counter
+
+from django.db.models import Count
+
+from .models import Job
+
+# facet name -> (model field, choices or None for free-text values)
+FACETS = {
+    'categories': ('category', Job.JOB_CATEGORIES),
+    'locations': ('location_ref__name', None),
+    'job_types': ('job_type', Job.JOB_TYPES),
+    'levels': ('level', Job.JOB_LEVELS),
+}
+
+
+def facet_counts(queryset):
+    """
+    Return filter options with counts for the jobs in `queryset`.
+
+    Choice facets list every choice (count 0 when absent) in declaration
+    order; locations list the canonical locations present, alphabetically.
+    """
+    fields = [field for field, _ in FACETS.values()]
+    rows = queryset.order_by().values(*fields).annotate(count=Count('id'))
+
+    counters = {field: Counter() for field in fields}
+    for row in rows:
+        for field in fields:
+            counters[field][row[field]] += row['count']
+
+    options = {}
+    for name, (field, choices) in FACETS.items():
+        counts = counters[field]
+        if choices is None:
+            options[name] = [
+                {'value': value, 'count': counts[value]}
+                # Jobs without a location_ref are grouped under None; leave them out
+                for value in sorted(value for value in counts if value is not None)
+            ]
+        else:
+            options[name] = [
+                {'value': value, 'label': label, 'count': counts[value]}
+                for value, label in choices
+            ]
+    return options
+
+
+def active_job_filters():
+    """Distinct filter values across all active jobs"""
+    jobs = Job.objects.filter(is_active=True).order_by()
+    return {
+        'categories': list(jobs.values_list('category', flat=True).distinct()),
+        'locations': list(
+            jobs.filter(location_ref__isnull=False)
+            .values_list('location_ref__name', flat=True).distinct().order_by('location_ref__name')
+        ),
+        'job_types': list(jobs.values_list('job_type', flat=True).distinct()),
+        'levels': list(jobs.values_list('level', flat=True).distinct()),
+    }
@@ -0,0 +1,62 @@
+# jobs/fieldsets.py
+"""
+Compact and sparse representations for job list endpoints.
+
+    ?view=compact         JobListSerializer: card fields only
+    ?fields=id,title,...  any subset of JobSerializer's fields
+
+Either way the queryset loads only the columns those fields read, so the
+long description/responsibilities/requirements texts are neither fetched
+nor serialized. Without these parameters the full JobSerializer is used.
+"""
+from rest_framework.exceptions import ValidationError
+
+from .serializers import JobListSerializer, JobSerializer
+
+# Always loaded: the primary key and the columns listings are ordered/paginated on
+BASE_COLUMNS = {'id', 'created_at'}
+
+
+class SparseFieldsetMixin:
+    compact_serializer_class = JobListSerializer
+    sparse_serializer_class = JobSerializer
+
+    def requested_fields(self):
+        if not hasattr(self, '_requested_fields'):
+            raw = self.request.query_params.get('fields')
+            fields = None
+            if raw:
+                fields = [name.strip() for name in raw.split(',') if name.strip()]
+                available = self.sparse_serializer_class.Meta.fields
+                unknown = [name for name in fields if name not in available]
+                if unknown:
+                    raise ValidationError({'fields': f"Unknown field(s): {', '.join(unknown)}"})
+            self._requested_fields = fields
+        return self._requested_fields
+
+    def compact(self):
+        return self.request.query_params.get('view') == 'compact'
+
+    def get_serializer_class(self):
+        if self.requested_fields():
+            return self.sparse_serializer_class
+        if self.compact():
+            return self.compact_serializer_class
+        return super().get_serializer_class()
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.requested_fields()
+        if fields:
+            kwargs['fields'] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def paginate_queryset(self, queryset):
+        # Only the page query is narrowed; facets and validators read their own columns
+        serializer_class = self.get_serializer_class()
+        fields = self.requested_fields() or (serializer_class.Meta.fields if self.compact() else None)
+        if fields:
+            columns = BASE_COLUMNS | serializer_class.columns_for(fields)
+            if not any(column.startswith('employer__') for column in columns):
+                queryset = queryset.select_related(None)
+            queryset = queryset.only(*columns)
+        return super().paginate_queryset(queryset)
@@ -0,0 +1,77 @@
+# jobs/location_search.py
+"""
+Location filtering through the normalized Location/LocationAlias tables.
+
+A query is normalized and matched against alias keys by substring, so
+"new yo", "NYC" and "New York, NY" all resolve to the same canonical
+Location, and "York" resolves to both "New York, NY" and "Yorkshire". The
+substring scan runs over the small alias table (served by the pg_trgm GIN
+index on PostgreSQL); jobs are then filtered by location_ref, an indexed
+foreign key set by Job.save and backfilled by migration 0006. Rows written
+around Job.save (bulk_create, queryset.update) or with a location that
+normalizes to nothing have no location_ref; those alone are matched by
+substring on the location text, a branch the location_ref index also serves
+(IS NULL). When no alias contains the query, typo-tolerant matching kicks
+in: pg_trgm similarity on PostgreSQL, difflib over the cached alias keys
+elsewhere.
+"""
+import difflib
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+from .cache import get_or_compute
+from .models import LocationAlias
+from .utils.locations import normalize_location
+
+# Minimum difflib ratio for typo-tolerant matches; PostgreSQL uses pg_trgm.similarity_threshold
+FUZZY_CUTOFF = 0.75
+MAX_FUZZY_MATCHES = 5
+
+
+def _alias_keys():
+    return get_or_compute(
+        'location-aliases',
+        lambda: dict(LocationAlias.objects.values_list('key', 'location_id')),
+    )
+
+
+def _fuzzy_location_ids(key, using):
+    if connections[using].vendor == 'postgresql':
+        table = LocationAlias._meta.db_table
+        # `%` is the GIN-indexable similarity operator
+        return set(
+            LocationAlias.objects.using(using)
+            .alias(
+                trigram_match=RawSQL(f'{table}.key %% %s', (key,), output_field=BooleanField()),
+                similarity=RawSQL(f'similarity({table}.key, %s)', (key,), output_field=FloatField()),
+            )
+            .filter(trigram_match=True)
+            .order_by('-similarity')
+            .values_list('location_id', flat=True)[:MAX_FUZZY_MATCHES]
+        )
+    keys = _alias_keys()
+    matches = difflib.get_close_matches(key, keys, n=MAX_FUZZY_MATCHES, cutoff=FUZZY_CUTOFF)
+    return {keys[match] for match in matches}
+
+
+def resolve_location_ids(query, using='default'):
+    """Ids of the canonical locations a user-typed location query refers to"""
+    key = normalize_location(query)
+    if not key:
+        return set()
+    ids = set(
+        LocationAlias.objects.using(using)
+        .filter(key__contains=key)
+        .values_list('location_id', flat=True)
+    )
+    return ids or _fuzzy_location_ids(key, using)
+
+
+def filter_by_location(queryset, query):
+    matches = Q(location_ref__isnull=True, location__icontains=query)
+    ids = resolve_location_ids(query, using=queryset.db)
+    if ids:
+        matches |= Q(location_ref_id__in=ids)
+    return queryset.filter(matches)
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from jobs.recommender import refresh_related_jobs
+
+
+class Command(BaseCommand):
+    help = 'Recompute precomputed related jobs for jobs that changed since the last refresh'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Recompute every job, not only changed ones')
+        parser.add_argument('--interval', type=float, default=None,
+                            help='Keep running, refreshing every INTERVAL seconds')
+
+    def handle(self, *args, **options):
+        full = options['full']
+        
+        while True:
+            refreshed = refresh_related_jobs(full=full)
+            self.stdout.write(f"✅ Refreshed related jobs for {refreshed} jobs")
+            
+            if options['interval'] is None:
+                return
+            full = False
+            time.sleep(options['interval'])
@@ -0,0 +1,82 @@
+from django.db import migrations
+
+SEARCH_FIELDS = ('title', 'description', 'company', 'skills', 'responsibilities')
+
+# Postgres: generated tsvector column, weighted so title/skills matches rank first
+POSTGRES_WEIGHTS = {'title': 'A', 'skills': 'B', 'company': 'B', 'description': 'C', 'responsibilities': 'D'}
+
+POSTGRES_FORWARD = [
+    "ALTER TABLE jobs_job ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    + " || ".join(
+        f"setweight(to_tsvector('english'::regconfig, coalesce({field}, '')), '{weight}')"
+        for field, weight in POSTGRES_WEIGHTS.items()
+    )
+    + ") STORED",
+    "CREATE INDEX jobs_job_search_vector_gin ON jobs_job USING GIN (search_vector)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS jobs_job_search_vector_gin",
+    "ALTER TABLE jobs_job DROP COLUMN IF EXISTS search_vector",
+]
+
+# SQLite: external-content FTS5 table kept in sync by triggers
+columns = ', '.join(SEARCH_FIELDS)
+new_values = ', '.join(f'new.{field}' for field in SEARCH_FIELDS)
+old_values = ', '.join(f'old.{field}' for field in SEARCH_FIELDS)
+SQLITE_FORWARD = [
+    f"CREATE VIRTUAL TABLE jobs_job_fts USING fts5({columns}, "
+    f"content='jobs_job', content_rowid='id', tokenize='porter unicode61')",
+    f"CREATE TRIGGER jobs_job_fts_insert AFTER INSERT ON jobs_job BEGIN "
+    f"INSERT INTO jobs_job_fts(rowid, {columns}) VALUES (new.id, {new_values}); END",
+    f"CREATE TRIGGER jobs_job_fts_delete AFTER DELETE ON jobs_job BEGIN "
+    f"INSERT INTO jobs_job_fts(jobs_job_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); END",
+    f"CREATE TRIGGER jobs_job_fts_update AFTER UPDATE ON jobs_job BEGIN "
+    f"INSERT INTO jobs_job_fts(jobs_job_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values}); "
+    f"INSERT INTO jobs_job_fts(rowid, {columns}) VALUES (new.id, {new_values}); END",
+    "INSERT INTO jobs_job_fts(jobs_job_fts) VALUES ('rebuild')",
+]
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS jobs_job_fts_insert",
+    "DROP TRIGGER IF EXISTS jobs_job_fts_delete",
+    "DROP TRIGGER IF EXISTS jobs_job_fts_update",
+    "DROP TABLE IF EXISTS jobs_job_fts",
+]
+
+
+def _run(schema_editor, statements):
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def _sqlite_has_fts5(schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_FORWARD)
+    elif vendor == 'sqlite' and _sqlite_has_fts5(schema_editor):
+        _run(schema_editor, SQLITE_FORWARD)
+    # Other databases fall back to icontains search (see jobs/search.py)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'postgresql':
+        _run(schema_editor, POSTGRES_BACKWARD)
+    elif vendor == 'sqlite':
+        _run(schema_editor, SQLITE_BACKWARD)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_application_deadline_job_application_url_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
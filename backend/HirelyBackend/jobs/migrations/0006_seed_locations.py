@@ -0,0 +1,59 @@
+from django.db import migrations
+
+from jobs.utils.locations import load_location_aliases, normalize_location
+
+POSTGRES_FORWARD = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX jobs_locationalias_key_trgm ON jobs_locationalias USING GIN (key gin_trgm_ops)",
+]
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS jobs_locationalias_key_trgm",
+]
+
+
+def _alias_location(Location, LocationAlias, name, key):
+    location, _ = Location.objects.get_or_create(name=name)
+    LocationAlias.objects.get_or_create(key=key, defaults={'location': location})
+    return LocationAlias.objects.get(key=key).location_id
+
+
+def seed_locations(apps, schema_editor):
+    Location = apps.get_model('jobs', 'Location')
+    LocationAlias = apps.get_model('jobs', 'LocationAlias')
+    Job = apps.get_model('jobs', 'Job')
+
+    for name, aliases in load_location_aliases().items():
+        for alias in [name, *aliases]:
+            _alias_location(Location, LocationAlias, name, normalize_location(alias))
+
+    # Link existing jobs; unknown spellings become their own canonical location
+    for job in Job.objects.filter(location_ref__isnull=True).exclude(location='').iterator():
+        key = normalize_location(job.location)
+        if key:
+            location_id = _alias_location(Location, LocationAlias, job.location.strip()[:100], key)
+            Job.objects.filter(pk=job.pk).update(location_ref_id=location_id)
+
+
+def create_trigram_index(apps, schema_editor):
+    # SQLite has no trigram index; jobs/location_search.py falls back to difflib there
+    if schema_editor.connection.vendor == 'postgresql':
+        for statement in POSTGRES_FORWARD:
+            schema_editor.execute(statement)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        for statement in POSTGRES_BACKWARD:
+            schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_location_job_location_ref_locationalias'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_locations, migrations.RunPython.noop),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
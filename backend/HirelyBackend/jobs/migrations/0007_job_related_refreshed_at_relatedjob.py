@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-16 23:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0006_seed_locations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='related_refreshed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.CreateModel(
+            name='RelatedJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('rank', models.PositiveSmallIntegerField()),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_jobs', to='jobs.job')),
+                ('related', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='related_to', to='jobs.job')),
+            ],
+            options={
+                'ordering': ['job', 'rank'],
+                'constraints': [models.UniqueConstraint(fields=('job', 'rank'), name='unique_related_job_rank')],
+            },
+        ),
+    ]
@@ -1,6 +1,70 @@
 from django.db import models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.conf import settings
 
+
+class JobQuerySet(models.QuerySet):
+    def with_applicants_count(self):
+        """Annotate applicants_count with a correlated subquery, so listings need no per-row COUNT"""
+        Application = self.model._meta.get_field('applications').related_model
+        counts = (
+            Application.objects.filter(job=OuterRef('pk'))
+            .order_by()
+            .values('job')
+            .annotate(total=Count('pk'))
+            .values('total')
+        )
+        return self.annotate(
+            applicants_count=Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+        )
+
+
+class LocationManager(models.Manager):
+    def resolve(self, text):
+        """Return the Location a free-text location refers to, creating it when unknown"""
+        from .utils.locations import normalize_location
+        key = normalize_location(text)
+        if not key:
+            return None
+        alias = LocationAlias.objects.select_related('location').filter(key=key).first()
+        if alias:
+            return alias.location
+        location, _ = self.get_or_create(name=text.strip()[:100])
+        LocationAlias.objects.get_or_create(key=key, defaults={'location': location})
+        return location
+
+
+class Location(models.Model):
+    """Canonical location; free-text spellings map to it through LocationAlias"""
+    name = models.CharField(max_length=100, unique=True)
+    
+    objects = LocationManager()
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+
+
+class LocationAlias(models.Model):
+    """A normalized spelling of a location (see jobs.utils.locations.normalize_location)"""
+    location = models.ForeignKey(Location, on_delete=models.CASCADE, related_name='aliases')
+    key = models.CharField(max_length=100, unique=True)
+    
+    class Meta:
+        verbose_name_plural = 'Location aliases'
+    
+    def save(self, *args, **kwargs):
+        from .utils.locations import normalize_location
+        self.key = normalize_location(self.key)
+        super().save(*args, **kwargs)
+    
+    def __str__(self):
+        return f"{self.key} -> {self.location}"
+
+
 class Job(models.Model):
     JOB_CATEGORIES = [
         ('programming', 'Programming'),
@@ -45,6 +109,13 @@ class Job(models.Model):
     
     # Location & Company
     location = models.CharField(max_length=100)
+    location_ref = models.ForeignKey(
+        Location,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='jobs'
+    )
     company = models.CharField(max_length=200)
     is_remote = models.BooleanField(default=False)
     
@@ -67,20 +138,51 @@ class Job(models.Model):
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Last time jobs/recommender.py recomputed this job's related jobs
+    related_refreshed_at = models.DateTimeField(null=True, blank=True, editable=False)
+    
+    objects = JobQuerySet.as_manager()
     
     class Meta:
-        ordering = ['-created_at']
+        ordering = ['-created_at', '-id']
         indexes = [
             models.Index(fields=['is_active', 'category']),
             models.Index(fields=['is_active', 'location']),
+            # Keyset pagination of active jobs (jobs/pagination.py)
+            models.Index(fields=['is_active', '-created_at', '-id'], name='job_active_created_idx'),
         ]
     
     def __str__(self):
         return f"{self.title} at {self.company}"
     
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'location' in update_fields:
+            self.location_ref = Location.objects.resolve(self.location)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'location_ref'}
+        super().save(*args, **kwargs)
+    
     @property
     def is_expired(self):
         if self.application_deadline:
             from django.utils import timezone
             return timezone.now() > self.application_deadline
-        return False
\ No newline at end of file
+        return False
+
+
+class RelatedJob(models.Model):
+    """Precomputed nearest neighbours of a job (see jobs/recommender.py)"""
+    job = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='related_jobs')
+    related = models.ForeignKey(Job, on_delete=models.CASCADE, related_name='related_to')
+    score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+    
+    class Meta:
+        ordering = ['job', 'rank']
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'rank'], name='unique_related_job_rank'),
+        ]
+    
+    def __str__(self):
+        return f"{self.job_id} -> {self.related_id} ({self.score:.3f})"
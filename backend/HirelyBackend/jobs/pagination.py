@@ -0,0 +1,73 @@
+# jobs/pagination.py
+"""
+Opt-in keyset pagination for job listings.
+
+Page-number pagination (the REST_FRAMEWORK default) stays the default. Pass
+?pagination=cursor (or follow a returned ?cursor= link) to page by
+(created_at, id) instead, which seeks through the job_active_created_idx
+index rather than scanning an OFFSET and skips the COUNT(*). Add ?count=approx
+to get a cheap estimate of the total for infinite scroll.
+"""
+import json
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.pagination import CursorPagination
+
+# Past this many rows an approximate count just reports "at least this many"
+APPROXIMATE_COUNT_CAP = 1000
+
+
+def approximate_count(queryset, cap=APPROXIMATE_COUNT_CAP):
+    """
+    Return (count, exact).
+
+    PostgreSQL uses the planner's row estimate (no rows are read); other
+    databases count at most cap + 1 rows.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor == 'postgresql':
+        sql, params = queryset.order_by().values('pk').query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute('EXPLAIN (FORMAT JSON) ' + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows']), False
+    count = queryset.order_by().values('pk')[:cap + 1].count()
+    return min(count, cap), count <= cap
+
+
+class JobCursorPagination(CursorPagination):
+    ordering = ('-created_at', '-id')
+    page_size = settings.REST_FRAMEWORK.get('PAGE_SIZE', 20)
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.count = None
+        if request.query_params.get('count') == 'approx':
+            self.count, self.count_is_exact = approximate_count(queryset)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        if self.count is not None:
+            response.data['count'] = self.count
+            response.data['count_is_exact'] = self.count_is_exact
+        return response
+
+
+class CursorPaginationOptInMixin:
+    """Use JobCursorPagination for requests that ask for it; the default paginator otherwise"""
+    cursor_pagination_class = JobCursorPagination
+
+    def uses_cursor_pagination(self):
+        params = self.request.query_params
+        return params.get('pagination') == 'cursor' or 'cursor' in params
+
+    @property
+    def paginator(self):
+        if not hasattr(self, '_paginator') and self.uses_cursor_pagination():
+            self._paginator = self.cursor_pagination_class()
+        return super().paginator
@@ -0,0 +1,131 @@
+# jobs/recommender.py
+"""
+Content-based related jobs.
+
+A TF-IDF matrix over the title, description and skills of every active job
+gives each job its TOP_K most similar active jobs, stored as RelatedJob rows
+so the detail view reads them with one indexed query.
+
+refresh_related_jobs() is incremental by default. It only recomputes:
+- jobs saved since their last refresh (updated_at > related_refreshed_at)
+- jobs whose list contains a changed, deactivated or deleted job
+- jobs whose list a changed job now beats
+The IDF weights drift slowly as jobs come and go, so run a full refresh
+now and then (`manage.py refresh_related_jobs --full`).
+"""
+import numpy as np
+from django.db import transaction
+from django.db.models import Count, F, Min, Q
+from django.utils import timezone
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from .models import Job, RelatedJob
+
+TOP_K = 10
+
+# How many related jobs the detail view shows
+DETAIL_RELATED_COUNT = 3
+
+
+def job_document(job):
+    return " ".join(part for part in (job['title'], job['skills'], job['description']) if part)
+
+
+def _top_k(similarities, row_ids, ids, k):
+    """Yield RelatedJob rows for each job in row_ids from its similarity row"""
+    for row, job_id in zip(similarities, row_ids):
+        row = row.toarray().ravel()
+        # k + 1 candidates leave room for the job itself
+        candidates = min(k + 1, len(row))
+        order = np.argpartition(-row, candidates - 1)[:candidates]
+        order = order[np.argsort(-row[order], kind='stable')]
+        rank = 0
+        for index in order:
+            if rank >= k or row[index] <= 0:
+                break
+            if ids[index] == job_id:
+                continue
+            yield RelatedJob(job_id=job_id, related_id=ids[index], score=float(row[index]), rank=rank)
+            rank += 1
+
+
+def _stale_job_ids():
+    return set(
+        Job.objects.filter(
+            Q(related_refreshed_at__isnull=True) | Q(updated_at__gt=F('related_refreshed_at'))
+        ).values_list('id', flat=True)
+    )
+
+
+def refresh_related_jobs(full=False, k=TOP_K):
+    """Recompute stored related jobs; returns the number of jobs whose list was rewritten"""
+    started = timezone.now()
+    stale = _stale_job_ids()
+    if not full and not stale:
+        return 0
+
+    jobs = list(
+        Job.objects.filter(is_active=True).order_by('id').values('id', 'title', 'description', 'skills')
+    )
+    ids = [job['id'] for job in jobs]
+    position = {job_id: index for index, job_id in enumerate(ids)}
+
+    matrix = None
+    if jobs:
+        try:
+            matrix = TfidfVectorizer(stop_words='english', max_features=20000).fit_transform(
+                [job_document(job) for job in jobs]
+            )
+        except ValueError:
+            # Only stop words/empty documents: nothing is related to anything
+            matrix = None
+
+    if full:
+        targets = set(ids)
+    else:
+        changed_active = [job_id for job_id in stale if job_id in position]
+        # Lists that point at a changed or vanished job
+        targets = set(changed_active) | set(
+            RelatedJob.objects.filter(related_id__in=stale).values_list('job_id', flat=True)
+        )
+        # Lists that a changed job now beats
+        if changed_active and matrix is not None:
+            thresholds = {
+                row['job_id']: row['lowest'] if row['entries'] >= k else 0.0
+                for row in RelatedJob.objects.values('job_id').annotate(lowest=Min('score'), entries=Count('id'))
+            }
+            changed_rows = matrix[[position[job_id] for job_id in changed_active]]
+            best = (changed_rows @ matrix.T).max(axis=0).toarray().ravel()
+            changed = set(changed_active)
+            for index, job_id in enumerate(ids):
+                if job_id not in changed and best[index] > thresholds.get(job_id, 0.0):
+                    targets.add(job_id)
+        targets &= set(position)
+
+    rows = []
+    target_ids = sorted(targets)
+    if matrix is not None and target_ids:
+        target_rows = matrix[[position[job_id] for job_id in target_ids]]
+        rows = list(_top_k(target_rows @ matrix.T, target_ids, ids, k))
+
+    with transaction.atomic():
+        # Inactive jobs keep no list; their ids drop out of others' lists above
+        RelatedJob.objects.filter(Q(job_id__in=target_ids) | Q(job_id__in=stale - set(position))).delete()
+        if full:
+            RelatedJob.objects.filter(job__is_active=False).delete()
+        RelatedJob.objects.bulk_create(rows)
+        refreshed = Job.objects.filter(id__in=stale | set(target_ids))
+        if full:
+            refreshed = Job.objects.all()
+        # update() leaves updated_at alone and sends no signals
+        refreshed.filter(updated_at__lte=started).update(related_refreshed_at=started)
+    return len(target_ids)
+
+
+def related_jobs_for(job, count=DETAIL_RELATED_COUNT):
+    """Precomputed related jobs of `job`; same-category jobs until it has been refreshed"""
+    if job.related_refreshed_at is None:
+        related = Job.objects.filter(is_active=True, category=job.category).exclude(id=job.id)
+    else:
+        related = Job.objects.filter(related_to__job=job, is_active=True).order_by('related_to__rank')
+    return related.select_related('employer').with_applicants_count()[:count]
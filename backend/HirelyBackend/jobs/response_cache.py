@@ -0,0 +1,95 @@
+# jobs/response_cache.py
+"""
+Response cache for anonymous job listings.
+
+Entries are keyed on the endpoint, the normalized query parameters and the
+jobs and applications versions (see jobs/cache.py), so any job write, or a
+new or removed application (pages show applicant counts), makes every cached
+page unreachable at once. A hit is answered from the cache alone: no query runs,
+not even the conditional GET validators, whose ETag is stored with the page.
+
+Each endpoint has its own TTL and entry limit (settings.JOB_RESPONSE_CACHE).
+The limit is kept with a per-endpoint index of keys in insertion order, and
+the oldest keys are evicted first. Concurrent writers can briefly overshoot
+it; the TTL still bounds every entry.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.utils.http import parse_http_date_safe
+from rest_framework.response import Response
+
+from .cache import applications_version, versioned_key
+
+# Response headers stored with a cached page
+CACHED_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control')
+
+
+def normalized_params(query_params):
+    """Query parameters as a sorted list, without blanks, so equivalent URLs share a key"""
+    params = []
+    for key in sorted(query_params):
+        values = sorted(value.strip() for value in query_params.getlist(key) if value.strip())
+        if values:
+            params.append([key, values])
+    return params
+
+
+def endpoint_config(name):
+    config = settings.JOB_RESPONSE_CACHE.get(name, {})
+    return config.get('TIMEOUT', 0), config.get('MAX_ENTRIES', 0)
+
+
+def _index_key(name):
+    return f'jobs:response:{name}:index'
+
+
+def store(name, key, entry, timeout, max_entries):
+    cache.set(key, entry, timeout)
+    index_key = _index_key(name)
+    keys = [k for k in cache.get(index_key, []) if k != key]
+    keys.append(key)
+    if max_entries and len(keys) > max_entries:
+        cache.delete_many(keys[:-max_entries])
+        keys = keys[-max_entries:]
+    cache.set(index_key, keys, None)
+
+
+class ResponseCacheMixin:
+    """Serve GETs from unauthenticated clients out of the versioned response cache"""
+    response_cache_name = None
+
+    def response_cache_key(self, request):
+        params = {
+            'host': request.get_host(),
+            'path': request.path,
+            'format': request.accepted_renderer.format,
+            'query': normalized_params(request.query_params),
+            'applications': applications_version(),
+        }
+        return versioned_key(f'response:{self.response_cache_name}', params)
+
+    def get(self, request, *args, **kwargs):
+        timeout, max_entries = endpoint_config(self.response_cache_name)
+        if not timeout or request.user.is_authenticated:
+            return super().get(request, *args, **kwargs)
+
+        key = self.response_cache_key(request)
+        entry = cache.get(key)
+        if entry is not None:
+            headers = entry['headers']
+            last_modified = parse_http_date_safe(headers.get('Last-Modified', ''))
+            not_modified = get_conditional_response(request, etag=headers.get('ETag'), last_modified=last_modified)
+            if not_modified is not None:
+                return not_modified
+            return Response(entry['data'], status=entry['status'], headers=entry['headers'])
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200:
+            headers = {header: response[header] for header in CACHED_HEADERS if header in response}
+            store(self.response_cache_name, key, {
+                'data': response.data,
+                'status': response.status_code,
+                'headers': headers,
+            }, timeout, max_entries)
+        return response
@@ -0,0 +1,111 @@
+# jobs/search.py
+"""
+Full-text job search.
+
+    postgresql  `search_vector` tsvector column generated from the searchable
+                fields, GIN indexed, ranked with ts_rank
+    sqlite      `jobs_job_fts` FTS5 table over jobs_job, kept in sync by
+                triggers, ranked with bm25
+    otherwise   OR of icontains predicates, unranked
+
+Both indexes are created by migration 0003_job_search_index and maintained
+by the database itself, so every Job insert, update or delete (including
+queryset.update() and bulk_create) is reflected immediately. Query words are
+matched as prefixes so search-as-you-type keeps working.
+"""
+import re
+
+from django.db import connections
+from django.db.models import BooleanField, FloatField, Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_FIELDS = ('title', 'description', 'company', 'skills', 'responsibilities')
+
+# Ignore anything past this many words; long queries only get slower
+MAX_TERMS = 8
+
+FTS_TABLE = 'jobs_job_fts'
+
+_fts_available = {}
+
+
+def search_terms(query):
+    """Lower-cased words of the query; punctuation never reaches the index syntax"""
+    return re.findall(r'\w+', (query or '').lower())[:MAX_TERMS]
+
+
+class IContainsBackend:
+    """Substring match over every searchable field; needs no index"""
+    ranked = False
+
+    def search(self, queryset, query):
+        predicate = Q()
+        for field in SEARCH_FIELDS:
+            predicate |= Q(**{f'{field}__icontains': query})
+        return queryset.filter(predicate)
+
+
+class PostgresBackend:
+    ranked = True
+
+    def search(self, queryset, query):
+        terms = search_terms(query)
+        if not terms:
+            return queryset
+        tsquery = ' & '.join(f'{term}:*' for term in terms)
+        table = queryset.model._meta.db_table
+        return queryset.alias(
+            search_match=RawSQL(
+                f"{table}.search_vector @@ to_tsquery('english', %s)", (tsquery,), output_field=BooleanField()
+            ),
+        ).filter(search_match=True).annotate(
+            search_rank=RawSQL(
+                f"ts_rank({table}.search_vector, to_tsquery('english', %s))", (tsquery,), output_field=FloatField()
+            ),
+        ).order_by('-search_rank', '-created_at')
+
+
+class SQLiteFTSBackend:
+    ranked = True
+
+    def search(self, queryset, query):
+        terms = search_terms(query)
+        if not terms:
+            return queryset
+        match = ' '.join(f'"{term}"*' for term in terms)
+        table = queryset.model._meta.db_table
+        return queryset.filter(
+            id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,))
+        ).annotate(
+            # bm25() is lower for better matches
+            search_rank=RawSQL(
+                f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+                f'WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = {table}.id',
+                (match,),
+                output_field=FloatField(),
+            ),
+        ).order_by('-search_rank', '-created_at')
+
+
+def _has_fts_table(connection):
+    key = (connection.alias, connection.settings_dict['NAME'])
+    if key not in _fts_available:
+        with connection.cursor() as cursor:
+            _fts_available[key] = FTS_TABLE in connection.introspection.table_names(cursor)
+    return _fts_available[key]
+
+
+def get_backend(using='default'):
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        return PostgresBackend()
+    if connection.vendor == 'sqlite' and _has_fts_table(connection):
+        return SQLiteFTSBackend()
+    return IContainsBackend()
+
+
+def search_jobs(queryset, query):
+    """Filter a Job queryset to matches for `query`, best matches first when the backend ranks"""
+    if not query:
+        return queryset
+    return get_backend(queryset.db).search(queryset, query)
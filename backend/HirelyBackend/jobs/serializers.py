@@ -2,7 +2,35 @@ from rest_framework import serializers
 from .models import Job
 
 # jobs/serializers.py
-class JobSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Serializer that can be limited to a subset of its fields (fields=[...]).
+
+    `column_sources` maps computed fields to the model columns they read, so
+    views can load only those columns (see jobs/fieldsets.py).
+    """
+    column_sources = {}
+    
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+    
+    @classmethod
+    def columns_for(cls, fields):
+        """Model columns needed to serialize `fields`"""
+        model_fields = {field.name for field in cls.Meta.model._meta.concrete_fields}
+        columns = set()
+        for name in fields:
+            if name in cls.column_sources:
+                columns.update(cls.column_sources[name])
+            elif name in model_fields:
+                columns.add(name)
+        return columns
+
+
+class JobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     employer_name = serializers.CharField(source='employer.username', read_only=True)
     date = serializers.SerializerMethodField()
     applicants_count = serializers.SerializerMethodField()
@@ -21,11 +49,33 @@ class JobSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'employer', 'created_at', 'updated_at']
     
+    column_sources = {
+        'employer_name': ['employer__username'],
+        'date': ['created_at'],
+        'is_expired': ['application_deadline'],
+        'applicants_count': [],  # annotated by Job.objects.with_applicants_count()
+    }
+    
     def get_date(self, obj):
         return obj.created_at.strftime("%d %b. %Y")
     
     def get_applicants_count(self, obj):
-        return obj.applications.count()
+        # Listing querysets annotate the count (Job.objects.with_applicants_count())
+        count = getattr(obj, 'applicants_count', None)
+        if count is None:
+            count = obj.applications.count()
+        return count
+
+class JobListSerializer(JobSerializer):
+    """Read-only card representation for listings: no long text fields"""
+    
+    class Meta(JobSerializer.Meta):
+        fields = [
+            'id', 'title', 'company', 'location', 'category', 'level', 'job_type',
+            'salary', 'salary_display', 'is_remote', 'is_featured',
+            'created_at', 'employer_name', 'date', 'applicants_count'
+        ]
+        read_only_fields = fields
 
 class JobCreateSerializer(serializers.ModelSerializer):
     class Meta:
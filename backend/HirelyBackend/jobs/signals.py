@@ -0,0 +1,20 @@
+# jobs/signals.py
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from .cache import bump_jobs_version
+from .models import Job, LocationAlias
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+@receiver(post_save, sender=LocationAlias)
+@receiver(post_delete, sender=LocationAlias)
+def invalidate_job_cache(sender, **kwargs):
+    bump_jobs_version()
+
+
+@receiver(pre_delete, sender=Job)
+def mark_related_lists_stale(sender, instance, **kwargs):
+    """Jobs listing the deleted job lose that entry; have the next refresh recompute them"""
+    Job.objects.filter(related_jobs__related=instance).update(related_refreshed_at=None)
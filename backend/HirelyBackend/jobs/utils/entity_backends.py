@@ -0,0 +1,194 @@
+"""
+Pluggable entity-extraction backends for parse_resume.
+
+    regex         local regex/taxonomy extraction only, no network (default)
+    remote        also calls the Hugging Face inference API synchronously,
+                  within a per-request time budget
+    remote-async  fires the Hugging Face call on a background thread and
+                  returns the local extraction immediately
+
+Both remote modes share one pooled HTTP session and one circuit breaker, so
+after repeated failures the API is skipped entirely until the breaker's
+reset timeout has passed. Select the backend with RESUME_ENTITY_BACKEND.
+"""
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .resume_parser import extract_entities_fallback
+
+# Hugging Face API configuration
+HUGGINGFACE_API_URL = "https://api-inference.huggingface.co/models/distilbert-base-uncased"
+HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY")
+
+DEFAULT_BACKEND = os.getenv("RESUME_ENTITY_BACKEND", "regex")
+REMOTE_TIMEOUT = float(os.getenv("RESUME_REMOTE_TIMEOUT", "2"))
+REMOTE_FAILURE_THRESHOLD = int(os.getenv("RESUME_REMOTE_FAILURE_THRESHOLD", "3"))
+REMOTE_RESET_SECONDS = float(os.getenv("RESUME_REMOTE_RESET_SECONDS", "60"))
+REMOTE_MAX_IN_FLIGHT = int(os.getenv("RESUME_REMOTE_MAX_IN_FLIGHT", "4"))
+
+BACKENDS = {}
+_instances = {}
+
+
+def register_backend(name):
+    """Class decorator adding a backend to the registry under `name`"""
+    def decorator(cls):
+        BACKENDS[name] = cls
+        return cls
+    return decorator
+
+
+def get_backend(name: Optional[str] = None):
+    """Return the (shared) backend instance for `name`, defaulting to RESUME_ENTITY_BACKEND"""
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown entity extraction backend '{name}'. Choose from: {', '.join(BACKENDS)}")
+    if name not in _instances:
+        _instances[name] = BACKENDS[name]()
+    return _instances[name]
+
+
+class CircuitBreaker:
+    """
+    Fail fast after `failure_threshold` consecutive failures.
+
+    While open every call is refused; once `reset_timeout` seconds have
+    passed a single trial call is let through (half-open), and its outcome
+    closes or re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold=REMOTE_FAILURE_THRESHOLD, reset_timeout=REMOTE_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def _elapsed(self):
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def would_allow(self):
+        """Whether allow() would currently let a call through, without taking the half-open trial"""
+        with self._lock:
+            return self.opened_at is None or self._elapsed()
+
+    def allow(self):
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._elapsed():
+                # Half-open: let this call through and push the window forward
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+def _make_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=REMOTE_MAX_IN_FLIGHT, max_retries=0)
+    session.mount("https://", adapter)
+    session.headers["Authorization"] = f"Bearer {HUGGINGFACE_API_KEY}"
+    return session
+
+
+_session = None
+_breaker = CircuitBreaker()
+
+
+def _shared_session():
+    global _session
+    if _session is None:
+        _session = _make_session()
+    return _session
+
+
+@register_backend("regex")
+class RegexBackend:
+    """Local extraction only; scoring latency is bounded by CPU"""
+    method = "fallback_regex"
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        return {
+            "entities": extract_entities_fallback(text),
+            "method": self.method,
+            "status": "success"
+        }
+
+
+@register_backend("remote")
+class RemoteBackend(RegexBackend):
+    """Regex extraction plus a time-budgeted Hugging Face call behind the circuit breaker"""
+
+    def __init__(self, session=None, breaker=None, timeout=REMOTE_TIMEOUT):
+        self.session = session
+        self.breaker = breaker or _breaker
+        self.timeout = timeout
+
+    def call_api(self, text: str) -> bool:
+        """Return True when the API answered successfully within the budget"""
+        if not HUGGINGFACE_API_KEY or not self.breaker.allow():
+            return False
+        session = self.session or _shared_session()
+        try:
+            response = session.post(HUGGINGFACE_API_URL, json={"inputs": text}, timeout=self.timeout)
+        except requests.RequestException as api_error:
+            print(f"API Error: {api_error}")
+            self.breaker.record_failure()
+            return False
+        if response.status_code != 200:
+            self.breaker.record_failure()
+            return False
+        self.breaker.record_success()
+        return True
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        result = super().extract(text)
+        if self.call_api(text):
+            # The API is only used as a connectivity check for now
+            result["method"] = "fallback_with_api_connection"
+        return result
+
+
+@register_backend("remote-async")
+class RemoteAsyncBackend(RemoteBackend):
+    """Returns local extraction immediately; the Hugging Face call happens in the background"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.executor = ThreadPoolExecutor(max_workers=REMOTE_MAX_IN_FLIGHT, thread_name_prefix="resume-api")
+        self.in_flight = threading.BoundedSemaphore(REMOTE_MAX_IN_FLIGHT)
+
+    def _call_and_release(self, text):
+        try:
+            self.call_api(text)
+        finally:
+            self.in_flight.release()
+
+    def extract(self, text: str) -> Dict[str, Any]:
+        result = RegexBackend.extract(self, text)
+        # Drop the call rather than queueing work when the API is slow
+        # call_api() still takes the half-open trial, so only one of these gets through
+        if HUGGINGFACE_API_KEY and self.breaker.would_allow() and self.in_flight.acquire(blocking=False):
+            self.executor.submit(self._call_and_release, text)
+        return result
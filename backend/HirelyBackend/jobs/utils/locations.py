@@ -0,0 +1,28 @@
+"""
+Location text normalization.
+
+Free-text locations are reduced to a lookup key (lower case, punctuation
+dropped, whitespace collapsed), so "New York, NY" and "new york  ny" share a
+key. Canonical names and their aliases are seeded from locations.json.
+"""
+import json
+import os
+import re
+from typing import Dict, List
+
+LOCATIONS_PATH = os.getenv(
+    "JOB_LOCATIONS_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "locations.json"),
+)
+
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def normalize_location(text: str) -> str:
+    return _NON_WORD_RE.sub(" ", (text or "").lower()).strip()
+
+
+def load_location_aliases(path: str = LOCATIONS_PATH) -> Dict[str, List[str]]:
+    """Return {canonical name: [aliases]}"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -1,13 +1,92 @@
 import os
-import requests
+import json
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-# Hugging Face API configuration
-HUGGINGFACE_API_URL = "https://api-inference.huggingface.co/models/microsoft/DialoGPT-medium"
-HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY")
+# Entity taxonomy: canonical skill/education names with their synonyms, and
+# organization suffixes. Loaded once at import; point RESUME_TAXONOMY_PATH at
+# another JSON file with the same shape to extend it.
+TAXONOMY_PATH = os.getenv(
+    "RESUME_TAXONOMY_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json")
+)
+
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_RE = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+NAME_RE = re.compile(r'\b[A-Z][a-z]+ [A-Z][a-z]+\b')
+EXPERIENCE_RE = re.compile(r'(\d+)\s*(years?)\s*(of\s*)?(experience|exp)', re.IGNORECASE)
+
+
+def _trie_pattern(terms: List[str]) -> str:
+    """
+    Build a regex alternation factored by common prefixes.
+
+    A flat "a|b|c" alternation retries every keyword at every position; the
+    trie form only follows the branch matching the next character, so the
+    cost per position stays flat as the taxonomy grows.
+    """
+    trie: Dict[str, Any] = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        optional = "" in node
+        if len(branches) == 1 and not optional:
+            return branches[0]
+        return "(?:" + "|".join(branches) + ")" + ("?" if optional else "")
+
+    return build(trie)
+
+
+def _load_taxonomy(path: str):
+    with open(path, encoding="utf-8") as f:
+        taxonomy = json.load(f)
+
+    # lower-cased surface form -> (entity class, canonical name)
+    lookup: Dict[str, Any] = {}
+    order: Dict[str, int] = {}
+    for entity_class in ("skills", "education"):
+        for canonical, synonyms in taxonomy.get(entity_class, {}).items():
+            order[canonical] = len(order)
+            for surface in [canonical, *synonyms]:
+                lookup.setdefault(surface.lower(), (entity_class, canonical))
+
+    org_suffixes = taxonomy.get("organization_suffixes", [])
+    # Keywords match case-insensitively on word boundaries; organization
+    # suffixes match case-sensitively anywhere inside a word
+    pattern = r"(?P<term>(?i:(?<!\w)" + _trie_pattern(list(lookup)) + r"(?!\w)))"
+    if org_suffixes:
+        pattern += r"|(?P<org>" + _trie_pattern(org_suffixes) + ")"
+    return re.compile(pattern), lookup, order
+
+
+ENTITY_RE, ENTITY_LOOKUP, ENTITY_ORDER = _load_taxonomy(TAXONOMY_PATH)
+
+
+def _word_bounds(text: str, pos: int):
+    start = pos
+    while start > 0 and not text[start - 1].isspace():
+        start -= 1
+    end = pos
+    while end < len(text) and not text[end].isspace():
+        end += 1
+    return start, end
+
+
+def _previous_word(text: str, start: int):
+    end = start
+    while end > 0 and text[end - 1].isspace():
+        end -= 1
+    if end == 0:
+        return None
+    return text[_word_bounds(text, end - 1)[0]:end]
 
-headers = {"Authorization": f"Bearer {HUGGINGFACE_API_KEY}"}
 
 def extract_entities_fallback(text: str) -> Dict[str, List[str]]:
     """Fallback entity extraction using regex patterns."""
@@ -22,92 +101,55 @@ def extract_entities_fallback(text: str) -> Dict[str, List[str]]:
     }
     
     # Extract emails
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    entities["email"] = emails
+    entities["email"] = EMAIL_RE.findall(text)
     
     # Extract phone numbers
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phones = re.findall(phone_pattern, text)
+    phones = PHONE_RE.findall(text)
     entities["phone"] = [phone[0] + phone[1] if isinstance(phone, tuple) else phone for phone in phones]
     
     # Extract potential names (first word that's capitalized, not common words)
-    name_pattern = r'\b[A-Z][a-z]+ [A-Z][a-z]+\b'
-    names = re.findall(name_pattern, text)
-    entities["person"] = names[:2]  # Limit to first 2 matches
+    entities["person"] = NAME_RE.findall(text)[:2]  # Limit to first 2 matches
     
-    # Extract skills (common technical skills)
-    skill_keywords = [
-        'Python', 'Java', 'JavaScript', 'React', 'Django', 'Flask', 'Node.js',
-        'SQL', 'PostgreSQL', 'MySQL', 'MongoDB', 'AWS', 'Docker', 'Kubernetes',
-        'Git', 'HTML', 'CSS', 'TypeScript', 'Vue.js', 'Angular', 'Spring Boot',
-        'Machine Learning', 'Data Science', 'AI', 'TensorFlow', 'PyTorch'
-    ]
-    found_skills = []
-    for skill in skill_keywords:
-        if skill.lower() in text.lower():
-            found_skills.append(skill)
-    entities["skills"] = found_skills
+    # Skills, education and organizations in a single pass over the text
+    found = {"skills": set(), "education": set()}
+    organizations = []
+    last_org_word = -1
+    for match in ENTITY_RE.finditer(text):
+        if match.lastgroup == "term":
+            # (?i) also matches Unicode case variants (e.g. "GİT", "awſ") whose
+            # lower() is not a lookup key; those are skipped
+            hit = ENTITY_LOOKUP.get(match.group().lower())
+            if hit:
+                entity_class, canonical = hit
+                found[entity_class].add(canonical)
+            continue
+        
+        # Organization suffix: pair the word containing it with the word before
+        start, end = _word_bounds(text, match.start())
+        if start == last_org_word:
+            continue
+        last_org_word = start
+        previous = _previous_word(text, start)
+        if previous:
+            organizations.append(f"{previous} {text[start:end]}")
     
-    # Extract education keywords
-    education_keywords = ['Bachelor', 'Master', 'PhD', 'Degree', 'University', 'College', 'BS', 'MS', 'MBA']
-    found_education = []
-    for edu in education_keywords:
-        if edu.lower() in text.lower():
-            found_education.append(edu)
-    entities["education"] = found_education
+    entities["skills"] = sorted(found["skills"], key=ENTITY_ORDER.get)
+    entities["education"] = sorted(found["education"], key=ENTITY_ORDER.get)
+    entities["organization"] = organizations
     
     # Extract years of experience
-    experience_pattern = r'(\d+)\s*(years?)\s*(of\s*)?(experience|exp)'
-    experience_matches = re.findall(experience_pattern, text, re.IGNORECASE)
+    experience_matches = EXPERIENCE_RE.findall(text)
     if experience_matches:
         entities["experience"] = [f"{match[0]} {match[1]} of experience" for match in experience_matches]
     
-    # Extract potential organizations
-    org_keywords = ['Inc', 'LLC', 'Corp', 'Company', 'Technologies', 'Systems', 'Solutions']
-    words = text.split()
-    organizations = []
-    for i, word in enumerate(words):
-        if any(keyword in word for keyword in org_keywords):
-            # Get the word before it as potential company name
-            if i > 0:
-                organizations.append(f"{words[i-1]} {word}")
-    entities["organization"] = organizations
-    
     return entities
 
-def parse_resume(text: str) -> Dict[str, Any]:
+def parse_resume(text: str, backend: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse resume text and extract entities.
-    Uses Hugging Face API as primary method, falls back to regex extraction.
+    Uses the configured entity-extraction backend (see entity_backends);
+    the default 'regex' backend never touches the network.
     """
-    # Try Hugging Face API first
-    try:
-        if HUGGINGFACE_API_KEY:
-            # Try with a simple text classification model
-            payload = {"inputs": text}
-            response = requests.post(
-                "https://api-inference.huggingface.co/models/distilbert-base-uncased",
-                headers=headers,
-                json=payload,
-                timeout=10
-            )
-            
-            if response.status_code == 200:
-                # If API works, use fallback extraction for now
-                entities = extract_entities_fallback(text)
-                return {
-                    "entities": entities,
-                    "method": "fallback_with_api_connection",
-                    "status": "success"
-                }
-    except Exception as api_error:
-        print(f"API Error: {api_error}")
+    from .entity_backends import get_backend
     
-    # Use fallback method
-    entities = extract_entities_fallback(text)
-    return {
-        "entities": entities,
-        "method": "fallback_regex",
-        "status": "success"
-    }
+    return get_backend(backend).extract(text)
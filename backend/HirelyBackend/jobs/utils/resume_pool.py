@@ -0,0 +1,206 @@
+"""
+Process-pool execution of resume text extraction.
+
+PDF parsing is CPU bound and a single malformed file can spin inside PyPDF2
+for a long time, so extraction can be fanned out across worker processes.
+Every file gets its own time budget (SIGALRM inside the worker) and memory
+budget (RLIMIT_AS raised by the budget above the worker's current size). A
+file that overruns comes back with a 'timeout' or 'memory_limit' status
+instead of blocking the caller. Page and character caps bound the text
+itself; a capped file comes back with a 'truncated' status.
+
+Workers only run extract_resume_text, so they never touch Django or the
+database.
+"""
+import math
+import multiprocessing
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .resume_scorer import MAX_CHARS, MAX_PAGES, extract_resume_text
+
+_executor = None
+_executor_size = 0
+
+
+class BudgetExceeded(BaseException):
+    """Raised inside a worker when a file overruns its time budget.
+
+    Derives from BaseException so the broad `except Exception` in the
+    extractor cannot swallow it.
+    """
+
+
+def _on_alarm(signum, frame):
+    raise BudgetExceeded()
+
+
+def _current_address_space():
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _extract(path, max_pages, max_chars):
+    text, truncated = extract_resume_text(path, max_pages=max_pages, max_chars=max_chars)
+    return text, 'truncated' if truncated else 'success'
+
+
+def _extract_with_budget(path, timeout, memory_mb, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """Worker entry point: returns (text, status)"""
+    limited = False
+    if resource is not None and memory_mb:
+        original, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = _current_address_space() + memory_mb * 1024 * 1024
+        if hard == resource.RLIM_INFINITY or soft < hard:
+            resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+            limited = True
+
+    timed = timeout and hasattr(signal, 'setitimer')
+    if timed:
+        signal.signal(signal.SIGALRM, _on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return _extract(path, max_pages, max_chars)
+    except BudgetExceeded:
+        return None, 'timeout'
+    except MemoryError:
+        return None, 'memory_limit'
+    finally:
+        if timed:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        if limited:
+            resource.setrlimit(resource.RLIMIT_AS, (original, hard))
+
+
+def _get_executor(pool_size):
+    global _executor, _executor_size
+    if _executor is None or _executor_size != pool_size:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+        # Fork keeps worker start-up cheap; workers never use inherited DB connections
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        _executor = ProcessPoolExecutor(max_workers=pool_size, mp_context=context)
+        _executor_size = pool_size
+    return _executor
+
+
+def _discard_executor():
+    """Tear down the pool, killing workers stuck on an overrunning file"""
+    global _executor
+    if _executor is None:
+        return
+    processes = list((getattr(_executor, '_processes', None) or {}).values())
+    _executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+    _executor = None
+
+
+def _submit(executor, pool_size, path, args):
+    try:
+        return executor, executor.submit(_extract_with_budget, path, *args)
+    except BrokenProcessPool:
+        _discard_executor()
+        executor = _get_executor(pool_size)
+        return executor, executor.submit(_extract_with_budget, path, *args)
+
+
+def _collect(future, path, results, crashed):
+    try:
+        results[path] = future.result()
+    except BrokenProcessPool:
+        crashed.append(path)
+    except Exception as e:
+        results[path] = (None, f"error: {str(e)}")
+
+
+def _run_pool(paths, pool_size, in_flight, args):
+    """
+    Extract paths on the shared pool with at most `in_flight` files submitted.
+
+    Returns (results, crashed, unsubmitted). A dying worker breaks the whole
+    pool and fails every in-flight future, so those paths come back as
+    crashed, the ones never handed to the pool as unsubmitted, and the pool
+    is discarded.
+    """
+    results = {}
+    queue = deque(paths)
+    running = {}
+    timeout = args[0]
+    deadline = None
+    if timeout:
+        deadline = time.monotonic() + timeout * math.ceil(len(queue) / in_flight) + timeout
+    executor = _get_executor(pool_size)
+    while queue or running:
+        while queue and len(running) < in_flight:
+            path = queue.popleft()
+            executor, future = _submit(executor, pool_size, path, args)
+            running[future] = path
+
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        done, _ = wait(running, timeout=remaining, return_when=FIRST_COMPLETED)
+        if not done:
+            # Backstop for workers that cannot be interrupted from inside (e.g. no SIGALRM)
+            for path in [*running.values(), *queue]:
+                results[path] = (None, 'timeout')
+            _discard_executor()
+            return results, [], []
+
+        crashed = []
+        for future in done:
+            _collect(future, running.pop(future), results, crashed)
+        if crashed:
+            # The other in-flight futures fail with the pool shortly after
+            for future in wait(running).done:
+                _collect(future, running[future], results, crashed)
+            _discard_executor()
+            return results, crashed, list(queue)
+    return results, [], []
+
+
+def extract_texts(paths, pool_size=0, timeout=None, memory_mb=None, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """
+    Extract text from many resume files.
+
+    Returns {path: (text, status)} where text is None unless status is
+    'success' or 'truncated'. With pool_size 0 files are read in-process,
+    one by one, without time or memory budgets (the page and character caps
+    still apply).
+
+    A file whose worker dies (e.g. killed by the OOM killer) comes back as
+    'memory_limit'. Files that were in flight alongside it are rerun one at
+    a time to find the culprit, and files not yet started go to a fresh
+    pool, so only the file that crashed its worker is blamed.
+    """
+    paths = list(dict.fromkeys(paths))
+    if pool_size <= 0 or not paths:
+        return {path: _extract(path, max_pages, max_chars) for path in paths}
+
+    args = (timeout, memory_mb, max_pages, max_chars)
+    results = {}
+    pending = paths
+    while pending:
+        batch, crashed, pending = _run_pool(pending, pool_size, pool_size, args)
+        results.update(batch)
+        suspects = crashed if len(crashed) > 1 else []
+        if len(crashed) == 1:
+            results[crashed[0]] = (None, 'memory_limit')
+        while suspects:
+            batch, crashed, suspects = _run_pool(suspects, pool_size, 1, args)
+            results.update(batch)
+            for path in crashed:
+                results[path] = (None, 'memory_limit')
+    return results
@@ -1,65 +1,196 @@
 import re
 import os
+import math
 import requests
+from collections import Counter
 from .resume_parser import parse_resume
-import os
+import numpy as np
+from scipy.sparse import csr_matrix
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 from PyPDF2 import PdfReader
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF or text file"""
+# Default extraction caps; 0 disables a cap
+MAX_PAGES = 20
+MAX_CHARS = 100_000
+
+PDF_MAGIC = b'%PDF-'
+
+
+def _read_text_file(file_path, max_chars):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if not max_chars:
+            return f.read(), False
+        text = f.read(max_chars + 1)
+    return text[:max_chars], len(text) > max_chars
+
+
+def _looks_like_pdf(file_path):
+    # The header must sit within the first 1024 bytes
+    with open(file_path, 'rb') as f:
+        return PDF_MAGIC in f.read(1024)
+
+
+def _read_pdf(file_path, max_pages, max_chars):
+    """Collect page texts in a list, stopping at the page or character cap"""
+    parts = []
+    length = 0
+    truncated = False
+    with open(file_path, 'rb') as f:
+        reader = PdfReader(f)
+        for index, page in enumerate(reader.pages):
+            if max_pages and index >= max_pages:
+                truncated = True
+                break
+            page_text = page.extract_text() or ""
+            if max_chars and length + len(page_text) >= max_chars:
+                parts.append(page_text[:max_chars - length])
+                # Enough text to score; later pages are not parsed at all
+                truncated = length + len(page_text) > max_chars or index + 1 < len(reader.pages)
+                break
+            parts.append(page_text)
+            length += len(page_text)
+    return "".join(parts), truncated
+
+
+def extract_resume_text(file_path, max_pages=MAX_PAGES, max_chars=MAX_CHARS):
+    """
+    Extract text from a PDF or text file within page and character caps.
+    
+    Returns (text, truncated). Files that are neither UTF-8 text nor carry a
+    PDF header (e.g. .doc) are not handed to PdfReader and yield "".
+    """
     try:
         # Check file extension
         _, ext = os.path.splitext(file_path.lower())
         
         if ext == '.txt':
             # Handle text files
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return f.read()
-        elif ext == '.pdf':
+            return _read_text_file(file_path, max_chars)
+        elif ext == '.pdf' and _looks_like_pdf(file_path):
             # Handle PDF files
-            text = ""
-            with open(file_path, 'rb') as f:
-                reader = PdfReader(f)
-                for page in reader.pages:
-                    text += page.extract_text() or ""
-            return text
+            return _read_pdf(file_path, max_pages, max_chars)
         else:
             # Try to read as text file as fallback
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
+                return _read_text_file(file_path, max_chars)
             except UnicodeDecodeError:
-                # If text reading fails, try as binary (PDF)
-                with open(file_path, 'rb') as f:
-                    reader = PdfReader(f)
-                    text = ""
-                    for page in reader.pages:
-                        text += page.extract_text() or ""
-                    return text
+                # If text reading fails, only parse it as a PDF when it really is one
+                if _looks_like_pdf(file_path):
+                    return _read_pdf(file_path, max_pages, max_chars)
+                print(f"Unsupported resume format: {file_path}")
+                return "", False
+    except MemoryError:
+        raise
     except Exception as e:
         print(f"Error extracting text from {file_path}: {str(e)}")
-        return ""
+        return "", False
+
+def extract_text_from_pdf(file_path):
+    """Extract text from PDF or text file"""
+    return extract_resume_text(file_path)[0]
+
+class JobScoringModel:
+    """
+    TF-IDF model fitted once over all applicant resumes for a job.
+
+    Resumes become rows of a single L2-normalised sparse matrix, and the job
+    description is weighted as a query against the fitted IDF, so scoring
+    every applicant is one sparse matrix-vector product. Query terms that no
+    resume contains still count towards the job vector's norm (with the IDF
+    of an unseen term), otherwise short resumes sharing a single common word
+    with the job would look like perfect matches.
+    """
+    
+    def __init__(self, max_features=5000):
+        self.vectorizer = TfidfVectorizer(stop_words='english', max_features=max_features)
+        self.matrix = None
+        self.document_count = 0
+        self.keys = []
+    
+    def fit(self, resume_texts, keys=None):
+        """
+        Fit the vocabulary/IDF on the resumes and keep their vectors.
+        
+        `keys` (e.g. application ids) label the matrix rows for scores_by_key().
+        """
+        self.document_count = len(resume_texts)
+        self.keys = list(keys) if keys is not None else list(range(len(resume_texts)))
+        try:
+            self.matrix = self.vectorizer.fit_transform(resume_texts)
+        except ValueError:
+            # Nothing but stop words/empty documents: every score is zero
+            self.matrix = None
+        # Only kept for introspection and can be huge; drop it so the model pickles small
+        self.vectorizer.stop_words_ = None
+        return self
+    
+    def job_vector(self, job_description):
+        """Return the L2-normalised 1 x vocabulary vector for the job text."""
+        vocabulary = self.vectorizer.vocabulary_
+        idf = self.vectorizer.idf_
+        unseen_idf = math.log(1 + self.document_count) + 1
+        
+        counts = Counter(self.vectorizer.build_analyzer()(job_description))
+        columns, weights = [], []
+        norm = 0.0
+        for term, count in counts.items():
+            column = vocabulary.get(term)
+            weight = count * (idf[column] if column is not None else unseen_idf)
+            norm += weight * weight
+            if column is not None:
+                columns.append(column)
+                weights.append(weight)
+        
+        norm = math.sqrt(norm) or 1.0
+        return csr_matrix(
+            (np.array(weights) / norm, ([0] * len(columns), columns)),
+            shape=(1, len(vocabulary))
+        )
+    
+    def score(self, job_description):
+        """Return 0-5 similarity scores for every fitted resume, in order."""
+        if self.matrix is None or not job_description.strip():
+            return [0.0] * self.document_count
+        return self._score_matrix(self.matrix, job_description)
+    
+    def scores_by_key(self, job_description):
+        """Return {key: score} for every fitted resume."""
+        return dict(zip(self.keys, self.score(job_description)))
+    
+    def score_texts(self, resume_texts, job_description):
+        """Score resumes against the fitted IDF without refitting the model."""
+        if self.matrix is None or not job_description.strip():
+            return [0.0] * len(resume_texts)
+        return self._score_matrix(self.vectorizer.transform(resume_texts), job_description)
+    
+    def _score_matrix(self, matrix, job_description):
+        similarities = (matrix @ self.job_vector(job_description).T).toarray().ravel()
+        return [round(float(similarity) * 5.0, 2) for similarity in similarities]
+
+def score_resumes_against_job(resume_texts, job_description):
+    """Score many resumes against one job description in a single batch."""
+    if not resume_texts:
+        return []
+    if not job_description.strip():
+        return [0.0] * len(resume_texts)
+    
+    try:
+        return JobScoringModel().fit(resume_texts).score(job_description)
+    except Exception as e:
+        print(f"Error scoring resumes: {str(e)}")
+        return [0.0] * len(resume_texts)
 
 def score_resume_against_job(resume_text, job_description):
     """Compute similarity between resume text and job description."""
     if not resume_text.strip() or not job_description.strip():
         return 0.0
     
-    try:
-        vectorizer = TfidfVectorizer(stop_words='english', max_features=1000)
-        tfidf_matrix = vectorizer.fit_transform([resume_text, job_description])
-        score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        # Return score on 0-5 scale with better distribution
-        return round(score * 5.0, 2)
-    except Exception as e:
-        print(f"Error scoring resume: {str(e)}")
-        return 0.0
+    return score_resumes_against_job([resume_text], job_description)[0]
 
-def calculate_enhanced_score(resume_text, parsed_data, job_description):
+def calculate_enhanced_score(resume_text, parsed_data, job_description, base_score=None):
     """Calculate enhanced score with multiple factors."""
-    base_score = score_resume_against_job(resume_text, job_description)
+    if base_score is None:
+        base_score = score_resume_against_job(resume_text, job_description)
     
     # Bonus points for having key sections
     bonus = 0.0
@@ -81,6 +212,43 @@ def calculate_enhanced_score(resume_text, parsed_data, job_description):
     final_score = min(5.0, base_score + bonus)
     return round(final_score, 2)
 
+def analyze_resume_texts(resume_texts, job_description, model=None):
+    """
+    Parse and score already-extracted resume texts against one job.
+    
+    Takes a {key: text} mapping and returns {key: analysis}; all non-empty
+    resumes are scored together by one fitted JobScoringModel. Pass a model
+    fitted on a wider corpus (e.g. every applicant of the job) to score a
+    subset against that corpus' IDF.
+    """
+    analyses = {}
+    keys, texts = [], []
+    for key, text in resume_texts.items():
+        if not text or not text.strip():
+            analyses[key] = {
+                "parsed": {"entities": {}, "method": "error", "status": "empty_file"},
+                "score": 0.0
+            }
+            continue
+        keys.append(key)
+        texts.append(text)
+    
+    if model is not None:
+        base_scores = model.score_texts(texts, job_description) if texts else []
+    else:
+        base_scores = score_resumes_against_job(texts, job_description)
+    for key, text, base_score in zip(keys, texts, base_scores):
+        parsed_data = parse_resume(text)
+        analyses[key] = {
+            "parsed": parsed_data,
+            "score": calculate_enhanced_score(text, parsed_data, job_description, base_score=base_score)
+        }
+    return analyses
+
+def analyze_resume_text(resume_text, job_description):
+    """Parse entities from already-extracted resume text and score it."""
+    return analyze_resume_texts({None: resume_text}, job_description)[None]
+
 def analyze_resume(file_path, job_description):
     """Full pipeline: extract text → parse entities → score."""
     try:
@@ -90,20 +258,11 @@ def analyze_resume(file_path, job_description):
                 "score": 0.0
             }
         
-        resume_text = extract_text_from_pdf(file_path)
-        if not resume_text.strip():
-            return {
-                "parsed": {"entities": {}, "method": "error", "status": "empty_file"},
-                "score": 0.0
-            }
-        
-        parsed_data = parse_resume(resume_text)
-        score = calculate_enhanced_score(resume_text, parsed_data, job_description)
-        
-        return {
-            "parsed": parsed_data,
-            "score": score
-        }
+        resume_text, truncated = extract_resume_text(file_path)
+        analysis = analyze_resume_text(resume_text, job_description)
+        if truncated:
+            analysis["parsed"]["truncated"] = True
+        return analysis
     except Exception as e:
         print(f"Error analyzing resume {file_path}: {str(e)}")
         return {
@@ -1,7 +1,15 @@
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from django.db.models import Q
 from .models import Job
+from .cache import get_or_compute
+from .conditional import ConditionalGetMixin
+from .facets import active_job_filters, facet_counts
+from .fieldsets import SparseFieldsetMixin
+from .location_search import filter_by_location
+from .pagination import CursorPaginationOptInMixin
+from .recommender import related_jobs_for
+from .response_cache import ResponseCacheMixin
+from .search import search_jobs
 from .serializers import JobSerializer, JobCreateSerializer
 
 
@@ -25,7 +33,7 @@ class IsEmployer(permissions.BasePermission):
         # Only allow employer who owns the job to modify it
         return obj.employer == request.user
 
-class JobListCreateView(generics.ListCreateAPIView):
+class JobListCreateView(CursorPaginationOptInMixin, generics.ListCreateAPIView):
     # Allow anyone to list jobs, but require employer auth to create
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsEmployer]
     
@@ -49,7 +57,7 @@ class JobListCreateView(generics.ListCreateAPIView):
             if category:
                 queryset = queryset.filter(category=category)
             if location:
-                queryset = queryset.filter(location__icontains=location)
+                queryset = filter_by_location(queryset, location)
             if job_type:
                 queryset = queryset.filter(job_type=job_type)
             if level:
@@ -57,7 +65,7 @@ class JobListCreateView(generics.ListCreateAPIView):
             if is_remote:
                 queryset = queryset.filter(is_remote=True)
                 
-            return queryset.select_related('employer')
+            return queryset.select_related('employer').with_applicants_count()
         
         # For POST requests (creating jobs), only show employer's own jobs
         return Job.objects.filter(employer=self.request.user)
@@ -72,18 +80,11 @@ class JobListCreateView(generics.ListCreateAPIView):
         
         # Add available filters metadata
         if request.method == 'GET':
-            # Get unique categories, locations, etc. for filter options
-            jobs = Job.objects.filter(is_active=True)
-            response.data['filters'] = {
-                'categories': list(jobs.values_list('category', flat=True).distinct()),
-                'locations': list(jobs.values_list('location', flat=True).distinct().order_by('location')),
-                'job_types': list(jobs.values_list('job_type', flat=True).distinct()),
-                'levels': list(jobs.values_list('level', flat=True).distinct()),
-            }
+            response.data['filters'] = get_or_compute('filters', active_job_filters)
         
         return response
 
-class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
+class JobDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     # Allow anyone to view job details, but require employer auth to modify
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsEmployer]
     serializer_class = JobSerializer
@@ -91,7 +92,7 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
     def get_queryset(self):
         # For GET requests, show job to everyone if active
         if self.request.method == 'GET':
-            return Job.objects.filter(is_active=True)
+            return Job.objects.filter(is_active=True).select_related('employer').with_applicants_count()
         # For write requests, only allow access to employer's own jobs
         return Job.objects.filter(employer=self.request.user)
     
@@ -100,13 +101,8 @@ class JobDetailView(generics.RetrieveUpdateDestroyAPIView):
         instance = self.get_object()
         serializer = self.get_serializer(instance)
         
-        # Add related jobs in the same category
-        related_jobs = Job.objects.filter(
-            is_active=True,
-            category=instance.category
-        ).exclude(id=instance.id)[:3]  # Get 3 related jobs
-        
-        related_serializer = JobSerializer(related_jobs, many=True)
+        # Add precomputed related jobs (jobs/recommender.py)
+        related_serializer = JobSerializer(related_jobs_for(instance), many=True)
         
         response_data = serializer.data
         response_data['related_jobs'] = related_serializer.data
@@ -124,14 +120,18 @@ class ToggleJobStatusView(generics.UpdateAPIView):
     def update(self, request, *args, **kwargs):
         job = self.get_object()
         job.is_active = not job.is_active
-        job.save()
+        # post_save bumps the jobs cache version, so cached facets drop the job at once
+        job.save(update_fields=['is_active', 'updated_at'])
         
         serializer = self.get_serializer(job)
         return Response(serializer.data)
 
-class PublicJobListView(generics.ListAPIView):
+class PublicJobListView(ResponseCacheMixin, ConditionalGetMixin, CursorPaginationOptInMixin, SparseFieldsetMixin, generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = JobSerializer
+    response_cache_name = 'public'
+    # Query parameters that change the filtered jobs, and so the facet counts
+    facet_params = ('category', 'location', 'search', 'type', 'level', 'remote')
     
     def get_queryset(self):
         queryset = Job.objects.filter(is_active=True)
@@ -144,57 +144,35 @@ class PublicJobListView(generics.ListAPIView):
         level = self.request.query_params.get('level')
         is_remote = self.request.query_params.get('remote')
         
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(description__icontains=search) |
-                Q(company__icontains=search) |
-                Q(skills__icontains=search)
-            )
         if category:
             queryset = queryset.filter(category=category)
         if location:
-            queryset = queryset.filter(location__icontains=location)
+            queryset = filter_by_location(queryset, location)
         if job_type:
             queryset = queryset.filter(job_type=job_type)
         if level:
             queryset = queryset.filter(level=level)
         if is_remote:
             queryset = queryset.filter(is_remote=True)
+        if search:
+            queryset = search_jobs(queryset, search)
             
-        return queryset.select_related('employer')
+        return queryset.select_related('employer').with_applicants_count()
     
     def list(self, request, *args, **kwargs):
-        """Add filter options to response"""
+        """Add filter options, counted over the filtered jobs, to the response"""
         response = super().list(request, *args, **kwargs)
-        
-        # Add available filter options
-        jobs = Job.objects.filter(is_active=True)
-        response.data['filter_options'] = {
-            'categories': [
-                {'value': cat[0], 'label': cat[1], 'count': jobs.filter(category=cat[0]).count()}
-                for cat in Job.JOB_CATEGORIES
-            ],
-            'locations': [
-                {'value': loc, 'count': jobs.filter(location=loc).count()}
-                for loc in jobs.values_list('location', flat=True).distinct().order_by('location')
-            ],
-            'job_types': [
-                {'value': jt[0], 'label': jt[1], 'count': jobs.filter(job_type=jt[0]).count()}
-                for jt in Job.JOB_TYPES
-            ],
-            'levels': [
-                {'value': lvl[0], 'label': lvl[1], 'count': jobs.filter(level=lvl[0]).count()}
-                for lvl in Job.JOB_LEVELS
-            ],
-        }
-        
+        params = {name: request.query_params.get(name) for name in self.facet_params}
+        response.data['filter_options'] = get_or_compute(
+            'facets', lambda: facet_counts(self.filter_queryset(self.get_queryset())), params
+        )
         return response
 
 # NEW: Job Search View for more specific search functionality
-class JobSearchView(generics.ListAPIView):
+class JobSearchView(ResponseCacheMixin, ConditionalGetMixin, CursorPaginationOptInMixin, SparseFieldsetMixin, generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
     serializer_class = JobSerializer
+    response_cache_name = 'search'
     
     def get_queryset(self):
         queryset = Job.objects.filter(is_active=True)
@@ -202,19 +180,13 @@ class JobSearchView(generics.ListAPIView):
         search_query = self.request.query_params.get('q')
         location_query = self.request.query_params.get('location')
         
-        if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) |
-                Q(description__icontains=search_query) |
-                Q(company__icontains=search_query) |
-                Q(skills__icontains=search_query) |
-                Q(responsibilities__icontains=search_query)
-            )
-        
         if location_query:
-            queryset = queryset.filter(location__icontains=location_query)
+            queryset = filter_by_location(queryset, location_query)
+        
+        if search_query:
+            queryset = search_jobs(queryset, search_query)
             
-        return queryset.select_related('employer')
+        return queryset.select_related('employer').with_applicants_count()
     
 @api_view(["POST"])
 def parse_resume_view(request):